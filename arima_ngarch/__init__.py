@@ -0,0 +1,66 @@
+"""
+Paket mesin ARIMA-NGARCH (tanpa Streamlit) untuk prediksi nilai tukar dan volatilitasnya.
+
+Submodul dimuat saat namanya pertama kali diakses (PEP 562), sehingga
+`from arima_ngarch import load_currency_data` tidak ikut memuat statsmodels, arch
+atau numba. Halaman aplikasi dan worker process pool hanya membayar pustaka
+yang benar-benar dipakai.
+"""
+import importlib
+
+_EXPORTS = {
+    'data': [
+        'read_currency_csv',
+        'iter_currency_csv',
+        'load_currency_data',
+        'parse_european_numbers',
+        'parse_dates',
+        'file_digest',
+        'DataCache',
+        'DATA_CACHE',
+    ],
+    'pipeline': [
+        'ArimaNgarchPipeline',
+        'compute_log_returns',
+        'split_train_test',
+        'fit_arima',
+        'fit_garch',
+        'fit_ngarch',
+        'forecast_volatility',
+        'convergence_info',
+        'START_SOURCES',
+    ],
+    'batch': ['fit_currency', 'fit_currencies', 'fit_currencies_volatility'],
+    'batched': ['stack_series', 'batched_t_loglik', 'fit_batched'],
+    'selection': ['select_arima_order', 'select_ngarch_order'],
+    'cache': ['FitCache', 'cache_key', 'fingerprint'],
+    'store': ['SeriesStore', 'save_dataset', 'open_dataset', 'list_datasets', 'dataset_name'],
+    'artifacts': ['ArimaArtifact', 'save_arima_artifact', 'load_arima_artifact'],
+    'ngarch': ['NGARCH', 'ngarch_model', 'fit_engle_ng', 'ngarch_t_loglik'],
+    'online': ['NgarchFilter', 'OnlineArimaNgarch'],
+    'diagnostics': ['stationarity_tests', 'stationarity_table', 'residual_diagnostics'],
+    'backtest': ['walk_forward_backtest', 'backtest_metrics'],
+    'downsample': ['downsample', 'lttb_indices', 'minmax_indices'],
+    'simulation': ['simulate_paths', 'summarize_paths', 'forecast_distribution', 'forecast_distributions'],
+    'profiling': ['Profiler', 'log_records'],
+    'jobs': ['JobManager', 'Job', 'JobProgress', 'JobCancelled'],
+    'service': ['ModelPool', 'ServedModel', 'fit_served_model', 'create_app'],
+    'report': ['ModelReport', 'model_report', 'reports_frame', 'save_reports', 'load_reports'],
+    'bootstrap': ['bootstrap_price_paths', 'bootstrap_price_intervals', 'price_intervals'],
+}
+_MODULE_OF = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_MODULE_OF)
+
+
+def __getattr__(name):
+    module = _MODULE_OF.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,166 @@
+"""
+Artefak model ARIMA yang ringkas (JSON, tanpa pickle).
+
+Artefak hanya menyimpan yang dibutuhkan untuk forecast: ordo, parameter,
+sigma2, state Kalman terakhir (mean dan kovarians) serta sidik jari data
+pelatihan. Dengan begitu ukuran file hanya beberapa KB (bukan MB seperti
+pickle ARIMAResults) dan memuatnya tidak mengeksekusi kode apa pun.
+
+Model yang didukung adalah ARIMA(p, 0, q) dengan/tanpa konstanta, seperti
+yang dipakai halaman ARIMA Model (d=0 karena data berupa log-return).
+"""
+import json
+
+import numpy as np
+import pandas as pd
+
+from .cache import fingerprint
+
+FORMAT = 'arima-ngarch/arima'
+FORMAT_VERSION = 1
+
+
+def _arma_blocks(param_names, params):
+    params = dict(zip(param_names, params))
+    ar = [params[name] for name in param_names if name.startswith('ar.L')]
+    ma = [params[name] for name in param_names if name.startswith('ma.L')]
+    return params.get('const', 0.0), np.asarray(ar, dtype=float), np.asarray(ma, dtype=float), params['sigma2']
+
+
+def _transition(ar, k_states):
+    # Representasi state-space Harvey: kolom pertama berisi koefisien AR
+    transition = np.eye(k_states, k=1)
+    transition[:len(ar), 0] = ar
+    return transition
+
+
+class ArimaArtifact:
+    """
+    Model ARIMA(p, 0, q) yang siap forecast, direkonstruksi dari parameter dan state Kalman.
+    """
+
+    def __init__(self, order, param_names, params, state, state_cov, nobs,
+                 last_index=None, data_fingerprint=None):
+        self.order = tuple(int(v) for v in order)
+        self.param_names = list(param_names)
+        self.params = np.asarray(params, dtype=float)
+        self.state = np.asarray(state, dtype=float)
+        self.state_cov = np.asarray(state_cov, dtype=float)
+        self.nobs = int(nobs)
+        self.last_index = last_index
+        self.data_fingerprint = data_fingerprint
+
+        if self.order[1] != 0:
+            raise ValueError("Artefak ringkas hanya mendukung ARIMA dengan d=0 (data log-return).")
+
+        self.const, self.ar, self.ma, self.sigma2 = _arma_blocks(self.param_names, self.params)
+        self.k_states = self.state.shape[0]
+        self.transition = _transition(self.ar, self.k_states)
+        self.selection = np.zeros(self.k_states)
+        self.selection[0] = 1.0
+        self.selection[1:1 + len(self.ma)] = self.ma
+
+    @classmethod
+    def from_results(cls, results):
+        """Membuat artefak dari hasil `fit_arima` (ARIMAResults)."""
+        model = results.model
+        endog = model.data.orig_endog
+        last_index = None
+        if isinstance(endog, pd.Series) and len(endog.index):
+            last_index = str(endog.index[-1])
+        return cls(
+            order=model.order,
+            param_names=results.param_names,
+            params=np.asarray(results.params),
+            state=results.predicted_state[:, -1],
+            state_cov=results.predicted_state_cov[:, :, -1],
+            nobs=results.nobs,
+            last_index=last_index,
+            data_fingerprint=fingerprint(endog),
+        )
+
+    def update(self, value, index=None):
+        """
+        Memperbarui state Kalman dengan satu return baru memakai parameter yang ada
+        (tanpa melatih ulang). Mengembalikan (residual, prediksi_mean_langkah_berikutnya).
+        """
+        transition, selection = self.transition, self.selection
+        state, state_cov = self.state, self.state_cov
+        resid = float(value) - self.const - state[0]
+        variance = state_cov[0, 0]
+        gain = transition @ state_cov[:, 0] / variance
+
+        self.state = transition @ state + gain * resid
+        self.state_cov = (transition @ state_cov @ transition.T
+                          + self.sigma2 * np.outer(selection, selection)
+                          - variance * np.outer(gain, gain))
+        self.nobs += 1
+        if index is not None:
+            self.last_index = str(index)
+        return resid, self.const + self.state[0]
+
+    def update_many(self, values):
+        """Memperbarui state dengan beberapa return; mengembalikan (residual, prediksi_berikutnya) sebagai array."""
+        out = np.array([self.update(v) for v in values], dtype=float).reshape(-1, 2)
+        return out[:, 0], out[:, 1]
+
+    def forecast(self, steps=1):
+        """Prediksi mean return `steps` langkah ke depan dari state terakhir."""
+        state = self.state.copy()
+        out = np.empty(steps)
+        for h in range(steps):
+            out[h] = self.const + state[0]
+            state = self.transition @ state
+        return out
+
+    def to_dict(self):
+        return {
+            'format': FORMAT,
+            'version': FORMAT_VERSION,
+            'order': list(self.order),
+            'param_names': self.param_names,
+            'params': self.params.tolist(),
+            'state': self.state.tolist(),
+            'state_cov': self.state_cov.tolist(),
+            'nobs': self.nobs,
+            'last_index': self.last_index,
+            'data_fingerprint': self.data_fingerprint,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get('format') != FORMAT:
+            raise ValueError(f"Bukan artefak ARIMA yang dikenali: {data.get('format')!r}")
+        if data.get('version', 0) > FORMAT_VERSION:
+            raise ValueError(f"Versi artefak {data['version']} belum didukung.")
+        return cls(
+            order=data['order'],
+            param_names=data['param_names'],
+            params=data['params'],
+            state=data['state'],
+            state_cov=data['state_cov'],
+            nobs=data['nobs'],
+            last_index=data.get('last_index'),
+            data_fingerprint=data.get('data_fingerprint'),
+        )
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=1)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+def save_arima_artifact(results, path):
+    """Menyimpan hasil `fit_arima` sebagai artefak JSON ringkas."""
+    artifact = ArimaArtifact.from_results(results)
+    artifact.save(path)
+    return artifact
+
+
+def load_arima_artifact(path):
+    """Memuat artefak ARIMA tanpa unpickle."""
+    return ArimaArtifact.load(path)
@@ -0,0 +1,116 @@
+"""
+Mode batch: melatih ARIMA + GARCH + NGARCH untuk setiap kolom mata uang
+secara paralel di process pool dan merangkum hasilnya per mata uang.
+`fit_currencies_volatility` melatih model volatilitas semua mata uang sekaligus
+dalam satu optimasi gabungan (lihat `batched.py`).
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from .pipeline import ArimaNgarchPipeline, compute_log_returns
+from .profiling import Profiler, log_records
+from .report import ModelReport, save_reports
+
+
+def fit_currency(name, prices, arima_order=(1, 0, 1), garch_order=(1, 1), ngarch_order=(1, 1, 1),
+                 dist='t', test_size=30):
+    """
+    Melatih seluruh pipeline untuk satu mata uang dan mengembalikan ringkasan
+    (bukan objek hasil fit) agar ringan dikirim antar proses: statistik `ModelReport`
+    setiap model (`arima_aic`, `garch_loglik`, `ngarch_converged`, ...) dan kolom
+    `time_<tahap>_<label>` berisi waktu dinding setiap tahap. Record profil lengkap ada
+    di kunci `profile`, laporan lengkap (dict JSON) di kunci `reports`.
+    """
+    row = {'currency': name, 'n_obs': int(prices.dropna().shape[0]), 'error': None}
+    # Record dikirim balik ke proses induk, yang menuliskannya ke log (worker tidak berbagi konfigurasi logging)
+    profiler = Profiler(name=name, log=False)
+    try:
+        pipeline = ArimaNgarchPipeline(arima_order=arima_order, garch_order=garch_order,
+                                       ngarch_order=ngarch_order, dist=dist, test_size=test_size,
+                                       profiler=profiler)
+        pipeline.load(prices)
+        forecast = pipeline.run()
+        reports = pipeline.reports()
+        row['arima_order'] = str(pipeline.arima_order)
+        for model, report in reports.items():
+            row.update(report.summary(prefix=f'{model}_'))
+        row.update({
+            'mean_forecast_1': float(forecast['mean'].iloc[0]),
+            'volatility_forecast_1': float(forecast['volatility'].iloc[0]),
+        })
+        row['reports'] = [report.to_dict() for report in reports.values()]
+    except Exception as e:
+        row['error'] = str(e)
+    for record in profiler.records:
+        if record['parent'] is None:
+            row[f"time_{record['stage']}_{record['label']}"] = record['wall_s']
+    row['profile'] = profiler.records
+    return row
+
+
+def _no_progress(done, total, message=None):
+    pass
+
+
+def fit_currencies(df, columns=None, max_workers=None, reports_path=None, progress=None, **pipeline_kwargs):
+    """
+    Melatih ARIMA + GARCH + NGARCH untuk setiap kolom numerik `df`
+    (misalnya `df_currency_raw_multi`) secara paralel.
+
+    `max_workers` mengatur jumlah proses (default: jumlah CPU, dibatasi jumlah kolom);
+    `max_workers=1` menjalankan secara serial di proses yang sama.
+    Mengembalikan DataFrame ringkasan ber-indeks mata uang. Record profil setiap tahap
+    dikirim sebagai JSON ke logger `arima_ngarch.profiling` (lihat `profiling`).
+    Dengan `reports_path`, laporan model semua mata uang disimpan lewat `save_reports`
+    (Arrow IPC untuk akhiran .feather/.arrow, selain itu JSON Lines).
+    `progress(selesai, total, pesan)` dipanggil setiap satu mata uang selesai.
+    """
+    if columns is None:
+        columns = [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col])]
+    if not columns:
+        return pd.DataFrame()
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(columns)))
+
+    if progress is None:
+        progress = _no_progress
+    rows = []
+    if max_workers == 1:
+        for col in columns:
+            progress(len(rows), len(columns), col)
+            rows.append(fit_currency(col, df[col], **pipeline_kwargs))
+    else:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [executor.submit(fit_currency, col, df[col], **pipeline_kwargs) for col in columns]
+            for col, future in zip(columns, futures):
+                progress(len(rows), len(columns), col)
+                rows.append(future.result())
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    reports = []
+    for row in rows:
+        log_records(row.pop('profile'))
+        reports += [ModelReport.from_dict(data) for data in row.pop('reports', [])]
+    if reports_path is not None:
+        save_reports(reports, reports_path)
+    return pd.DataFrame(rows).set_index('currency')
+
+
+def fit_currencies_volatility(df, columns=None, kind='gjr'):
+    """
+    Melatih model volatilitas Student-t ber-mean nol (`kind`: 'garch', 'gjr' atau 'engle-ng')
+    pada log-return terpusat setiap kolom `df` dalam satu optimasi gabungan.
+    Hanya tanggal yang tersedia di semua kolom yang dipakai.
+    """
+    from .batched import fit_batched
+
+    if columns is None:
+        columns = [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col])]
+    returns = pd.DataFrame({col: compute_log_returns(df[col].dropna())[0] for col in columns})
+    return fit_batched(returns - returns.mean(), kind=kind)
@@ -0,0 +1,359 @@
+"""
+Evaluasi likelihood GARCH/GJR/NGARCH untuk banyak deret sekaligus.
+
+N deret return (atau residual) yang sejajar ditumpuk menjadi array 2-D (T, N).
+Satu kernel menjalankan rekursi varians dan log-likelihood Student-t semua deret
+per langkah waktu dalam satu lintasan, beserta gradien analitiknya, sehingga
+satu langkah optimasi gabungan hanya membutuhkan satu lintasan data, bukan N.
+
+Parameter setiap deret disusun sebagai (omega, alpha, gamma_atau_theta, beta, nu):
+
+* `'garch'`    : sigma2_t = omega + alpha * e_{t-1}^2 + beta * sigma2_{t-1}  (gamma = 0)
+* `'gjr'`      : ditambah gamma * e_{t-1}^2 * 1[e_{t-1} < 0]
+* `'engle-ng'` : sigma2_t = omega + alpha * (e_{t-1} - theta * sigma_{t-1})^2 + beta * sigma2_{t-1}
+
+Inisialisasi (backcast) dan batas varians sama dengan arch, sehingga log-likelihood
+per deret identik dengan `arch_model(...)` pada parameter yang sama.
+"""
+import numpy as np
+import pandas as pd
+from scipy import optimize, special
+
+from arch.univariate.volatility import GARCH
+
+from .ngarch import NGARCH, _bounds_check, njit
+
+BATCHED_KINDS = ('garch', 'gjr', 'engle-ng')
+PARAMETER_NAMES = {
+    'garch': ['omega', 'alpha[1]', 'beta[1]', 'nu'],
+    'gjr': ['omega', 'alpha[1]', 'gamma[1]', 'beta[1]', 'nu'],
+    'engle-ng': ['omega', 'alpha[1]', 'theta[1]', 'beta[1]', 'nu'],
+}
+
+
+@njit(cache=True)
+def _batched_t_kernel(ngarch, parameters, resids, backcast, var_bounds, d_constant, sigma2, loglik, grad, opg):
+    nobs, nseries = resids.shape
+    d = np.zeros((nseries, 4))
+    score = np.empty(5)
+    with_opg = opg.shape[0] > 0
+    for t in range(nobs):
+        for i in range(nseries):
+            omega, alpha, gamma, beta, nu = (parameters[i, 0], parameters[i, 1], parameters[i, 2],
+                                             parameters[i, 3], parameters[i, 4])
+            if t == 0:
+                bc = backcast[i]
+                if ngarch:
+                    value = omega + alpha * bc * (1.0 + gamma * gamma) + beta * bc
+                    d[i, 2] = 2.0 * alpha * gamma * bc
+                    d[i, 1] = bc * (1.0 + gamma * gamma)
+                else:
+                    value = omega + alpha * bc + 0.5 * gamma * bc + beta * bc
+                    d[i, 2] = 0.5 * bc
+                    d[i, 1] = bc
+                d[i, 0] = 1.0
+                d[i, 3] = bc
+            else:
+                prev = sigma2[t - 1, i]
+                e = resids[t - 1, i]
+                if ngarch:
+                    s = np.sqrt(prev)
+                    u = e - gamma * s
+                    value = omega + alpha * u * u + beta * prev
+                    c = beta - alpha * gamma * u / s
+                    d[i, 1] = u * u + c * d[i, 1]
+                    d[i, 2] = -2.0 * alpha * u * s + c * d[i, 2]
+                else:
+                    e2 = e * e
+                    neg = e2 if e < 0 else 0.0
+                    value = omega + alpha * e2 + gamma * neg + beta * prev
+                    c = beta
+                    d[i, 1] = e2 + c * d[i, 1]
+                    d[i, 2] = neg + c * d[i, 2]
+                d[i, 0] = 1.0 + c * d[i, 0]
+                d[i, 3] = prev + c * d[i, 3]
+
+            # scale = turunan varians terpotong terhadap varians asli (lihat ngarch._bounds_check)
+            h, scale = _bounds_check(value, var_bounds[t, i, 0], var_bounds[t, i, 1])
+            sigma2[t, i] = h
+            for k in range(4):
+                d[i, k] *= scale
+
+            nu_m2 = nu - 2.0
+            a = resids[t, i] * resids[t, i] / (h * nu_m2)
+            log1pa = np.log1p(a)
+            loglik[i] += -0.5 * np.log(h) - 0.5 * (nu + 1.0) * log1pa
+            dl_dh = -0.5 / h + 0.5 * (nu + 1.0) * (a / h) / (1.0 + a)
+            for k in range(4):
+                score[k] = dl_dh * d[i, k]
+            score[4] = -0.5 * log1pa + 0.5 * (nu + 1.0) * a / (nu_m2 * (1.0 + a)) + d_constant[i]
+            for k in range(5):
+                grad[i, k] += score[k]
+            if with_opg:
+                # Outer product of gradients (BHHH) sebagai aproksimasi Hessian
+                for k in range(5):
+                    for m in range(k, 5):
+                        opg[i, k, m] += score[k] * score[m]
+    if with_opg:
+        for i in range(nseries):
+            for k in range(5):
+                for m in range(k):
+                    opg[i, k, m] = opg[i, m, k]
+
+
+def stack_series(data, columns=None):
+    """
+    Menumpuk kolom-kolom numerik `data` (misalnya residual per mata uang) menjadi
+    DataFrame sejajar tanpa NaN. Baris yang mengandung NaN pada salah satu kolom dibuang.
+    """
+    frame = pd.DataFrame(data)
+    if columns is None:
+        columns = [col for col in frame.columns if pd.api.types.is_numeric_dtype(frame[col])]
+    return frame[list(columns)].astype(float).dropna()
+
+
+def _volatility(kind):
+    if kind == 'engle-ng':
+        return NGARCH()
+    return GARCH(p=1, o=1 if kind == 'gjr' else 0, q=1)
+
+
+def _expand(parameters, kind):
+    # Susunan internal selalu 5 kolom; GARCH biasa memakai gamma = 0
+    parameters = np.atleast_2d(np.asarray(parameters, dtype=float))
+    if kind == 'garch':
+        parameters = np.insert(parameters, 2, 0.0, axis=1)
+    return np.ascontiguousarray(parameters)
+
+
+def batched_inputs(resids, kind='gjr'):
+    """Backcast (N,) dan batas varians (T, N, 2) per deret, dihitung seperti arch."""
+    columns = [np.ascontiguousarray(column) for column in np.asarray(resids, dtype=float).T]
+    volatility = _volatility(kind)
+    backcast = np.array([volatility.backcast(column) for column in columns])
+    var_bounds = np.stack([volatility.variance_bounds(column) for column in columns], axis=1)
+    return backcast, np.ascontiguousarray(var_bounds)
+
+
+def _t_constant(nu):
+    constant = special.gammaln((nu + 1) / 2) - special.gammaln(nu / 2) - 0.5 * np.log(np.pi * (nu - 2))
+    d_constant = 0.5 * special.digamma((nu + 1) / 2) - 0.5 * special.digamma(nu / 2) - 0.5 / (nu - 2)
+    return constant, d_constant
+
+
+def _evaluate(params, resids, ngarch, backcast, var_bounds, sigma2, with_opg=False):
+    # params dalam susunan internal 5 kolom; mengembalikan (loglik, gradien, opg)
+    nobs, nseries = resids.shape
+    constant, d_constant = _t_constant(params[:, 4])
+    loglik = np.zeros(nseries)
+    grad = np.zeros((nseries, 5))
+    opg = np.zeros((nseries if with_opg else 0, 5, 5))
+    _batched_t_kernel(ngarch, np.ascontiguousarray(params), resids, backcast, var_bounds,
+                      np.ascontiguousarray(d_constant), sigma2, loglik, grad, opg)
+    return loglik + nobs * constant, grad, opg
+
+
+def batched_t_loglik(parameters, resids, kind='gjr', backcast=None, var_bounds=None, sigma2=None):
+    """
+    Log-likelihood Student-t (terstandar) N deret sekaligus.
+
+    `parameters` berukuran (N, k) dengan urutan kolom `PARAMETER_NAMES[kind]`,
+    `resids` berukuran (T, N). Mengembalikan (loglik per deret (N,), gradien (N, k)).
+    """
+    if kind not in BATCHED_KINDS:
+        raise ValueError(f"Jenis model harus salah satu dari {BATCHED_KINDS}.")
+    resids = np.ascontiguousarray(resids, dtype=float)
+    if backcast is None or var_bounds is None:
+        backcast, var_bounds = batched_inputs(resids, kind)
+    if sigma2 is None:
+        sigma2 = np.empty_like(resids)
+    loglik, grad, _ = _evaluate(_expand(parameters, kind), resids, kind == 'engle-ng', backcast, var_bounds, sigma2)
+    if kind == 'garch':
+        grad = np.delete(grad, 2, axis=1)
+    return loglik, grad
+
+
+def _starting_values(resids, kind):
+    volatility = _volatility(kind)
+    rows = [np.asarray(volatility.starting_values(np.ascontiguousarray(column)), dtype=float)
+            for column in resids.T]
+    return _expand(np.column_stack([np.array(rows), np.full(len(rows), 8.0)]), kind)
+
+
+def _bounds(kind):
+    # Batas parameter (susunan internal 5 kolom) untuk data berskala varians 1
+    lower = np.array([1e-8, 0.0, -1.0, 0.0, 2.05])
+    upper = np.array([10.0, 1.0, 2.0, 1.0, 500.0])
+    if kind == 'engle-ng':
+        lower[2], upper[2] = -10.0, 10.0
+    elif kind == 'garch':
+        lower[2] = upper[2] = 0.0
+    return lower, upper
+
+
+def _persistence(params, kind):
+    """Persistensi per deret dan turunannya terhadap parameter internal (N, 5)."""
+    jac = np.zeros_like(params)
+    if kind == 'engle-ng':
+        value = params[:, 1] * (1.0 + params[:, 2] ** 2) + params[:, 3]
+        jac[:, 1] = 1.0 + params[:, 2] ** 2
+        jac[:, 2] = 2.0 * params[:, 1] * params[:, 2]
+        jac[:, 3] = 1.0
+    else:
+        value = params[:, 1] + 0.5 * params[:, 2] + params[:, 3]
+        jac[:, 1], jac[:, 2], jac[:, 3] = 1.0, 0.5, 1.0
+    return value, jac
+
+
+def _feasible(params, kind, lower, upper):
+    ok = np.all((params >= lower) & (params <= upper), axis=1) & (_persistence(params, kind)[0] < 1.0)
+    if kind == 'gjr':
+        ok &= params[:, 1] + params[:, 2] >= 0.0
+    return ok
+
+
+def _fit_bhhh(resids, kind, start, backcast, var_bounds, sigma2, maxiter, tol):
+    """
+    Newton-BHHH per deret yang dijalankan serempak: setiap iterasi (dan setiap percobaan
+    line search) adalah satu lintasan kernel untuk semua deret yang masih aktif.
+    Mengembalikan (parameter, konvergen, jumlah_iterasi) per deret.
+    """
+    ngarch = kind == 'engle-ng'
+    lower, upper = _bounds(kind)
+    free = lower < upper
+    nseries = start.shape[0]
+    x = start.copy()
+    ll, grad, opg = _evaluate(x, resids, ngarch, backcast, var_bounds, sigma2, with_opg=True)
+    active = np.ones(nseries, dtype=bool)
+    converged = np.zeros(nseries, dtype=bool)
+    n_iter = np.zeros(nseries, dtype=int)
+
+    for _ in range(maxiter):
+        hessian = opg[:, free][:, :, free] + 1e-10 * np.eye(free.sum())
+        step = np.zeros_like(x)
+        step[:, free] = np.linalg.solve(hessian, grad[:, free][:, :, None])[:, :, 0]
+        decrement = np.einsum('ij,ij->i', grad, step)
+        converged |= active & (decrement <= tol)
+        active &= ~converged
+        if not active.any():
+            break
+        n_iter[active] += 1
+
+        size = np.where(active, 1.0, 0.0)
+        pending = active.copy()
+        trial = x.copy()
+        for _ in range(50):
+            trial[pending] = x[pending] + size[pending, None] * step[pending]
+            infeasible = pending & ~_feasible(trial, kind, lower, upper)
+            while infeasible.any() and size[infeasible].max() > 1e-12:
+                size[infeasible] /= 2.0
+                trial[infeasible] = x[infeasible] + size[infeasible, None] * step[infeasible]
+                infeasible &= ~_feasible(trial, kind, lower, upper)
+            pending &= ~infeasible
+            trial[infeasible] = x[infeasible]
+            active &= ~infeasible
+            if not pending.any():
+                break
+            ll_t, grad_t, opg_t = _evaluate(trial, resids, ngarch, backcast, var_bounds, sigma2, with_opg=True)
+            accepted = pending & np.isfinite(ll_t) & (ll_t >= ll + 1e-4 * size * decrement)
+            x[accepted], ll[accepted] = trial[accepted], ll_t[accepted]
+            grad[accepted], opg[accepted] = grad_t[accepted], opg_t[accepted]
+            pending &= ~accepted
+            if not pending.any():
+                break
+            size[pending] /= 2.0
+        # Deret yang line search-nya gagal berhenti dengan status belum konvergen
+        trial[pending] = x[pending]
+        active &= ~pending
+    return x, converged, n_iter
+
+
+def _fit_slsqp(resids, kind, start, backcast, var_bounds, sigma2, maxiter):
+    """Optimasi gabungan SLSQP (gradien analitik) untuk semua deret sebagai satu vektor parameter."""
+    ngarch = kind == 'engle-ng'
+    lower, upper = _bounds(kind)
+    nobs, nseries = resids.shape
+    total = nobs * nseries
+
+    def objective(flat):
+        loglik, grad, _ = _evaluate(flat.reshape(nseries, 5), resids, ngarch, backcast, var_bounds, sigma2)
+        return -loglik.sum() / total, -grad.ravel() / total
+
+    def block_jacobian(rows):
+        out = np.zeros((nseries, nseries * 5))
+        for i in range(nseries):
+            out[i, i * 5:(i + 1) * 5] = rows[i]
+        return out
+
+    constraints = [{
+        'type': 'ineq',
+        'fun': lambda flat: 1.0 - _persistence(flat.reshape(nseries, 5), kind)[0],
+        'jac': lambda flat: -block_jacobian(_persistence(flat.reshape(nseries, 5), kind)[1]),
+    }]
+    if kind == 'gjr':
+        # alpha + gamma >= 0 seperti batasan arch
+        positive = block_jacobian(np.tile([0.0, 1.0, 1.0, 0.0, 0.0], (nseries, 1)))
+        constraints.append({'type': 'ineq', 'fun': lambda flat: positive @ flat, 'jac': lambda flat: positive})
+
+    result = optimize.minimize(
+        objective, start.ravel(), jac=True, method='SLSQP', bounds=list(zip(lower, upper)) * nseries,
+        constraints=constraints, options={'maxiter': maxiter, 'ftol': 1e-12},
+    )
+    return result.x.reshape(nseries, 5), np.full(nseries, bool(result.success)), np.full(nseries, int(result.nit))
+
+
+def fit_batched(data, kind='gjr', columns=None, starting_values=None, maxiter=200, tol=1e-10):
+    """
+    Melatih model volatilitas Student-t ber-mean nol untuk setiap kolom `data` sekaligus.
+
+    Parameter antar deret tidak terkait, sehingga setiap deret memiliki langkah
+    Newton-BHHH sendiri (Hessian dari outer product gradien analitik), tetapi semua
+    langkah dievaluasi bersama dalam satu lintasan kernel. Deret yang berhenti di
+    batas parameter tanpa konvergen diselesaikan dengan SLSQP gabungan.
+    `tol` adalah ambang Newton decrement per observasi.
+
+    Mengembalikan DataFrame ber-indeks nama deret berisi parameter (skala asli),
+    log-likelihood, persistensi, jumlah observasi, status konvergensi dan jumlah iterasi.
+    """
+    if kind not in BATCHED_KINDS:
+        raise ValueError(f"Jenis model harus salah satu dari {BATCHED_KINDS}.")
+    frame = stack_series(data, columns)
+    values = frame.to_numpy()
+    nobs, nseries = values.shape
+    ngarch = kind == 'engle-ng'
+
+    # Optimasi pada data berskala varians 1; hanya omega yang bergantung skala
+    scale = 1.0 / values.std(axis=0)
+    resids = np.ascontiguousarray(values * scale)
+    backcast, var_bounds = batched_inputs(resids, kind)
+    sigma2 = np.empty_like(resids)
+
+    if starting_values is None:
+        start = _starting_values(resids, kind)
+    else:
+        start = _expand(np.array(starting_values, dtype=float).reshape(nseries, -1), kind)
+        start[:, 0] *= scale ** 2
+
+    params, converged, n_iter = _fit_bhhh(resids, kind, start, backcast, var_bounds, sigma2, maxiter, tol * nobs)
+    if not converged.all():
+        rest = ~converged
+        sub_backcast, sub_bounds = backcast[rest], np.ascontiguousarray(var_bounds[:, rest])
+        sub_params, sub_converged, sub_iter = _fit_slsqp(np.ascontiguousarray(resids[:, rest]), kind, params[rest],
+                                                         sub_backcast, sub_bounds, np.empty((nobs, rest.sum())),
+                                                         maxiter)
+        params[rest], converged[rest] = sub_params, sub_converged
+        n_iter[rest] += sub_iter
+
+    loglik, _, _ = _evaluate(params, resids, ngarch, backcast, var_bounds, sigma2)
+    persistence = _persistence(params, kind)[0]
+    params[:, 0] /= scale ** 2
+    if kind == 'garch':
+        params = np.delete(params, 2, axis=1)
+    table = pd.DataFrame(params, index=frame.columns, columns=PARAMETER_NAMES[kind])
+    # Log-likelihood pada skala asli berbeda sebesar nobs * log(scale)
+    table['loglik'] = loglik + nobs * np.log(scale)
+    table['persistence'] = persistence
+    table['n_obs'] = nobs
+    table['converged'] = converged
+    table['n_iter'] = n_iter
+    return table
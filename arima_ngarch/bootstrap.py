@@ -0,0 +1,248 @@
+"""
+Interval prediksi harga dengan bootstrap (filtered historical simulation) ARIMA-NGARCH.
+
+Residual terstandar model volatilitas z_t = e_t / sigma_t diambil ulang dengan
+pengembalian, lalu dimajukan lewat rekursi varians NGARCH (`propagate_variance`,
+kernel yang sama dengan simulasi Monte-Carlo) menjadi guncangan e_{T+h}. Return
+masa depan = prediksi mean ARIMA + sum(psi_j * e_{T+h-j}) dengan bobot psi (MA tak
+hingga) dari polinomial ARIMA, sehingga guncangan ikut merambat lewat suku AR/MA.
+Harga = harga terakhir * exp(log-return kumulatif). Tanpa model volatilitas,
+residual ARIMA mentah yang diambil ulang (bootstrap residual biasa).
+
+Dengan `n_refits > 0` ketidakpastian parameter ikut dihitung: setiap replikasi
+membangkitkan deret return bootstrap sepanjang data latih, melatih ulang ARIMA dan
+model volatilitas, lalu memprediksi dari data asli dengan parameter baru. Replikasi
+inilah yang mahal, sehingga blok-blok dijalankan di process pool. Setiap blok
+mendapat aliran bilangan acak sendiri dari `seed` (SeedSequence.spawn), jadi hasilnya
+sama berapa pun jumlah proses.
+"""
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .online import NgarchFilter
+from .simulation import innovation_spec, propagate_variance
+
+N_RESAMPLES = 5000
+BLOCK_SIZE = 1000
+BURN_IN = 250
+DEFAULT_LEVELS = (0.8, 0.95)
+
+
+def _vol_spec(vol_fit):
+    """Spesifikasi model volatilitas (jenis, ordo, distribusi) untuk dilatih ulang."""
+    from .ngarch import NGARCH
+
+    volatility = vol_fit.model.volatility
+    dist, _ = innovation_spec(vol_fit)
+    if isinstance(volatility, NGARCH):
+        return {'kind': 'engle-ng', 'p': 1, 'o': 0, 'q': 1, 'dist': dist}
+    return {'kind': 'gjr', 'p': volatility.p, 'o': volatility.o, 'q': volatility.q, 'dist': dist}
+
+
+def _vol_model(residuals, spec):
+    from arch import arch_model
+
+    from .ngarch import ngarch_model
+
+    if spec['kind'] == 'engle-ng':
+        return ngarch_model(residuals, dist=spec['dist'])
+    return arch_model(residuals, mean='zero', vol='Garch', p=spec['p'], o=spec['o'], q=spec['q'],
+                      dist=spec['dist'])
+
+
+def _polynomials(arima_fit):
+    """Polinomial AR (termasuk differencing (1 - L)^d) dan MA hasil fit ARIMA."""
+    ar = np.asarray(arima_fit.polynomial_ar, dtype=float)
+    for _ in range(arima_fit.model.order[1]):
+        ar = np.convolve(ar, [1.0, -1.0])
+    return ar, np.asarray(arima_fit.polynomial_ma, dtype=float)
+
+
+def _variance_state(vol_fit):
+    """State rekursi varians (NgarchFilter) dan skala arch, atau (None, 1) tanpa model volatilitas."""
+    if vol_fit is None:
+        return {'state': None, 'scale': 1.0}
+    return {'state': NgarchFilter.from_fit(vol_fit), 'scale': getattr(vol_fit, 'scale', 1.0) or 1.0}
+
+
+def _forecast_model(arima_fit, vol_fit, horizon):
+    """Bagian deterministik prediksi: mean ARIMA, matriks bobot psi dan state varians."""
+    from statsmodels.tsa.arima_process import arma2ma
+
+    ar, ma = _polynomials(arima_fit)
+    psi = arma2ma(ar, ma, lags=horizon)
+    # psi_matrix[h, j] = psi_{h-j}: return langkah h menerima guncangan langkah j <= h
+    lags = np.subtract.outer(np.arange(horizon), np.arange(horizon))
+    psi_matrix = np.where(lags >= 0, psi[np.clip(lags, 0, None)], 0.0)
+    model = _variance_state(vol_fit)
+    model['mean'] = np.asarray(arima_fit.forecast(steps=horizon), dtype=float)
+    model['psi'] = psi_matrix
+    return model
+
+
+def _shock_pool(arima_fit, vol_fit):
+    """Residual terstandar NGARCH (FHS), atau residual ARIMA bila tanpa model volatilitas."""
+    if vol_fit is None:
+        pool = np.asarray(arima_fit.resid, dtype=float)
+    else:
+        pool = np.asarray(vol_fit.std_resid, dtype=float)
+    return pool[np.isfinite(pool)]
+
+
+def _shocks(model, z):
+    """Guncangan e (horizon, jalur) dari sampel ulang `z` lewat rekursi varians model."""
+    if model['state'] is None:
+        return z
+    shocks = np.empty_like(z)
+    sigma2 = np.empty_like(z)
+    propagate_variance(model['state'], z, shocks, sigma2)
+    return shocks / model['scale']
+
+
+def _cumulative_paths(model, pool, n_paths, rng):
+    horizon = model['mean'].size
+    z = pool[rng.integers(0, pool.size, size=(horizon, n_paths))]
+    returns = model['psi'] @ _shocks(model, z)
+    returns += model['mean'][:, None]
+    return np.cumsum(returns, axis=0)
+
+
+def _bootstrap_series(arima_fit, vol_fit, pool, n_obs, rng):
+    """Deret return bootstrap sepanjang `n_obs` dari model ARIMA-NGARCH terlatih."""
+    from scipy.signal import lfilter
+
+    z = pool[rng.integers(0, pool.size, size=(n_obs + BURN_IN, 1))]
+    shocks = _shocks(_variance_state(vol_fit), z)[:, 0]
+    ar, ma = _polynomials(arima_fit)
+    const = dict(zip(arima_fit.param_names, np.asarray(arima_fit.params))).get('const', 0.0)
+    return const + lfilter(ma, ar, shocks)[BURN_IN:]
+
+
+def _refit(arima_fit, vol_fit, series):
+    """
+    Melatih ulang ARIMA dan model volatilitas pada `series`, lalu memasang parameter
+    barunya pada data asli (prediksi tetap bersyarat pada observasi terakhir yang sebenarnya).
+    """
+    from .ngarch import fit_engle_ng
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        bootstrap_fit = arima_fit.apply(series, refit=True)
+        # Model di-clone: filter() memperbarui state-space model yang dipakai bersama
+        model = arima_fit.model
+        arima_refit = model.clone(model.data.orig_endog).filter(bootstrap_fit.params)
+        if vol_fit is None:
+            return arima_refit, None
+        spec = _vol_spec(vol_fit)
+        residuals = np.asarray(bootstrap_fit.resid, dtype=float)
+        if spec['kind'] == 'engle-ng':
+            vol_params = fit_engle_ng(residuals, dist=spec['dist']).params
+        else:
+            vol_params = _vol_model(residuals, spec).fit(disp='off', show_warning=False).params
+    return arima_refit, _vol_model(arima_refit.resid.dropna(), spec).fix(vol_params)
+
+
+def _paths_block(model, pool, n_paths, seed):
+    """Satu blok jalur log-return kumulatif (horizon, n_paths) dengan parameter tetap."""
+    return _cumulative_paths(model, pool, n_paths, np.random.default_rng(seed))
+
+
+def _refit_block(arima_fit, vol_fit, pool, horizon, n_paths, seed):
+    """Satu replikasi latih-ulang: deret bootstrap, fit ulang, lalu jalur dengan parameter baru."""
+    rng = np.random.default_rng(seed)
+    series = _bootstrap_series(arima_fit, vol_fit, pool, int(arima_fit.nobs), rng)
+    arima_refit, vol_refit = _refit(arima_fit, vol_fit, series)
+    return _cumulative_paths(_forecast_model(arima_refit, vol_refit, horizon), pool, n_paths, rng)
+
+
+def _report(progress, done, total):
+    if progress is not None:
+        progress(done, total, f"blok {done + 1}/{total}")
+
+
+def bootstrap_price_paths(arima_fit, vol_fit=None, horizon=30, n_resamples=N_RESAMPLES, n_refits=0, seed=None,
+                          block_size=BLOCK_SIZE, max_workers=None, progress=None):
+    """
+    Jalur log-return kumulatif bootstrap berukuran (n_resamples, horizon).
+
+    Tanpa `n_refits`, jalur dibagi ke blok berisi `block_size` jalur; dengan `n_refits`,
+    setiap blok adalah satu replikasi latih-ulang dengan n_resamples / n_refits jalur.
+    Blok dijalankan di process pool (`max_workers=1` untuk serial);
+    `progress(selesai, total, pesan)` dipanggil sebelum setiap blok diambil hasilnya.
+    """
+    n_blocks = int(n_refits) if n_refits else -(-n_resamples // block_size)
+    sizes = np.full(n_blocks, n_resamples // n_blocks)
+    sizes[:n_resamples % n_blocks] += 1
+    seeds = np.random.SeedSequence(seed).spawn(n_blocks)
+    pool = _shock_pool(arima_fit, vol_fit)
+    if n_refits:
+        task = _refit_block
+        jobs = [(arima_fit, vol_fit, pool, horizon, int(size), child) for size, child in zip(sizes, seeds)]
+    else:
+        # Bagian deterministik dihitung sekali; worker hanya mengambil ulang dan merambatkan guncangan
+        task = _paths_block
+        model = _forecast_model(arima_fit, vol_fit, horizon)
+        jobs = [(model, pool, int(size), child) for size, child in zip(sizes, seeds)]
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, n_blocks))
+    blocks = []
+    if max_workers == 1:
+        for job in jobs:
+            _report(progress, len(blocks), n_blocks)
+            blocks.append(task(*job))
+    else:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [executor.submit(task, *job) for job in jobs]
+            for future in futures:
+                _report(progress, len(blocks), n_blocks)
+                blocks.append(future.result())
+        finally:
+            # Blok yang belum mulai dibatalkan bila progress menghentikan bootstrap di tengah
+            executor.shutdown(cancel_futures=True)
+    return np.concatenate(blocks, axis=1).T
+
+
+def price_intervals(paths, last_price, point=None, levels=DEFAULT_LEVELS, index=None):
+    """
+    Pita persentil harga per horizon dari jalur log-return kumulatif (n_paths, horizon):
+    kolom `median` serta `lower_<level>`/`upper_<level>` (misalnya lower_95), ditambah
+    `forecast` bila `point` (log-return kumulatif prediksi titik) diberikan.
+    """
+    prices = last_price * np.exp(np.ascontiguousarray(np.asarray(paths).T))
+    horizon = prices.shape[0]
+    if index is None:
+        index = pd.RangeIndex(1, horizon + 1, name='horizon')
+    probs = [0.5]
+    for level in levels:
+        probs += [(1 - level) / 2, (1 + level) / 2]
+    values = np.quantile(prices, probs, axis=1)
+    table = pd.DataFrame(index=index)
+    if point is not None:
+        table['forecast'] = last_price * np.exp(np.asarray(point, dtype=float))
+    table['median'] = values[0]
+    for i, level in enumerate(levels):
+        table[f'lower_{level * 100:g}'] = values[1 + 2 * i]
+        table[f'upper_{level * 100:g}'] = values[2 + 2 * i]
+    return table
+
+
+def bootstrap_price_intervals(arima_fit, last_price, vol_fit=None, horizon=30, n_resamples=N_RESAMPLES,
+                              n_refits=0, levels=DEFAULT_LEVELS, seed=None, block_size=BLOCK_SIZE,
+                              max_workers=None, index=None, progress=None):
+    """
+    Interval prediksi harga `horizon` langkah setelah `last_price` dari ARIMA (`arima_fit`,
+    pada log-return) dan model volatilitas `vol_fit` (hasil fit_garch/fit_ngarch, opsional).
+    Mengembalikan DataFrame per horizon: forecast (prediksi titik ARIMA), median dan
+    pita persentil untuk setiap `levels`; lihat `bootstrap_price_paths` dan `price_intervals`.
+    """
+    paths = bootstrap_price_paths(arima_fit, vol_fit, horizon, n_resamples=n_resamples, n_refits=n_refits,
+                                  seed=seed, block_size=block_size, max_workers=max_workers, progress=progress)
+    point = np.cumsum(np.asarray(arima_fit.forecast(steps=horizon), dtype=float))
+    return price_intervals(paths, last_price, point=point, levels=levels, index=index)
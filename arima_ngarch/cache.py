@@ -0,0 +1,149 @@
+"""
+Cache hasil fit di disk, dialamatkan oleh isi data (content-addressed).
+
+Kunci cache adalah hash SHA-256 dari array data pelatihan (nilai dan indeks
+tanggal) ditambah spesifikasi model (jenis, ordo, mean, vol, dist), sehingga
+permintaan yang identik dari sesi atau pengguna mana pun tidak melatih ulang.
+Entri dibuang dengan kebijakan LRU (berdasarkan waktu akses file) bila jumlah
+entri atau total ukuran melewati batas.
+"""
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CACHE_DIR = os.environ.get('ARIMA_NGARCH_CACHE_DIR', str(Path.home() / '.cache' / 'arima_ngarch' / 'fits'))
+SUFFIX = '.pkl'
+
+
+def fingerprint(series):
+    """Hash SHA-256 dari nilai (float64) dan indeks sebuah deret."""
+    digest = hashlib.sha256()
+    values = np.ascontiguousarray(np.asarray(series, dtype=np.float64))
+    digest.update(values.tobytes())
+    if isinstance(series, pd.Series):
+        index = series.index
+        if isinstance(index, pd.DatetimeIndex):
+            digest.update(np.ascontiguousarray(index.asi8).tobytes())
+        else:
+            digest.update(np.asarray(index.astype(str)).tobytes())
+    return digest.hexdigest()
+
+
+def cache_key(kind, series, **spec):
+    """Kunci cache untuk model `kind` pada `series` dengan spesifikasi `spec`."""
+    spec_text = json.dumps({'kind': kind, **spec}, sort_keys=True, default=str)
+    digest = hashlib.sha256()
+    digest.update(fingerprint(series).encode())
+    digest.update(spec_text.encode())
+    return digest.hexdigest()
+
+
+class FitCache:
+    """
+    Cache on-disk untuk objek hasil fit (ARIMAResults / ARCHModelResult).
+    Aman dipakai bersama oleh beberapa proses: penulisan bersifat atomik
+    (file sementara lalu os.replace) dan entri yang gagal dimuat (file rusak,
+    versi pustaka berbeda) dianggap cache miss lalu dihapus.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_entries=256, max_bytes=512 * 1024 ** 2):
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return self.directory / f"{key}{SUFFIX}"
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            # File terpotong, kelas yang sudah berubah/hilang, dsb.: buang entrinya
+            self.misses += 1
+            self.invalidate(key)
+            return None
+        # Tandai sebagai baru diakses untuk kebijakan LRU
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.evict()
+
+    def get_or_fit(self, key, fit_fn):
+        """Mengembalikan hasil dari cache, atau memanggil `fit_fn()` lalu menyimpannya."""
+        value = self.get(key)
+        if value is None:
+            value = fit_fn()
+            self.put(key, value)
+        return value
+
+    def _entries(self):
+        entries = []
+        for path in self.directory.glob(f"*{SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return sorted(entries)
+
+    def evict(self):
+        """Membuang entri yang paling lama tidak diakses hingga batas terpenuhi."""
+        entries = self._entries()
+        total_bytes = sum(size for _, size, _ in entries)
+        while entries and (len(entries) > self.max_entries or total_bytes > self.max_bytes):
+            _, size, path = entries.pop(0)
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            total_bytes -= size
+
+    def invalidate(self, key):
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+    def clear(self):
+        for _, _, path in self._entries():
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def stats(self):
+        entries = self._entries()
+        return {
+            'entries': len(entries),
+            'bytes': sum(size for _, size, _ in entries),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
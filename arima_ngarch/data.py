@@ -0,0 +1,175 @@
+"""
+Pembaca data nilai tukar tanpa ketergantungan Streamlit.
+Format yang didukung sama dengan halaman INPUT DATA: CSV ber-delimiter ';',
+kolom 'Date' berformat '%d/%m/%Y %H:%M', dan angka berformat Eropa (14.162,09).
+
+File dibaca bertahap per blok baris dengan parser C pandas (decimal=',' dan
+thousands='.' ditangani langsung oleh parser), sehingga memori puncak hanya
+sebesar hasil akhir ditambah satu blok, bukan seluruh file sebagai teks.
+Tanggal diparse dengan `pyarrow.compute.strptime` bila pyarrow terpasang.
+
+`load_currency_data` adalah satu-satunya pintu masuk yang dipakai halaman Streamlit,
+pipeline dan batch job: hasil parse disimpan di cache memori yang dikunci oleh hash
+SHA-256 isi file (bukan identitas objek UploadedFile) beserta opsi parser.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - pyarrow bersifat opsional
+    pa = pc = None
+
+DATE_COLUMN = 'Date'
+DATE_FORMAT = '%d/%m/%Y %H:%M'
+CHUNKSIZE = 250_000
+DEFAULT_DATA_FILE = Path(__file__).resolve().parent.parent / 'data' / 'default_currency_multi.csv'
+
+
+def parse_european_numbers(values):
+    """
+    Konversi kolom harga berformat Eropa ('14.162,09') ke float.
+    Nilai yang tidak dapat dikonversi menjadi NaN.
+    """
+    cleaned = values.astype(str) \
+        .str.replace('.', '', regex=False) \
+        .str.replace(',', '.', regex=False) \
+        .str.replace('[^0-9.-]', '', regex=True)
+    return pd.to_numeric(cleaned, errors='coerce')
+
+
+def parse_dates(values, date_format=DATE_FORMAT):
+    """
+    Konversi teks tanggal ke DatetimeIndex (resolusi ns); nilai yang tidak sesuai format menjadi NaT.
+    """
+    if pc is not None:
+        try:
+            parsed = pc.strptime(pa.array(values, type=pa.string(), from_pandas=True), format=date_format,
+                                 unit='s', error_is_null=True)
+            return pd.DatetimeIndex(parsed.to_numpy(zero_copy_only=False)).as_unit('ns')
+        except (pa.ArrowException, TypeError, ValueError):
+            pass
+    return pd.DatetimeIndex(pd.to_datetime(values, format=date_format, errors='coerce', cache=True)).as_unit('ns')
+
+
+def _parse_chunk(chunk, date_format):
+    chunk.columns = chunk.columns.str.strip()
+    if DATE_COLUMN not in chunk.columns:
+        raise ValueError(f"Kolom '{DATE_COLUMN}' tidak ditemukan.")
+
+    chunk.index = parse_dates(chunk.pop(DATE_COLUMN), date_format).rename(DATE_COLUMN)
+    chunk = chunk[chunk.index.notna()]
+
+    for col in chunk.columns:
+        # Kolom yang tidak lolos parser numerik (mis. berisi simbol mata uang) dibersihkan manual
+        if not pd.api.types.is_numeric_dtype(chunk[col]):
+            chunk[col] = parse_european_numbers(chunk[col])
+    return chunk.astype(float)
+
+
+def iter_currency_csv(source, sep=';', date_format=DATE_FORMAT, chunksize=CHUNKSIZE):
+    """
+    Membaca file CSV nilai tukar per blok `chunksize` baris.
+    Setiap blok adalah DataFrame ber-indeks tanggal dengan kolom harga float
+    (urutan baris mengikuti file, belum diurutkan).
+    """
+    reader = pd.read_csv(source, delimiter=sep, decimal=',', thousands='.', chunksize=chunksize)
+    with reader:
+        for chunk in reader:
+            yield _parse_chunk(chunk, date_format)
+
+
+def read_currency_csv(source, sep=';', date_format=DATE_FORMAT, chunksize=CHUNKSIZE):
+    """
+    Membaca file CSV nilai tukar (path atau objek file) menjadi DataFrame
+    ber-indeks tanggal yang terurut, dengan semua kolom harga sudah numerik.
+    """
+    chunks = list(iter_currency_csv(source, sep=sep, date_format=date_format, chunksize=chunksize))
+    df = pd.concat(chunks) if len(chunks) > 1 else chunks[0]
+    return df.sort_index(kind='stable')
+
+
+def file_digest(source, block_size=1024 ** 2):
+    """Hash SHA-256 isi file dari path atau objek file (posisi baca dikembalikan ke awal)."""
+    digest = hashlib.sha256()
+    if hasattr(source, 'read'):
+        source.seek(0)
+        for block in iter(lambda: source.read(block_size), b''):
+            digest.update(block if isinstance(block, bytes) else block.encode())
+        source.seek(0)
+    else:
+        with open(source, 'rb') as f:
+            for block in iter(lambda: f.read(block_size), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+class DataCache:
+    """
+    Cache LRU di memori untuk DataFrame hasil parse, dikunci oleh hash isi file
+    dan opsi parser. Aman dipakai bersama oleh beberapa sesi (thread) Streamlit.
+    """
+
+    def __init__(self, max_entries=8):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, key, load_fn):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+        value = load_fn()
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, digest):
+        """Membuang semua entri untuk file dengan hash `digest`."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == digest]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+DATA_CACHE = DataCache()
+
+
+def load_currency_data(source=None, sep=';', date_format=DATE_FORMAT, cache=DATA_CACHE):
+    """
+    Memuat file CSV nilai tukar lewat cache bersama. `source` berupa path, objek file
+    (mis. UploadedFile Streamlit), atau None untuk data contoh repositori.
+    Mengembalikan salinan DataFrame sehingga pemanggil bebas mengubahnya.
+    """
+    if source is None:
+        source = DEFAULT_DATA_FILE
+    if cache is None:
+        return read_currency_csv(source, sep=sep, date_format=date_format)
+
+    key = (file_digest(source), sep, date_format)
+
+    def load():
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        return read_currency_csv(source, sep=sep, date_format=date_format)
+
+    return cache.get_or_load(key, load).copy()
@@ -0,0 +1,228 @@
+"""
+Uji diagnostik deret return dan residual model.
+
+* `stationarity_table`: ADF, KPSS, Ljung-Box dan ARCH-LM untuk banyak deret sekaligus
+  (paralel di process pool), disimpan di FitCache dengan kunci sidik jari deret
+  sehingga data yang sama tidak pernah diuji dua kali.
+* `residual_diagnostics`: Ljung-Box untuk semua lag 1..L pada residual dan residual
+  kuadrat, ARCH-LM, Jarque-Bera dan Kolmogorov-Smirnov untuk banyak residual dalam
+  satu panggilan. Autokovarians dihitung sekali per matriks residual lewat FFT
+  (kolom-kolom dengan panjang sama diproses bersama), bukan sekali per uji per lag.
+"""
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy import fft, special
+
+from .cache import cache_key
+
+STATIONARITY_LAGS = 10
+RESIDUAL_LAGS = 10
+ALPHA = 0.05
+
+
+def autocorrelations(x, nlags):
+    """
+    Autokorelasi lag 1..`nlags` setiap kolom `x` (T, M) lewat FFT, dengan pembagi T
+    seperti `statsmodels.tsa.stattools.acf`. Mengembalikan array (nlags, M).
+    """
+    x = np.asarray(x, dtype=float)
+    x = x - x.mean(axis=0)
+    n = x.shape[0]
+    nfft = fft.next_fast_len(2 * n - 1, real=True)
+    spectrum = fft.rfft(x, nfft, axis=0)
+    acov = fft.irfft(spectrum * np.conj(spectrum), nfft, axis=0)[:nlags + 1]
+    return acov[1:] / acov[0]
+
+
+def ljung_box(x, nlags):
+    """Statistik dan p-value Ljung-Box untuk semua lag 1..`nlags`, masing-masing berukuran (nlags, M)."""
+    n = np.asarray(x).shape[0]
+    acf = autocorrelations(x, nlags)
+    k = np.arange(1, nlags + 1)[:, None]
+    stat = n * (n + 2) * np.cumsum(acf ** 2 / (n - k), axis=0)
+    return stat, special.chdtrc(k, stat)
+
+
+def arch_lm(x, nlags):
+    """
+    Uji ARCH-LM Engle (sama dengan `statsmodels.stats.diagnostic.het_arch`) untuk setiap
+    kolom: regresi e_t^2 pada `nlags` lag-nya, LM = (T - nlags) * R^2. Seperti het_arch,
+    `x` dikuadratkan apa adanya; kurangi rata-ratanya lebih dulu bila diperlukan.
+    """
+    x = np.asarray(x, dtype=float)
+    squared = x * x
+    windows = np.lib.stride_tricks.sliding_window_view(squared, nlags + 1, axis=0)  # (T - L, M, L + 1)
+    windows = windows - windows.mean(axis=0)
+    y, lagged = windows[..., nlags], windows[..., :nlags]
+    xtx = np.einsum('tml,tmk->mlk', lagged, lagged)
+    xty = np.einsum('tml,tm->ml', lagged, y)
+    beta = np.linalg.solve(xtx, xty[..., None])[..., 0]
+    r_squared = np.einsum('ml,ml->m', beta, xty) / np.einsum('tm,tm->m', y, y)
+    stat = windows.shape[0] * r_squared
+    return stat, special.chdtrc(nlags, stat)
+
+
+def jarque_bera(x):
+    """Statistik Jarque-Bera, p-value, skewness dan kurtosis setiap kolom."""
+    x = np.asarray(x, dtype=float)
+    centered = x - x.mean(axis=0)
+    squared = centered * centered
+    m2 = squared.mean(axis=0)
+    skew = (squared * centered).mean(axis=0) / m2 ** 1.5
+    kurtosis = (squared * squared).mean(axis=0) / m2 ** 2
+    stat = x.shape[0] / 6.0 * (skew ** 2 + (kurtosis - 3.0) ** 2 / 4.0)
+    return stat, special.chdtrc(2, stat), skew, kurtosis
+
+
+def ks_normal(x):
+    """Uji Kolmogorov-Smirnov residual terstandar terhadap N(0, 1) untuk setiap kolom."""
+    from scipy import stats
+
+    x = np.asarray(x, dtype=float)
+    n = x.shape[0]
+    z = np.sort((x - x.mean(axis=0)) / x.std(axis=0), axis=0)
+    cdf = special.ndtr(z)
+    i = np.arange(1, n + 1)[:, None]
+    stat = np.maximum((i / n - cdf).max(axis=0), (cdf - (i - 1) / n).max(axis=0))
+    # Sama dengan scipy.stats.kstest(method='auto'): eksak sampai 10000 observasi
+    pvalue = stats.kstwo.sf(stat, n) if n <= 10000 else special.kolmogorov(stat * np.sqrt(n))
+    return stat, np.clip(pvalue, 0.0, 1.0)
+
+
+def _as_columns(residuals):
+    """Nama kolom dan nilai masing-masing (tanpa NaN) sebagai dict nama -> array 1-D."""
+    if isinstance(residuals, pd.Series):
+        residuals = {residuals.name if residuals.name is not None else 'resid': residuals}
+    elif isinstance(residuals, pd.DataFrame):
+        residuals = dict(zip(residuals.columns, residuals.to_numpy(dtype=float).T))
+    elif not isinstance(residuals, dict):
+        values = np.asarray(residuals, dtype=float)
+        residuals = {'resid': values} if values.ndim == 1 else dict(enumerate(values.T))
+    columns = {}
+    for name, values in residuals.items():
+        values = np.asarray(values, dtype=float)
+        columns[name] = values[~np.isnan(values)]
+    return columns
+
+
+def residual_diagnostics(residuals, lags=RESIDUAL_LAGS):
+    """
+    Diagnostik residual (atau residual terstandar) untuk satu atau banyak model.
+
+    `residuals` dapat berupa Series, DataFrame (satu kolom per model), dict nama -> deret,
+    atau array 1-D/2-D; NaN dibuang per kolom. Mengembalikan (ringkasan, ljung_box):
+    ringkasan per model berisi Ljung-Box pada lag `lags` untuk residual dan residual
+    kuadrat, ARCH-LM, Jarque-Bera dan KS; `ljung_box` berindeks (model, lag) untuk
+    semua lag 1..`lags`.
+    """
+    columns = _as_columns(residuals)
+    names = list(columns)
+    groups = {}
+    for name in names:
+        groups.setdefault(columns[name].size, []).append(name)
+
+    summary_parts, lb_parts = [], []
+    for n, group in groups.items():
+        x = np.column_stack([columns[name] for name in group])
+        lb_stat, lb_pvalue = ljung_box(x, lags)
+        lb_sq_stat, lb_sq_pvalue = ljung_box(x * x, lags)
+        arch_stat, arch_pvalue = arch_lm(x, lags)
+        jb_stat, jb_pvalue, skew, kurtosis = jarque_bera(x)
+        ks_stat, ks_pvalue = ks_normal(x)
+        summary_parts.append(pd.DataFrame({
+            'n_obs': n,
+            'lb_stat': lb_stat[-1], 'lb_pvalue': lb_pvalue[-1],
+            'lb_sq_stat': lb_sq_stat[-1], 'lb_sq_pvalue': lb_sq_pvalue[-1],
+            'arch_lm_stat': arch_stat, 'arch_lm_pvalue': arch_pvalue,
+            'jb_stat': jb_stat, 'jb_pvalue': jb_pvalue,
+            'skew': skew, 'kurtosis': kurtosis,
+            'ks_stat': ks_stat, 'ks_pvalue': ks_pvalue,
+        }, index=pd.Index(group, name='model')))
+        # Susun (lag, model) -> baris berurutan model lalu lag
+        lb_parts.append(pd.DataFrame({
+            'lb_stat': lb_stat.T.ravel(), 'lb_pvalue': lb_pvalue.T.ravel(),
+            'lb_sq_stat': lb_sq_stat.T.ravel(), 'lb_sq_pvalue': lb_sq_pvalue.T.ravel(),
+        }, index=pd.MultiIndex.from_product([group, range(1, lags + 1)], names=['model', 'lag'])))
+
+    summary = pd.concat(summary_parts).reindex(names)
+    ljung_box_table = pd.concat(lb_parts).reindex(pd.MultiIndex.from_product([names, range(1, lags + 1)],
+                                                                              names=['model', 'lag']))
+    return summary, ljung_box_table
+
+
+def stationarity_tests(series, lags=STATIONARITY_LAGS):
+    """
+    ADF (H0: akar unit), KPSS (H0: stasioner), Ljung-Box dan ARCH-LM pada `lags` lag
+    untuk satu deret. Mengembalikan dict statistik dan p-value.
+    """
+    from statsmodels.tsa.stattools import adfuller, kpss
+
+    values = np.asarray(pd.Series(series).dropna(), dtype=float)
+    with warnings.catch_warnings():
+        # KPSS memperingatkan bila p-value di luar tabel interpolasi (dibatasi 0.01-0.1)
+        warnings.simplefilter('ignore')
+        adf_stat, adf_pvalue, adf_lags = adfuller(values)[:3]
+        kpss_stat, kpss_pvalue = kpss(values, regression='c', nlags='auto')[:2]
+    lb_stat, lb_pvalue = ljung_box(values[:, None], lags)
+    # Return belum tentu bermean nol: ARCH-LM diuji pada deviasi dari rata-rata
+    arch_stat, arch_pvalue = arch_lm((values - values.mean())[:, None], lags)
+    return {
+        'n_obs': int(values.size),
+        'adf_stat': float(adf_stat),
+        'adf_pvalue': float(adf_pvalue),
+        'adf_lags': int(adf_lags),
+        'kpss_stat': float(kpss_stat),
+        'kpss_pvalue': float(kpss_pvalue),
+        'lb_stat': float(lb_stat[-1, 0]),
+        'lb_pvalue': float(lb_pvalue[-1, 0]),
+        'arch_lm_stat': float(arch_stat[0]),
+        'arch_lm_pvalue': float(arch_pvalue[0]),
+    }
+
+
+def _summarize(row, alpha=ALPHA):
+    # Stasioner bila ADF menolak akar unit dan KPSS tidak menolak stasioneritas
+    row['stationary'] = bool(row['adf_pvalue'] < alpha and row['kpss_pvalue'] >= alpha)
+    row['arch_effect'] = bool(row['arch_lm_pvalue'] < alpha)
+    return row
+
+
+def stationarity_table(data, lags=STATIONARITY_LAGS, max_workers=None, cache=None):
+    """
+    Menjalankan `stationarity_tests` untuk setiap kolom `data` (DataFrame atau dict
+    nama -> deret). Deret yang sudah ada di `cache` (FitCache) tidak dihitung ulang;
+    sisanya dihitung paralel (`max_workers=1` untuk serial).
+    Mengembalikan DataFrame ber-indeks nama deret.
+    """
+    series_map = {name: pd.Series(values).dropna() for name, values in dict(data).items()}
+    results, pending = {}, {}
+    for name, series in series_map.items():
+        key = cache_key('stationarity', series, lags=lags)
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            results[name] = cached
+        else:
+            pending[name] = key
+
+    if pending:
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, len(pending)))
+        names = list(pending)
+        if max_workers == 1:
+            computed = [stationarity_tests(series_map[name], lags) for name in names]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(stationarity_tests, series_map[name], lags) for name in names]
+                computed = [future.result() for future in futures]
+        for name, row in zip(names, computed):
+            results[name] = row
+            if cache is not None:
+                cache.put(pending[name], row)
+
+    rows = [_summarize(dict(results[name])) for name in series_map]
+    return pd.DataFrame(rows, index=pd.Index(list(series_map), name='series'))
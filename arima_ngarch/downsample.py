@@ -0,0 +1,96 @@
+"""
+Penipisan (decimation) deret waktu panjang sebelum dikirim ke grafik Plotly.
+
+Dengan data tick bertahun-tahun, mengirim semua titik ke browser membuat JSON
+grafik berukuran puluhan MB. `downsample` membatasi jumlah titik per trace:
+
+* `'lttb'` (Largest-Triangle-Three-Buckets): mempertahankan bentuk visual garis,
+  cocok untuk harga, return dan volatilitas bersyarat;
+* `'minmax'`: menyimpan titik minimum dan maksimum setiap bucket sehingga lonjakan
+  tidak pernah hilang, cocok untuk deret runcing seperti kuadrat return.
+
+Pemotongan rentang (`start`/`end`) dilakukan sebelum penipisan, sehingga rentang yang
+diperbesar ditampilkan dengan resolusi penuh begitu jumlah titiknya di bawah batas.
+"""
+import numpy as np
+import pandas as pd
+
+MAX_POINTS = 2000
+METHODS = ('lttb', 'minmax')
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Posisi `n_out` titik terpilih LTTB dari (x, y); x harus naik.
+    Satu langkah numpy per bucket (bukan per titik), jadi tidak butuh numba.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = y.size
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    every = (n - 2) / (n_out - 2)
+    bounds = np.minimum((np.arange(n_out) * every).astype(np.int64) + 1, n)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = bounds[i], bounds[i + 1]
+        # Rata-rata bucket berikutnya sebagai titik ketiga segitiga
+        avg_x = x[end:bounds[i + 2]].mean()
+        avg_y = y[end:bounds[i + 2]].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+    return selected
+
+
+def minmax_indices(y, n_out):
+    """
+    Posisi titik pertama, terakhir, serta minimum dan maksimum setiap bucket, terurut.
+    Paling banyak `n_out` titik (minimal 4).
+    """
+    y = np.asarray(y, dtype=float)
+    n = y.size
+    n_out = max(int(n_out), 4)
+    if n_out >= n:
+        return np.arange(n)
+    buckets = max((n_out - 2) // 2, 1)
+    size = -(-n // buckets)
+    buckets = -(-n // size)
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = y
+    padded = padded.reshape(buckets, size)
+    # Padding kurang dari satu bucket, jadi setiap bucket memuat minimal satu nilai asli
+    offsets = np.arange(buckets) * size
+    lows = np.nanargmin(padded, axis=1) + offsets
+    highs = np.nanargmax(padded, axis=1) + offsets
+    return np.unique(np.concatenate([[0, n - 1], lows, highs]))
+
+
+def _positions(index):
+    if isinstance(index, pd.DatetimeIndex):
+        return index.asi8.astype(float)
+    if pd.api.types.is_numeric_dtype(index):
+        return np.asarray(index, dtype=float)
+    return np.arange(len(index), dtype=float)
+
+
+def downsample(series, max_points=MAX_POINTS, method='lttb', start=None, end=None):
+    """
+    Memotong `series` ke rentang [start, end] lalu menipiskannya menjadi paling banyak
+    `max_points` titik dengan `method` ('lttb' atau 'minmax'). Deret yang sudah cukup
+    pendek dikembalikan apa adanya (tanpa NaN).
+    """
+    if method not in METHODS:
+        raise ValueError(f"Metode penipisan harus salah satu dari {METHODS}.")
+    series = pd.Series(series).dropna()
+    if start is not None or end is not None:
+        series = series.sort_index().loc[start:end]
+    if max_points is None or len(series) <= max_points:
+        return series
+    if method == 'minmax':
+        positions = minmax_indices(series.to_numpy(dtype=float), max_points)
+    else:
+        positions = lttb_indices(_positions(series.index), series.to_numpy(dtype=float), max_points)
+    return series.iloc[positions]
@@ -0,0 +1,250 @@
+"""
+Job latar belakang untuk fit, forecast dan backtest yang lama.
+
+`JobManager` menjalankan fungsi mesin di pool worker lokal (thread atau proses) dan
+melacaknya dengan ID, sehingga pemanggil (halaman Streamlit) tidak terblokir dan
+dapat mengambil hasilnya pada eksekusi berikutnya. Fungsi yang mendukung argumen
+`progress` (`select_arima_order`, `select_ngarch_order`, `walk_forward_backtest`,
+`fit_currencies`, `bootstrap_price_intervals`, ...) melaporkan kemajuan lewat
+`JobProgress`. Pembatalan bersifat kooperatif: job yang belum mulai langsung batal,
+job yang berjalan berhenti pada laporan progres berikutnya, dan hasil job tanpa
+titik progres (satu kali fit) dibuang begitu selesai.
+
+Dengan `kind='thread'` (default) job berbagi proses dengan pemanggilnya; fungsi
+mesin yang berat tetap membagi kerjanya ke process pool masing-masing. Dengan
+`kind='process'` fungsi dan argumennya harus dapat di-pickle, dan status progres
+disimpan di `multiprocessing.Manager`.
+"""
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+
+KINDS = ('thread', 'process')
+STATUSES = ('pending', 'running', 'done', 'failed', 'cancelled')
+
+
+class JobCancelled(Exception):
+    """Dilempar di dalam job yang dibatalkan pada titik progres berikutnya."""
+
+
+class JobProgress:
+    """
+    Callback progres yang diteruskan ke fungsi job sebagai argumen `progress`:
+    `progress(selesai, total, pesan)`. Melempar JobCancelled bila job dibatalkan.
+    """
+
+    def __init__(self, state, cancel_event):
+        self._state = state
+        self._cancel = cancel_event
+
+    def __call__(self, done, total=None, message=None):
+        if self._cancel.is_set():
+            raise JobCancelled()
+        self._state.update({'done': done, 'total': total, 'message': message})
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+
+def _run_job(fn, args, kwargs, state, cancel_event):
+    # Dijalankan di worker: waktu mulai/selesai dicatat di state bersama
+    if cancel_event.is_set():
+        raise JobCancelled()
+    state['started'] = time.time()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        state['finished'] = time.time()
+
+
+class Job:
+    """
+    Satu job yang dikirim ke `JobManager`. `meta` berisi data pemanggil (tidak dikirim
+    ke worker), misalnya identitas fit yang menjadi dasar sebuah tabel hasil.
+    """
+
+    def __init__(self, job_id, label, future, state, cancel_event, meta=None):
+        self.id = job_id
+        self.label = label
+        self.meta = meta or {}
+        self.submitted = time.time()
+        self._future = future
+        self._state = state
+        self._cancel = cancel_event
+
+    @property
+    def status(self):
+        """Salah satu STATUSES."""
+        future = self._future
+        if future.cancelled():
+            return 'cancelled'
+        if not future.done():
+            return 'running' if 'started' in self._state else 'pending'
+        if self._cancel.is_set() or isinstance(future.exception(), JobCancelled):
+            return 'cancelled'
+        return 'failed' if future.exception() is not None else 'done'
+
+    def done(self):
+        """True bila job sudah selesai, gagal atau batal."""
+        return self._future.done()
+
+    def wait(self, timeout=None):
+        """Menunggu job selesai (paling lama `timeout` detik); True bila sudah selesai."""
+        wait([self._future], timeout=timeout)
+        return self.done()
+
+    @property
+    def progress(self):
+        """Fraksi selesai (0..1) dari laporan progres terakhir, atau None bila tidak diketahui."""
+        state = self._state
+        if self.status == 'done':
+            return 1.0
+        done, total = state.get('done'), state.get('total')
+        if done is None or not total:
+            return None
+        return min(1.0, done / total)
+
+    @property
+    def message(self):
+        return self._state.get('message')
+
+    @property
+    def elapsed(self):
+        """Lama job berjalan dalam detik (0 selama masih menunggu worker)."""
+        started = self._state.get('started')
+        if started is None:
+            return 0.0
+        return self._state.get('finished', time.time()) - started
+
+    @property
+    def error(self):
+        """Pesan kesalahan job yang gagal, atau None."""
+        if self.status != 'failed':
+            return None
+        exception = self._future.exception()
+        return f"{type(exception).__name__}: {exception}"
+
+    def result(self, timeout=None):
+        """Hasil fungsi job (menunggu bila belum selesai); JobCancelled untuk job yang dibatalkan."""
+        if self._cancel.is_set():
+            raise JobCancelled()
+        return self._future.result(timeout)
+
+    def to_dict(self):
+        return {'id': self.id, 'label': self.label, 'status': self.status, 'progress': self.progress,
+                'message': self.message, 'elapsed_s': self.elapsed, 'error': self.error}
+
+    def __repr__(self):
+        return f"<Job {self.id} {self.label!r}: {self.status}>"
+
+
+class JobManager:
+    """
+    Pool worker lokal untuk job latar belakang. `max_workers` job berjalan bersamaan
+    (default: jumlah CPU); job lain menunggu berstatus 'pending'. Paling banyak `keep`
+    job yang sudah selesai disimpan; yang tertua dilupakan lebih dulu.
+    """
+
+    def __init__(self, max_workers=None, kind='thread', keep=100):
+        if kind not in KINDS:
+            raise ValueError(f"Jenis pool harus salah satu dari {KINDS}.")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.kind = kind
+        self.keep = keep
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._executor = None
+        self._manager = None
+
+    def _new_executor(self):
+        if self.kind == 'thread':
+            return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='arima-ngarch-job')
+        return ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def _shared_state(self):
+        if self.kind == 'thread':
+            return {}, threading.Event()
+        if self._manager is None:
+            import multiprocessing
+
+            self._manager = multiprocessing.Manager()
+        return self._manager.dict(), self._manager.Event()
+
+    def submit(self, fn, *args, label=None, progress=False, meta=None, **kwargs):
+        """
+        Mengirim `fn(*args, **kwargs)` sebagai job dan mengembalikan `Job`. Dengan
+        `progress=True` fungsi menerima argumen `progress` (JobProgress).
+        """
+        state, cancel_event = self._shared_state()
+        if progress:
+            kwargs['progress'] = JobProgress(state, cancel_event)
+        job_id = uuid.uuid4().hex[:12]
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._new_executor()
+            try:
+                future = self._executor.submit(_run_job, fn, args, kwargs, state, cancel_event)
+            except BrokenProcessPool:
+                # Worker mati (mis. kehabisan memori): pool dibuat ulang untuk job berikutnya
+                self._executor = self._new_executor()
+                future = self._executor.submit(_run_job, fn, args, kwargs, state, cancel_event)
+            job = Job(job_id, label or getattr(fn, '__name__', 'job'), future, state, cancel_event, meta=meta)
+            self._jobs[job_id] = job
+            self._prune()
+        return job
+
+    def _prune(self):
+        finished = [job for job in self._jobs.values() if job.done()]
+        for job in sorted(finished, key=lambda job: job.submitted)[:max(0, len(finished) - self.keep)]:
+            del self._jobs[job.id]
+
+    def get(self, job_id):
+        """Job dengan ID `job_id`, atau None bila tidak dikenal (atau sudah dilupakan)."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self):
+        """Semua job yang dilacak, berurutan menurut waktu kirim."""
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda job: job.submitted)
+
+    def cancel(self, job_id):
+        """Membatalkan job; mengembalikan False bila job tidak dikenal atau sudah selesai."""
+        job = self.get(job_id)
+        if job is None or job.done():
+            return False
+        job._cancel.set()
+        job._future.cancel()
+        return True
+
+    def forget(self, job_id):
+        """Berhenti melacak job yang sudah selesai (job yang berjalan tetap dilacak)."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job.done():
+                del self._jobs[job_id]
+
+    def table(self):
+        """Ringkasan semua job sebagai DataFrame ber-indeks ID."""
+        rows = [job.to_dict() for job in self.jobs()]
+        return pd.DataFrame(rows, columns=['id', 'label', 'status', 'progress', 'message', 'elapsed_s',
+                                           'error']).set_index('id')
+
+    def shutdown(self, wait=True):
+        """Membatalkan job yang belum mulai dan menutup pool."""
+        with self._lock:
+            for job in self._jobs.values():
+                if not job.done():
+                    job._cancel.set()
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait, cancel_futures=True)
+                self._executor = None
+            if self._manager is not None:
+                self._manager.shutdown()
+                self._manager = None
@@ -0,0 +1,334 @@
+"""
+Proses volatilitas NGARCH(1,1) Engle-Ng (nonlinear asymmetric GARCH):
+
+    sigma2_t = omega + alpha * (e_{t-1} - theta * sigma_{t-1})^2 + beta * sigma2_{t-1}
+
+`vol='Garch'` dengan `o=1` di arch adalah GJR-GARCH, bukan NGARCH. Modul ini
+menyediakan:
+
+* rekursi varians dan log-likelihood Student-t beserta gradien analitiknya
+  dalam satu kernel (dikompilasi dengan numba bila tersedia),
+* kelas `NGARCH` yang dapat dipasang ke `arch` (ZeroMean(..., volatility=NGARCH()))
+  sehingga ringkasan, standar error dan forecast tetap memakai jalur arch,
+* `fit_ngarch_mle`, optimasi SLSQP dengan gradien analitik yang solusinya
+  langsung dibungkus sebagai ARCHModelResult (tanpa optimasi ulang di arch).
+"""
+import itertools
+import math
+from copy import deepcopy
+
+import numpy as np
+from scipy import optimize, special
+
+from arch import arch_model
+from arch.univariate.volatility import VarianceForecast, VolatilityProcess
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - numba bersifat opsional
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+PARAMETER_NAMES = ['omega', 'alpha[1]', 'theta[1]', 'beta[1]']
+
+
+@njit(cache=True)
+def _bounds_check(sigma2, lower, upper):
+    # Mengembalikan (varians terpotong, turunannya terhadap varians asli) seperti arch:
+    # di atas batas atas varians menjadi upper + log(sigma2 / upper), turunannya 1 / sigma2
+    if sigma2 < lower:
+        return lower, 0.0
+    if sigma2 > upper:
+        if math.isinf(sigma2):
+            return upper + 1000.0, 0.0
+        return upper + math.log(sigma2 / upper), 1.0 / sigma2
+    return sigma2, 1.0
+
+
+@njit(cache=True)
+def ngarch_recursion(parameters, resids, sigma2, backcast, var_bounds):
+    """Rekursi varians bersyarat NGARCH(1,1); hasil ditulis ke `sigma2`."""
+    omega, alpha, theta, beta = parameters[0], parameters[1], parameters[2], parameters[3]
+    nobs = resids.shape[0]
+    for t in range(nobs):
+        if t == 0:
+            value = omega + alpha * backcast * (1.0 + theta * theta) + beta * backcast
+        else:
+            u = resids[t - 1] - theta * math.sqrt(sigma2[t - 1])
+            value = omega + alpha * u * u + beta * sigma2[t - 1]
+        sigma2[t], _ = _bounds_check(value, var_bounds[t, 0], var_bounds[t, 1])
+    return sigma2
+
+
+@njit(cache=True)
+def _ngarch_t_kernel(parameters, resids, backcast, var_bounds, sigma2):
+    omega, alpha, theta, beta, nu = parameters[0], parameters[1], parameters[2], parameters[3], parameters[4]
+    nobs = resids.shape[0]
+    nu_m2 = nu - 2.0
+
+    d_omega = d_alpha = d_theta = d_beta = 0.0
+    g_omega = g_alpha = g_theta = g_beta = g_nu = 0.0
+    loglik = 0.0
+    for t in range(nobs):
+        if t == 0:
+            value = omega + alpha * backcast * (1.0 + theta * theta) + beta * backcast
+            d_omega = 1.0
+            d_alpha = backcast * (1.0 + theta * theta)
+            d_theta = 2.0 * alpha * theta * backcast
+            d_beta = backcast
+        else:
+            prev = sigma2[t - 1]
+            s = math.sqrt(prev)
+            u = resids[t - 1] - theta * s
+            value = omega + alpha * u * u + beta * prev
+            c = beta - alpha * theta * u / s
+            d_omega = 1.0 + c * d_omega
+            d_alpha = u * u + c * d_alpha
+            d_theta = -2.0 * alpha * u * s + c * d_theta
+            d_beta = prev + c * d_beta
+
+        h, scale = _bounds_check(value, var_bounds[t, 0], var_bounds[t, 1])
+        sigma2[t] = h
+        d_omega *= scale
+        d_alpha *= scale
+        d_theta *= scale
+        d_beta *= scale
+
+        a = resids[t] * resids[t] / (h * nu_m2)
+        log1pa = math.log1p(a)
+        loglik += -0.5 * math.log(h) - 0.5 * (nu + 1.0) * log1pa
+
+        dl_dh = -0.5 / h + 0.5 * (nu + 1.0) * (a / h) / (1.0 + a)
+        g_omega += dl_dh * d_omega
+        g_alpha += dl_dh * d_alpha
+        g_theta += dl_dh * d_theta
+        g_beta += dl_dh * d_beta
+        g_nu += -0.5 * log1pa + 0.5 * (nu + 1.0) * a / (nu_m2 * (1.0 + a))
+
+    return loglik, g_omega, g_alpha, g_theta, g_beta, g_nu
+
+
+def ngarch_t_loglik(parameters, resids, backcast, var_bounds, sigma2=None):
+    """
+    Log-likelihood Student-t (terstandar) NGARCH(1,1) dan gradien analitiknya
+    terhadap (omega, alpha, theta, beta, nu) dalam satu lintasan data.
+    """
+    parameters = np.asarray(parameters, dtype=float)
+    resids = np.ascontiguousarray(resids, dtype=float)
+    if sigma2 is None:
+        sigma2 = np.empty_like(resids)
+    loglik, *grad = _ngarch_t_kernel(parameters, resids, float(backcast), var_bounds, sigma2)
+
+    nu = parameters[4]
+    nobs = resids.shape[0]
+    constant = special.gammaln((nu + 1) / 2) - special.gammaln(nu / 2) - 0.5 * np.log(np.pi * (nu - 2))
+    d_constant = 0.5 * special.digamma((nu + 1) / 2) - 0.5 * special.digamma(nu / 2) - 0.5 / (nu - 2)
+    grad = np.asarray(grad)
+    grad[4] += nobs * d_constant
+    return loglik + nobs * constant, grad
+
+
+class NGARCH(VolatilityProcess):
+    """
+    Proses volatilitas NGARCH(1,1) Engle-Ng untuk dipakai bersama model mean arch.
+    """
+
+    _updatable = False
+
+    def __init__(self):
+        super().__init__()
+        self.p, self.o, self.q = 1, 0, 1
+        self._num_params = 4
+        self._name = 'NGARCH'
+
+    def parameter_names(self):
+        return list(PARAMETER_NAMES)
+
+    def bounds(self, resids):
+        v = float(np.mean(np.asarray(resids) ** 2))
+        return [(1e-8 * v, 10.0 * v), (0.0, 1.0), (-10.0, 10.0), (0.0, 1.0)]
+
+    def constraints(self):
+        # omega, alpha, beta >= 0 dan alpha + beta <= 1 (syarat perlu stasioneritas).
+        # Syarat penuh alpha * (1 + theta^2) + beta < 1 tidak linear; dijaga oleh var_bounds.
+        a = np.array([
+            [1.0, 0.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0, 0.0],
+            [0.0, 0.0, 0.0, 1.0],
+            [0.0, -1.0, 0.0, -1.0],
+        ])
+        b = np.array([0.0, 0.0, 0.0, -1.0])
+        return a, b
+
+    def compute_variance(self, parameters, resids, sigma2, backcast, var_bounds):
+        return ngarch_recursion(np.asarray(parameters, dtype=float), np.ascontiguousarray(resids, dtype=float),
+                                sigma2, float(backcast), var_bounds)
+
+    def starting_values(self, resids):
+        resids = np.asarray(resids, dtype=float)
+        target = float(np.mean(resids ** 2))
+        var_bounds = self.variance_bounds(resids)
+        backcast = self.backcast(resids)
+        best, best_llf = None, -np.inf
+        for alpha, theta, persistence in itertools.product([0.03, 0.08, 0.15], [0.0, 0.5, 1.0], [0.9, 0.97]):
+            beta = persistence - alpha * (1.0 + theta ** 2)
+            if beta <= 0:
+                continue
+            sv = np.array([(1.0 - persistence) * target, alpha, theta, beta])
+            llf = self._gaussian_loglikelihood(sv, resids, backcast, var_bounds)
+            if llf > best_llf:
+                best, best_llf = sv, llf
+        return best
+
+    def simulate(self, parameters, nobs, rng, burn=500, initial_value=None):
+        omega, alpha, theta, beta = np.asarray(parameters, dtype=float)
+        errors = rng(nobs + burn)
+        if initial_value is None:
+            persistence = alpha * (1.0 + theta ** 2) + beta
+            initial_value = omega / (1.0 - persistence) if persistence < 1 else omega
+        sigma2 = np.empty(nobs + burn)
+        data = np.empty(nobs + burn)
+        sigma2[0] = initial_value
+        data[0] = errors[0] * np.sqrt(sigma2[0])
+        for t in range(1, nobs + burn):
+            u = data[t - 1] - theta * np.sqrt(sigma2[t - 1])
+            sigma2[t] = omega + alpha * u * u + beta * sigma2[t - 1]
+            data[t] = errors[t] * np.sqrt(sigma2[t])
+        return data[burn:], sigma2[burn:]
+
+    def _check_forecasting_method(self, method, horizon):
+        return
+
+    def _analytic_forecast(self, parameters, resids, backcast, var_bounds, start, horizon):
+        _, forecasts = self._one_step_forecast(parameters, np.asarray(resids, dtype=float), backcast,
+                                               var_bounds, horizon, start)
+        omega, alpha, theta, beta = parameters
+        # E[(e - theta*sigma)^2 | sigma2] = sigma2 * (1 + theta^2) untuk inovasi simetris
+        persistence = alpha * (1.0 + theta ** 2) + beta
+        for h in range(1, horizon):
+            forecasts[:, h] = omega + persistence * forecasts[:, h - 1]
+        return VarianceForecast(forecasts)
+
+    def _simulation_forecast(self, parameters, resids, backcast, var_bounds, start, horizon, simulations, rng):
+        _, forecasts = self._one_step_forecast(parameters, np.asarray(resids, dtype=float), backcast,
+                                               var_bounds, horizon, start)
+        omega, alpha, theta, beta = parameters
+        t = resids.shape[0]
+        paths = np.empty((t - start, simulations, horizon))
+        shocks = np.empty((t - start, simulations, horizon))
+        for i in range(start, t):
+            loc = i - start
+            std_shocks = rng((simulations, horizon))
+            paths[loc, :, 0] = forecasts[loc, 0]
+            shocks[loc, :, 0] = std_shocks[:, 0] * np.sqrt(paths[loc, :, 0])
+            for h in range(1, horizon):
+                u = shocks[loc, :, h - 1] - theta * np.sqrt(paths[loc, :, h - 1])
+                paths[loc, :, h] = omega + alpha * u * u + beta * paths[loc, :, h - 1]
+                shocks[loc, :, h] = std_shocks[:, h] * np.sqrt(paths[loc, :, h])
+        return VarianceForecast(paths.mean(1), paths, shocks)
+
+
+def ngarch_model(residuals, dist='t'):
+    """Model arch ber-mean nol dengan volatilitas NGARCH(1,1) Engle-Ng."""
+    model = arch_model(residuals, mean='zero', dist=dist)
+    model.volatility = NGARCH()
+    return model
+
+
+def fit_ngarch_mle(residuals, starting_values=None, maxiter=500):
+    """
+    Estimasi MLE NGARCH(1,1)-t dengan gradien analitik (SLSQP).
+    Optimasi dilakukan pada residual yang diskalakan ke varians 1 (hanya omega
+    yang bergantung skala), lalu omega dikembalikan ke skala asli.
+    Mengembalikan scipy OptimizeResult; `result.x` = (omega, alpha, theta, beta, nu).
+    """
+    resids = np.ascontiguousarray(np.asarray(residuals, dtype=float))
+    scale = 1.0 / float(np.std(resids))
+    resids = resids * scale
+
+    volatility = NGARCH()
+    backcast = volatility.backcast(resids)
+    var_bounds = volatility.variance_bounds(resids)
+    sigma2 = np.empty_like(resids)
+
+    if starting_values is None:
+        starting_values = np.append(volatility.starting_values(resids), 8.0)
+    else:
+        starting_values = np.array(starting_values, dtype=float)
+        starting_values[0] *= scale ** 2
+    bounds = volatility.bounds(resids) + [(2.05, 500.0)]
+    nobs = resids.shape[0]
+
+    def objective(params):
+        loglik, grad = ngarch_t_loglik(params, resids, backcast, var_bounds, sigma2)
+        return -loglik / nobs, -grad / nobs
+
+    def persistence(params):
+        return 1.0 - params[1] * (1.0 + params[2] ** 2) - params[3]
+
+    def persistence_jac(params):
+        return np.array([0.0, -(1.0 + params[2] ** 2), -2.0 * params[1] * params[2], -1.0, 0.0])
+
+    result = optimize.minimize(
+        objective, starting_values, jac=True, method='SLSQP', bounds=bounds,
+        constraints=[{'type': 'ineq', 'fun': persistence, 'jac': persistence_jac}],
+        options={'maxiter': maxiter, 'ftol': 1e-10},
+    )
+    result.x[0] /= scale ** 2
+    # Log-likelihood pada skala asli berbeda sebesar -nobs * log(scale)
+    result.fun = result.fun - np.log(scale)
+    return result
+
+
+def _mle_result(model, mle):
+    """
+    ARCHModelResult dari solusi `fit_ngarch_mle`, dibangun seperti akhir `ARCHModel.fit`.
+    Standar error dihitung arch (robust, turunan numerik) saat pertama kali diminta.
+    """
+    from arch.univariate.base import ARCHModelResult
+
+    params = np.asarray(mle.x, dtype=float)
+    model._adjust_sample(None, None)
+    resids = model.resids(np.empty(0))
+    volatility = model.volatility
+    model._backcast = backcast = volatility.backcast(resids)
+    model._var_bounds = var_bounds = volatility.variance_bounds(resids)
+    sigma2 = np.zeros(resids.shape[0])
+    loglik = -model._loglikelihood(params, sigma2, backcast, var_bounds)
+    mle.fun = -loglik
+    try:
+        r2 = model._r2(np.empty(0))
+    except NotImplementedError:
+        r2 = np.nan
+
+    first_obs, last_obs = model._fit_indices
+    resids_final = np.full(model._y.shape, np.nan)
+    resids_final[first_obs:last_obs] = resids
+    vol_final = np.full(model._y.shape, np.nan)
+    vol_final[first_obs:last_obs] = np.sqrt(sigma2)
+    return ARCHModelResult(params, None, r2, resids_final, vol_final, 'robust', model._y_series,
+                           model._all_parameter_names(), loglik, model._is_pandas, mle, first_obs, last_obs,
+                           deepcopy(model))
+
+
+def fit_engle_ng(residuals, dist='t', starting_values=None):
+    """
+    Melatih NGARCH(1,1). Untuk distribusi Student-t, hasilnya dibangun langsung dari
+    optimasi cepat dengan gradien analitik (`fit_ngarch_mle`): fit ulang arch dari solusi
+    itu sering berhenti di iterasi pertama ("Inequality constraints incompatible") karena
+    arch mengoptimasi pada skala asli residual dengan kendala linear alpha + beta <= 1.
+    Fit arch hanya dipakai untuk distribusi lain atau bila MLE gagal konvergen.
+    """
+    model = ngarch_model(residuals, dist=dist)
+    if dist == 't':
+        mle = fit_ngarch_mle(residuals, starting_values=starting_values)
+        if mle.success and np.all(np.isfinite(mle.x)):
+            return _mle_result(model, mle)
+        if np.all(np.isfinite(mle.x)):
+            starting_values = mle.x
+    return model.fit(disp='off', starting_values=starting_values)
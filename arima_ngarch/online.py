@@ -0,0 +1,207 @@
+"""
+Pembaruan online (streaming) untuk model volatilitas yang sudah dilatih.
+
+`NgarchFilter` memajukan rekursi varians bersyarat satu langkah per return baru
+dengan parameter tetap, O(1) per observasi, tanpa melatih ulang. Pelatihan ulang
+penuh hanya dijadwalkan bila terdeteksi drift pada residual terstandar.
+
+`OnlineArimaNgarch` menggabungkan pembaruan state Kalman ARIMA (`ArimaArtifact.update`)
+dengan filter NGARCH: setiap return baru menghasilkan residual ARIMA, prediksi mean
+satu langkah ke depan, dan varians bersyarat satu langkah ke depan.
+"""
+from collections import deque
+
+import numpy as np
+
+from .artifacts import ArimaArtifact
+from .ngarch import NGARCH
+
+
+def _param_blocks(params, p, o, q):
+    params = np.asarray(params, dtype=float)
+    omega = params[0]
+    alpha = params[1:1 + p]
+    gamma = params[1 + p:1 + p + o]
+    beta = params[1 + p + o:1 + p + o + q]
+    return omega, alpha, gamma, beta
+
+
+class NgarchFilter:
+    """
+    Filter varians bersyarat untuk model GARCH/NGARCH(p, o, q) ber-mean nol
+    (spesifikasi `fit_ngarch`/`fit_garch`):
+
+        sigma2_t = omega + sum(alpha_i * e_{t-i}^2) + sum(gamma_j * e_{t-j}^2 * 1[e_{t-j} < 0])
+                   + sum(beta_k * sigma2_{t-k})
+
+    atau, dengan `kind='engle-ng'` (parameter omega, alpha, theta, beta):
+
+        sigma2_t = omega + alpha * (e_{t-1} - theta * sigma_{t-1})^2 + beta * sigma2_{t-1}
+
+    Drift dideteksi dengan EWMA dari z_t^2 (z_t = e_t / sigma_t), yang seharusnya
+    berada di sekitar 1 bila parameter masih sesuai dengan data.
+    """
+
+    def __init__(self, params, p, o, q, last_resid, last_variance, drift_halflife=50,
+                 drift_threshold=0.5, drift_min_obs=20, refit_fn=None, history=None, kind='gjr'):
+        self.kind = kind
+        self.p, self.o, self.q = int(p), int(o), int(q)
+        self.params = np.asarray(params, dtype=float)
+        if kind == 'engle-ng':
+            self.p, self.o, self.q = 1, 0, 1
+            self.omega, alpha, self.theta, beta = self.params
+            self.alpha, self.gamma, self.beta = np.array([alpha]), np.empty(0), np.array([beta])
+        else:
+            self.theta = 0.0
+            self.omega, self.alpha, self.gamma, self.beta = _param_blocks(self.params, self.p, self.o, self.q)
+
+        max_lag = max(self.p, self.o, 1)
+        self._resid = deque(np.asarray(last_resid, dtype=float)[-max_lag:], maxlen=max_lag)
+        self._variance = deque(np.asarray(last_variance, dtype=float)[-max(self.q, 1):], maxlen=max(self.q, 1))
+
+        self.drift_halflife = drift_halflife
+        self.drift_decay = 0.5 ** (1.0 / drift_halflife)
+        self.drift_threshold = drift_threshold
+        self.drift_min_obs = drift_min_obs
+        self.refit_fn = refit_fn
+        self.history = list(history) if history is not None else None
+
+        self.n_updates = 0
+        self.n_refits = 0
+        self.ewma_z2 = 1.0
+        self.next_variance = self._recursion()
+
+    @classmethod
+    def from_fit(cls, vol_fit, refit_fn=None, **kwargs):
+        """
+        Membuat filter dari hasil `fit_ngarch`/`fit_garch` (ARCHModelResult).
+        Dengan `refit_fn(residual_array) -> ARCHModelResult`, filter melatih ulang
+        dirinya sendiri saat drift terdeteksi.
+        """
+        volatility = vol_fit.model.volatility
+        resid = np.asarray(vol_fit.resid, dtype=float)
+        variance = np.asarray(vol_fit.conditional_volatility, dtype=float) ** 2
+        n_mean = vol_fit.model.num_params
+        return cls(
+            np.asarray(vol_fit.params)[n_mean:n_mean + volatility.num_params],
+            volatility.p, volatility.o, volatility.q,
+            last_resid=resid, last_variance=variance,
+            refit_fn=refit_fn, history=resid if refit_fn is not None else None,
+            kind='engle-ng' if isinstance(volatility, NGARCH) else 'gjr',
+            **kwargs,
+        )
+
+    def _recursion(self):
+        resid = list(self._resid)[::-1]        # resid[0] = e_{t}, resid[1] = e_{t-1}, ...
+        variance = list(self._variance)[::-1]
+        if self.kind == 'engle-ng':
+            u = resid[0] - self.theta * variance[0] ** 0.5
+            return self.omega + self.alpha[0] * u * u + self.beta[0] * variance[0]
+        sigma2 = self.omega
+        for i in range(self.p):
+            sigma2 += self.alpha[i] * resid[i] ** 2
+        for j in range(self.o):
+            if resid[j] < 0:
+                sigma2 += self.gamma[j] * resid[j] ** 2
+        for k in range(self.q):
+            sigma2 += self.beta[k] * variance[k]
+        return sigma2
+
+    @property
+    def drift_detected(self):
+        return self.n_updates >= self.drift_min_obs and abs(self.ewma_z2 - 1.0) > self.drift_threshold
+
+    def update(self, resid):
+        """
+        Memasukkan satu residual baru dan mengembalikan varians bersyarat
+        satu langkah berikutnya.
+        """
+        resid = float(resid)
+        sigma2 = self.next_variance
+        z2 = resid * resid / sigma2
+        self.ewma_z2 = self.drift_decay * self.ewma_z2 + (1.0 - self.drift_decay) * z2
+
+        self._resid.append(resid)
+        self._variance.append(sigma2)
+        self.n_updates += 1
+        if self.history is not None:
+            self.history.append(resid)
+
+        self.next_variance = self._recursion()
+        if self.refit_fn is not None and self.drift_detected:
+            self.refit()
+        return self.next_variance
+
+    def update_many(self, resids):
+        """Memasukkan beberapa residual sekaligus; mengembalikan varians satu langkah ke depan setelah tiap residual."""
+        return np.array([self.update(r) for r in resids])
+
+    def refit(self):
+        """Melatih ulang penuh dengan `refit_fn` pada seluruh riwayat lalu mengganti parameter filter."""
+        fresh = NgarchFilter.from_fit(self.refit_fn(np.asarray(self.history)), refit_fn=self.refit_fn,
+                                      drift_halflife=self.drift_halflife,
+                                      drift_threshold=self.drift_threshold, drift_min_obs=self.drift_min_obs)
+        fresh.n_refits = self.n_refits + 1
+        self.__dict__.update(fresh.__dict__)
+        return self
+
+    def forecast(self, horizon=1):
+        """Prediksi varians `horizon` langkah ke depan (ekspektasi, e^2 diganti sigma^2)."""
+        resid = list(self._resid)
+        variance = list(self._variance)
+        out = np.empty(horizon)
+        out[0] = self.next_variance
+        if self.kind == 'engle-ng':
+            persistence = self.alpha[0] * (1.0 + self.theta ** 2) + self.beta[0]
+            for h in range(1, horizon):
+                out[h] = self.omega + persistence * out[h - 1]
+            return out
+        # Untuk h > 1, E[e^2] = sigma^2 dan E[e^2 1(e<0)] = sigma^2 / 2 (distribusi simetris)
+        expected_sq = [r * r for r in resid]
+        expected_neg = [r * r if r < 0 else 0.0 for r in resid]
+        for h in range(1, horizon):
+            expected_sq.append(out[h - 1])
+            expected_neg.append(out[h - 1] / 2.0)
+            variance.append(out[h - 1])
+            sigma2 = self.omega
+            for i in range(self.p):
+                sigma2 += self.alpha[i] * expected_sq[-1 - i]
+            for j in range(self.o):
+                sigma2 += self.gamma[j] * expected_neg[-1 - j]
+            for k in range(self.q):
+                sigma2 += self.beta[k] * variance[-1 - k]
+            out[h] = sigma2
+        return out
+
+
+class OnlineArimaNgarch:
+    """
+    Pembaruan gabungan mean (ARIMA) dan varians (NGARCH) per tick tanpa melatih ulang.
+    """
+
+    def __init__(self, arima, ngarch):
+        self.arima = arima
+        self.ngarch = ngarch
+
+    @classmethod
+    def from_fits(cls, arima_fit, ngarch_fit, refit_fn=None, **kwargs):
+        """Membuat dari hasil `fit_arima` (atau ArimaArtifact) dan `fit_ngarch`."""
+        arima = arima_fit if isinstance(arima_fit, ArimaArtifact) else ArimaArtifact.from_results(arima_fit)
+        return cls(arima, NgarchFilter.from_fit(ngarch_fit, refit_fn=refit_fn, **kwargs))
+
+    def update(self, value, index=None):
+        """
+        Memasukkan satu return baru. Mengembalikan dict berisi residual ARIMA,
+        prediksi mean dan varians bersyarat untuk langkah berikutnya.
+        """
+        resid, next_mean = self.arima.update(value, index=index)
+        next_variance = self.ngarch.update(resid)
+        return {'resid': resid, 'mean': next_mean, 'variance': next_variance}
+
+    def update_many(self, values):
+        rows = [self.update(v) for v in values]
+        return {key: np.array([row[key] for row in rows]) for key in ('resid', 'mean', 'variance')}
+
+    def forecast(self, horizon=1):
+        """Prediksi mean dan varians `horizon` langkah ke depan dari state terakhir."""
+        return {'mean': self.arima.forecast(horizon), 'variance': self.ngarch.forecast(horizon)}
@@ -0,0 +1,399 @@
+"""
+Mesin pipeline ARIMA-GARCH/NGARCH yang dapat diimpor tanpa Streamlit.
+Urutan kerja: load -> log-return -> split -> ARIMA (mean) -> GARCH/NGARCH (varians) -> forecast.
+Halaman-halaman di streamlit_app.py hanya menampilkan hasil dari fungsi-fungsi di sini.
+statsmodels dan arch baru diimpor di dalam fungsi fit, sehingga tahap data
+(log-return, split) tidak ikut memuatnya.
+
+Fit dapat di-warm-start: parameter konvergen sebelumnya (hasil fit lama di sesi,
+jendela bergulir sebelumnya, atau parameter terakhir di FitCache untuk spesifikasi
+yang sama) dipakai sebagai nilai awal optimasi. `convergence_info` melaporkan jumlah
+iterasi dan evaluasi fungsi sebuah fit, dan atribut `start_source` hasil fit mencatat
+dari mana nilai awalnya berasal.
+"""
+import numpy as np
+import pandas as pd
+
+from .cache import cache_key
+from .data import load_currency_data
+from .profiling import Profiler
+
+NGARCH_KINDS = ('gjr', 'engle-ng')
+
+# Asal nilai awal optimasi sebuah fit (atribut `start_source` hasil fit_arima/fit_garch/fit_ngarch)
+START_SOURCES = {
+    'cache': 'diambil dari cache, tanpa optimasi',
+    'previous': 'warm-start dari parameter fit sebelumnya',
+    'cache-start': 'warm-start dari parameter terakhir di cache',
+    'default': 'nilai awal bawaan',
+}
+
+TEST_SIZE = 30
+RESCALE_THRESHOLD = 100000
+
+
+def compute_log_returns(series, rescale_threshold=RESCALE_THRESHOLD):
+    """
+    Menghitung log-return dari deret harga.
+    Jika nilai maksimum melebihi `rescale_threshold`, deret dibagi 1000 terlebih dahulu.
+    Mengembalikan (log_return_series, deret_harga_yang_dipakai, rescaled).
+    """
+    rescaled = bool(series.max() > rescale_threshold)
+    if rescaled:
+        series = series / 1000
+    log_return_series = np.log(series).diff().dropna()
+    return log_return_series, series, rescaled
+
+
+def split_train_test(returns, test_size=TEST_SIZE):
+    """Membagi deret return: `test_size` observasi terakhir menjadi data uji."""
+    returns = returns.sort_index()
+    return returns.iloc[:-test_size], returns.iloc[-test_size:]
+
+
+def _start_values(previous, names):
+    """
+    Parameter dari `previous` (hasil fit, Series atau array) bila cocok dipakai sebagai nilai
+    awal model dengan parameter `names`, atau None. Bila nama parameternya diketahui, nama
+    harus sama (GJR dan NGARCH Engle-Ng sama-sama punya lima parameter).
+    """
+    if previous is None:
+        return None
+    params = getattr(previous, 'params', previous)
+    if isinstance(params, pd.Series) and list(params.index) != list(names):
+        return None
+    values = np.asarray(params, dtype=float)
+    if values.shape != (len(names),) or not np.all(np.isfinite(values)):
+        return None
+    return values
+
+
+def _fit_from(fit_fn, start, source):
+    """
+    Menjalankan `fit_fn(start)` (mengembalikan (hasil, nilai_awal_dipakai)) dan mencatat asal
+    nilai awalnya di `hasil.start_source`: `source` bila `start` benar-benar dipakai, atau 'default'.
+    """
+    result, warm = fit_fn(start)
+    result.start_source = source if warm else 'default'
+    return result
+
+
+def _cached(cache, kind, series, spec, fit_fn, start=None):
+    """
+    Fit lewat FitCache. Saat cache miss tanpa `start`, parameter terakhir yang konvergen
+    untuk spesifikasi yang sama (data apa pun) dipakai sebagai nilai awal `fit_fn(start)`.
+    Asal nilai awal dicatat di `start_source` hasilnya (lihat START_SOURCES).
+    """
+    if cache is None:
+        return _fit_from(fit_fn, start, 'previous')
+    key = cache_key(kind, series, **spec)
+    result = cache.get(key)
+    if result is not None:
+        result.start_source = 'cache'
+        return result
+    # Kunci tanpa data: satu entri parameter terakhir per spesifikasi model
+    start_key = cache_key(f'{kind}-start', np.empty(0), **spec)
+    source = 'previous'
+    if start is None:
+        start, source = cache.get(start_key), 'cache-start'
+    result = _fit_from(fit_fn, start, source)
+    cache.put(key, result)
+    cache.put(start_key, np.asarray(result.params, dtype=float))
+    return result
+
+
+def convergence_info(result):
+    """Jumlah iterasi, evaluasi fungsi dan status konvergensi fit statsmodels atau arch."""
+    retvals = getattr(result, 'mle_retvals', None)
+    if retvals is not None:
+        return {'iterations': int(retvals.get('iterations', 0)), 'evaluations': int(retvals.get('fcalls', 0)),
+                'converged': bool(retvals.get('converged', True))}
+    optimization = result.optimization_result
+    return {'iterations': int(optimization.nit), 'evaluations': int(optimization.nfev),
+            'converged': bool(optimization.success)}
+
+
+def fit_arima(train_returns, order=(1, 0, 1), cache=None, start_params=None):
+    """
+    Melatih model ARIMA pada data return pelatihan.
+    Jika `cache` (FitCache) diberikan, hasil untuk data dan ordo yang sama diambil dari cache.
+    `start_params` (hasil fit sebelumnya atau array parameter) dipakai sebagai nilai awal.
+    """
+    order = tuple(int(v) for v in order)
+
+    def fit(start):
+        from statsmodels.tsa.arima.model import ARIMA
+
+        model = ARIMA(train_returns, order=order)
+        values = _start_values(start, model.param_names)
+        return model.fit(start_params=values), values is not None
+
+    return _cached(cache, 'arima', train_returns, {'order': order}, fit, start=start_params)
+
+
+def fit_garch(residuals, p=1, q=1, dist='t', cache=None, starting_values=None):
+    """
+    Melatih model GARCH(p, q) ber-mean nol pada residual ARIMA.
+    `starting_values` (hasil fit sebelumnya atau array parameter) dipakai sebagai nilai awal.
+    """
+    residuals = residuals.dropna()
+    spec = {'mean': 'zero', 'vol': 'Garch', 'p': int(p), 'q': int(q), 'dist': dist}
+
+    def fit(start):
+        from arch import arch_model
+
+        garch_model = arch_model(
+            residuals,
+            mean='zero',
+            vol='Garch',
+            p=p,
+            q=q,
+            dist=dist
+        )
+        values = _start_values(start, garch_model._all_parameter_names())
+        return garch_model.fit(disp='off', starting_values=values), values is not None
+
+    return _cached(cache, 'garch', residuals, spec, fit, start=starting_values)
+
+
+def fit_ngarch(residuals, p=1, o=1, q=1, dist='t', cache=None, kind='gjr', starting_values=None):
+    """
+    Melatih model volatilitas asimetris pada residual ARIMA.
+    `kind='gjr'`: GARCH(p, o, q) arch dengan ordo asimetris `o` (GJR-GARCH).
+    `kind='engle-ng'`: NGARCH(1,1) Engle-Ng sejati; ordo p, o, q diabaikan.
+    `starting_values` (hasil fit sebelumnya atau array parameter) dipakai sebagai nilai awal.
+    """
+    if kind not in NGARCH_KINDS:
+        raise ValueError(f"Jenis NGARCH harus salah satu dari {NGARCH_KINDS}.")
+    residuals = residuals.dropna()
+
+    if kind == 'engle-ng':
+        spec = {'mean': 'zero', 'vol': 'NGARCH', 'p': 1, 'q': 1, 'dist': dist}
+
+        def fit(start):
+            from .ngarch import fit_engle_ng, ngarch_model
+
+            values = _start_values(start, ngarch_model(residuals, dist=dist)._all_parameter_names())
+            return fit_engle_ng(residuals, dist=dist, starting_values=values), values is not None
+
+        return _cached(cache, 'ngarch', residuals, spec, fit, start=starting_values)
+
+    spec = {'mean': 'zero', 'vol': 'Garch', 'p': int(p), 'o': int(o), 'q': int(q), 'dist': dist}
+
+    def fit(start):
+        from arch import arch_model
+
+        ngarch_model = arch_model(
+            residuals,
+            mean='zero',
+            vol='Garch',
+            p=p,
+            o=o,
+            q=q,
+            dist=dist
+        )
+        values = _start_values(start, ngarch_model._all_parameter_names())
+        return ngarch_model.fit(disp='off', starting_values=values), values is not None
+
+    return _cached(cache, 'ngarch', residuals, spec, fit, start=starting_values)
+
+
+def forecast_volatility(vol_fit, horizon, index=None):
+    """
+    Prediksi volatilitas (akar varians bersyarat) `horizon` langkah ke depan.
+    Tanpa `index`, tanggal prediksi adalah hari kerja setelah observasi terakhir.
+    """
+    forecast = vol_fit.forecast(horizon=horizon, reindex=False)
+    predicted_vol = np.sqrt(forecast.variance.values[-1, :horizon])
+    if index is None:
+        last_date = vol_fit.resid.index[-1]
+        index = pd.date_range(start=last_date + pd.Timedelta(days=1), periods=horizon, freq='B')
+    return pd.Series(predicted_vol, index=index)
+
+
+class ArimaNgarchPipeline:
+    """
+    Pipeline ARIMA-GARCH/NGARCH untuk satu deret nilai tukar.
+    Setiap tahap menyimpan hasilnya sebagai atribut sehingga tahap berikutnya
+    (dan tampilan) dapat memakainya kembali tanpa melatih ulang. Dengan `warm_start`,
+    fit ulang (misalnya setelah `load` data baru) dimulai dari parameter fit sebelumnya.
+    Dengan `profiler` (Profiler), setiap tahap dicatat waktu, memori dan iterasinya.
+    """
+
+    def __init__(self, arima_order=(1, 0, 1), garch_order=(1, 1), ngarch_order=(1, 1, 1),
+                 dist='t', test_size=TEST_SIZE, cache=None, ngarch_kind='gjr', warm_start=True, profiler=None):
+        self.arima_order = tuple(arima_order)
+        self.garch_order = tuple(garch_order)
+        self.ngarch_order = tuple(ngarch_order)
+        self.ngarch_kind = ngarch_kind
+        self.dist = dist
+        self.test_size = test_size
+        self.cache = cache
+        self.warm_start = warm_start
+        self.profiler = profiler if profiler is not None else Profiler(enabled=False)
+
+        self.prices = None
+        self.log_returns = None
+        self.train = None
+        self.test = None
+        self.arima_fit = None
+        self.arima_residuals = None
+        self.garch_fit = None
+        self.ngarch_fit = None
+
+    @classmethod
+    def from_csv(cls, source, column, **kwargs):
+        """Membuat pipeline dari file CSV nilai tukar untuk kolom `column`."""
+        pipeline = cls(**kwargs)
+        with pipeline.profiler.stage('ingest', 'csv'):
+            prices = load_currency_data(source)[column]
+        pipeline.load(prices)
+        return pipeline
+
+    @classmethod
+    def from_store(cls, store, currency, **kwargs):
+        """Membuat pipeline dari deret `currency` di SeriesStore (hanya kolom itu yang dibaca)."""
+        pipeline = cls(**kwargs)
+        with pipeline.profiler.stage('ingest', 'store'):
+            prices = store.load(currency)
+        pipeline.load(prices)
+        return pipeline
+
+    def load(self, prices):
+        """
+        Memuat deret harga (pd.Series ber-indeks tanggal). Return dan split dihitung ulang;
+        hasil fit lama disimpan sebagai nilai awal fit berikutnya.
+        """
+        self.prices = prices.dropna().sort_index()
+        self.log_returns = self.train = self.test = None
+        self.arima_residuals = None
+        return self
+
+    def compute_returns(self):
+        with self.profiler.stage('transform', 'log_return'):
+            self.log_returns, _, _ = compute_log_returns(self.prices)
+        return self.log_returns
+
+    def split(self):
+        if self.log_returns is None:
+            self.compute_returns()
+        with self.profiler.stage('transform', 'split'):
+            self.train, self.test = split_train_test(self.log_returns, self.test_size)
+        return self.train, self.test
+
+    def _previous(self, result):
+        return result if self.warm_start else None
+
+    def convergence(self):
+        """Jumlah iterasi, evaluasi fungsi dan asal nilai awal setiap model yang sudah dilatih (DataFrame per model)."""
+        fits = {'arima': self.arima_fit, 'garch': self.garch_fit, 'ngarch': self.ngarch_fit}
+        return pd.DataFrame({name: {**convergence_info(result), 'start': getattr(result, 'start_source', None)}
+                             for name, result in fits.items() if result is not None}).T
+
+    def reports(self):
+        """Laporan terstruktur (`ModelReport`) setiap model yang sudah dilatih, per nama model."""
+        from .report import model_report
+
+        fits = {'arima': self.arima_fit, 'garch': self.garch_fit, 'ngarch': self.ngarch_fit}
+        series = getattr(self.prices, 'name', None)
+        return {name: model_report(result, model=name, name=series)
+                for name, result in fits.items() if result is not None}
+
+    def fit_arima(self):
+        if self.train is None:
+            self.split()
+        with self.profiler.stage('fit', 'arima') as record:
+            self.arima_fit = fit_arima(self.train, self.arima_order, cache=self.cache,
+                                       start_params=self._previous(self.arima_fit))
+            record.update(convergence_info(self.arima_fit))
+        self.arima_residuals = self.arima_fit.resid.dropna()
+        return self.arima_fit
+
+    def fit_garch(self):
+        if self.arima_residuals is None:
+            self.fit_arima()
+        p, q = self.garch_order
+        with self.profiler.stage('fit', 'garch') as record:
+            self.garch_fit = fit_garch(self.arima_residuals, p=p, q=q, dist=self.dist, cache=self.cache,
+                                       starting_values=self._previous(self.garch_fit))
+            record.update(convergence_info(self.garch_fit))
+        return self.garch_fit
+
+    def fit_ngarch(self):
+        if self.arima_residuals is None:
+            self.fit_arima()
+        p, o, q = self.ngarch_order
+        with self.profiler.stage('fit', 'ngarch') as record:
+            self.ngarch_fit = fit_ngarch(self.arima_residuals, p=p, o=o, q=q, dist=self.dist, cache=self.cache,
+                                         kind=self.ngarch_kind, starting_values=self._previous(self.ngarch_fit))
+            record.update(convergence_info(self.ngarch_fit))
+        return self.ngarch_fit
+
+    def forecast(self, horizon=None):
+        """
+        Prediksi return (ARIMA) dan volatilitas (NGARCH) sepanjang `horizon`.
+        Secara default horizon sama dengan panjang data uji dan memakai indeksnya.
+        """
+        if self.ngarch_fit is None:
+            self.fit_ngarch()
+        index = None
+        if horizon is None:
+            horizon = len(self.test)
+            index = self.test.index
+        with self.profiler.stage('forecast', 'point'):
+            mean = np.asarray(self.arima_fit.forecast(steps=horizon))
+            if index is None:
+                index = pd.date_range(start=self.train.index[-1] + pd.Timedelta(days=1), periods=horizon, freq='B')
+            return pd.DataFrame({
+                'mean': mean,
+                'volatility': forecast_volatility(self.ngarch_fit, horizon, index=index).values,
+            }, index=index)
+
+    def forecast_distribution(self, horizon=None, n_paths=100_000, seed=None, **kwargs):
+        """
+        Distribusi prediksi return (mean ARIMA + simulasi Monte-Carlo NGARCH) per horizon,
+        termasuk kuantil, VaR dan Expected Shortfall; lihat `simulation.forecast_distribution`.
+        """
+        from .simulation import forecast_distribution
+
+        point = self.forecast(horizon)
+        with self.profiler.stage('forecast', 'monte_carlo', n_paths=n_paths):
+            return forecast_distribution(self.ngarch_fit, len(point), n_paths=n_paths, seed=seed,
+                                         mean=point['mean'].to_numpy(), index=point.index, **kwargs)
+
+    def price_intervals(self, horizon=None, n_resamples=5000, n_refits=0, seed=None, **kwargs):
+        """
+        Prediksi harga dengan pita persentil bootstrap (FHS dengan residual terstandar NGARCH)
+        mulai dari harga terakhir data latih; lihat `bootstrap.bootstrap_price_intervals`.
+        """
+        from .bootstrap import bootstrap_price_intervals
+
+        point = self.forecast(horizon)
+        last_price = float(self.prices.loc[:self.train.index[-1]].iloc[-1])
+        with self.profiler.stage('forecast', 'bootstrap', n_resamples=n_resamples, n_refits=n_refits):
+            return bootstrap_price_intervals(self.arima_fit, last_price, self.ngarch_fit, len(point),
+                                             n_resamples=n_resamples, n_refits=n_refits, seed=seed,
+                                             index=point.index, **kwargs)
+
+    def diagnostics(self, lags=10):
+        """
+        Diagnostik residual ARIMA dan residual terstandar GARCH/NGARCH yang sudah dilatih
+        dalam satu panggilan; lihat `diagnostics.residual_diagnostics`.
+        """
+        from .diagnostics import residual_diagnostics
+
+        residuals = {'arima': self.arima_residuals}
+        if self.garch_fit is not None:
+            residuals['garch'] = self.garch_fit.std_resid
+        if self.ngarch_fit is not None:
+            residuals['ngarch'] = self.ngarch_fit.std_resid
+        with self.profiler.stage('diagnostics', 'residual', lags=lags):
+            return residual_diagnostics(residuals, lags)
+
+    def run(self, horizon=None):
+        """Menjalankan seluruh tahap (ARIMA, GARCH, NGARCH) dan mengembalikan hasil forecast."""
+        self.split()
+        self.fit_arima()
+        self.fit_garch()
+        self.fit_ngarch()
+        return self.forecast(horizon)
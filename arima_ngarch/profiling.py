@@ -0,0 +1,105 @@
+"""
+Instrumentasi per tahap (ingest, transform, fit, forecast, diagnostics, render).
+
+`Profiler.stage` membungkus satu tahap dan mencatat waktu dinding, waktu CPU proses,
+perubahan memori resident (RSS) dan tahap induknya (tahap boleh bersarang). Record
+berupa dict biasa yang dapat ditambah keterangan oleh pemanggil, misalnya jumlah
+iterasi optimasi dari `convergence_info`. Setiap tahap yang selesai juga dikirim
+sebagai satu baris JSON ke logger `arima_ngarch.profiling` (aktifkan dengan level
+INFO untuk run batch); di aplikasi record ditampilkan sebagai tabel.
+
+Modul ini hanya memakai pustaka standar dan pandas agar murah diimpor di mana saja.
+"""
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+LOGGER = logging.getLogger(__name__)
+STAGES = ('ingest', 'transform', 'fit', 'forecast', 'diagnostics', 'render')
+
+
+def _rss_mb():
+    """Memori resident proses (MB) dari /proc, atau None di luar Linux."""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class Profiler:
+    """
+    Pengumpul record tahap untuk satu run (satu eksekusi halaman, satu mata uang batch).
+    Dengan `enabled=False` tahap tidak diukur, sehingga pemanggil tidak perlu bercabang.
+    """
+
+    def __init__(self, name=None, enabled=True, log=True):
+        self.name = name
+        self.enabled = enabled
+        self.log = log
+        self.records = []
+        self._stack = []
+
+    @contextmanager
+    def stage(self, kind, label=None, **fields):
+        """
+        Mengukur blok `with` sebagai tahap `kind` (salah satu STAGES) berlabel `label`.
+        Menghasilkan dict record; kunci tambahan (mis. iterasi) boleh diisi di dalam blok.
+        """
+        if kind not in STAGES:
+            raise ValueError(f"Tahap harus salah satu dari {STAGES}.")
+        record = {'run': self.name, 'stage': kind, 'label': label or kind,
+                  'parent': self._stack[-1]['label'] if self._stack else None, **fields}
+        if not self.enabled:
+            yield record
+            return
+        rss_start = _rss_mb()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        self._stack.append(record)
+        try:
+            yield record
+        except Exception as e:
+            record['error'] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self._stack.pop()
+            record['wall_s'] = time.perf_counter() - wall_start
+            record['cpu_s'] = time.process_time() - cpu_start
+            rss_end = _rss_mb()
+            record['rss_mb'] = rss_end
+            record['rss_delta_mb'] = rss_end - rss_start if rss_end is not None and rss_start is not None else None
+            self.records.append(record)
+            if self.log and LOGGER.isEnabledFor(logging.INFO):
+                LOGGER.info(json.dumps(record, default=str))
+
+    def to_frame(self):
+        """Record sebagai DataFrame, berurutan menurut selesainya tahap."""
+        return pd.DataFrame(self.records)
+
+    def totals(self):
+        """Total waktu dinding dan CPU per jenis tahap (hanya tahap teratas, tanpa hitung ganda)."""
+        frame = self.to_frame()
+        if frame.empty:
+            return frame
+        top = frame[frame['parent'].isna()]
+        return top.groupby('stage')[['wall_s', 'cpu_s']].sum().sort_values('wall_s', ascending=False)
+
+    def to_json_lines(self):
+        """Record sebagai teks JSON Lines (satu tahap per baris)."""
+        return ''.join(json.dumps(record, default=str) + '\n' for record in self.records)
+
+    def write_json_lines(self, path):
+        """Menambahkan record ke file JSON Lines `path`."""
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(self.to_json_lines())
+
+
+def log_records(records, logger=LOGGER):
+    """Mengirim record yang dikumpulkan di proses lain (mis. worker batch) ke `logger` sebagai JSON."""
+    for record in records:
+        logger.info(json.dumps(record, default=str))
@@ -0,0 +1,212 @@
+"""
+Laporan model terstruktur untuk hasil fit ARIMA (statsmodels) dan GARCH/NGARCH (arch).
+
+`model_report` mengambil koefisien, standard error, statistik t/z, p-value, AIC/BIC,
+log-likelihood dan info konvergensi langsung dari array numerik hasil fit, tanpa
+merender `summary()` lalu mem-parse tabel HTML-nya kembali. `ModelReport` dapat
+disimpan sebagai JSON (`to_dict`/`from_dict`) atau, untuk ribuan model sekaligus,
+sebagai tabel panjang satu baris per parameter (`reports_frame`, Arrow IPC lewat
+`save_reports`/`load_reports`).
+"""
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .pipeline import convergence_info
+
+FORMAT = 'arima-ngarch/model-report'
+FORMAT_VERSION = 1
+SCALARS = ('nobs', 'aic', 'bic', 'loglik', 'iterations', 'evaluations', 'converged')
+COEFFICIENTS = ('coef', 'std_err', 'tvalue', 'pvalue')
+
+
+class ModelReport:
+    """
+    Ringkasan numerik satu fit: `model` ('arima', 'garch', 'ngarch', ...), `spec` (mis.
+    'ARIMA(1, 0, 1)' atau 'GJR-GARCH(1, 1, 1) t'), array koefisien per parameter dan
+    statistik skalar (SCALARS). `name` mengidentifikasi deret/mata uangnya.
+    """
+
+    def __init__(self, model, spec, param_names, coef, std_err, tvalue, pvalue, nobs, aic, bic, loglik,
+                 iterations=None, evaluations=None, converged=None, name=None):
+        self.model = str(model)
+        self.spec = str(spec)
+        self.name = None if name is None else str(name)
+        self.param_names = [str(p) for p in param_names]
+        self.coef = np.asarray(coef, dtype=float)
+        self.std_err = np.asarray(std_err, dtype=float)
+        self.tvalue = np.asarray(tvalue, dtype=float)
+        self.pvalue = np.asarray(pvalue, dtype=float)
+        self.nobs = int(nobs)
+        self.aic = float(aic)
+        self.bic = float(bic)
+        self.loglik = float(loglik)
+        self.iterations = None if iterations is None else int(iterations)
+        self.evaluations = None if evaluations is None else int(evaluations)
+        self.converged = None if converged is None else bool(converged)
+
+        if not (len(self.param_names) == self.coef.size == self.std_err.size == self.tvalue.size == self.pvalue.size):
+            raise ValueError("Panjang nama parameter dan array koefisien laporan tidak sama.")
+
+    def coefficients(self):
+        """Tabel koefisien (coef, std_err, tvalue, pvalue) ber-indeks nama parameter."""
+        return pd.DataFrame({column: getattr(self, column) for column in COEFFICIENTS},
+                            index=pd.Index(self.param_names, name='param'))
+
+    def summary(self, prefix=''):
+        """Statistik skalar sebagai dict datar, mis. `summary('arima_')` -> {'arima_aic': ...}."""
+        return {f'{prefix}{key}': getattr(self, key) for key in SCALARS}
+
+    def to_dict(self):
+        return {
+            'format': FORMAT,
+            'version': FORMAT_VERSION,
+            'model': self.model,
+            'spec': self.spec,
+            'name': self.name,
+            'param_names': self.param_names,
+            **{column: self._floats(getattr(self, column)) for column in COEFFICIENTS},
+            **self.summary(),
+        }
+
+    @staticmethod
+    def _floats(values):
+        # JSON tidak mengenal NaN; standard error yang gagal dihitung disimpan sebagai null
+        return [float(v) if np.isfinite(v) else None for v in values]
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get('format') != FORMAT:
+            raise ValueError(f"Bukan laporan model yang dikenali: {data.get('format')!r}")
+        if data.get('version', 0) > FORMAT_VERSION:
+            raise ValueError(f"Versi laporan {data['version']} belum didukung.")
+        arrays = {column: [np.nan if v is None else v for v in data[column]] for column in COEFFICIENTS}
+        return cls(model=data['model'], spec=data['spec'], name=data.get('name'), param_names=data['param_names'],
+                   **arrays, **{key: data.get(key) for key in SCALARS})
+
+    def to_json(self):
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, text):
+        return cls.from_dict(json.loads(text))
+
+    def __repr__(self):
+        label = f"{self.name} " if self.name else ''
+        return f"<ModelReport {label}{self.spec}: aic={self.aic:.4f}, loglik={self.loglik:.4f}>"
+
+
+def _arima_report(result, model, name):
+    info = convergence_info(result)
+    order = tuple(int(v) for v in result.model.order)
+    return ModelReport(model=model or 'arima', spec=f"ARIMA{order}", name=name, param_names=result.param_names,
+                       coef=np.asarray(result.params), std_err=np.asarray(result.bse),
+                       tvalue=np.asarray(result.tvalues), pvalue=np.asarray(result.pvalues),
+                       nobs=result.nobs, aic=result.aic, bic=result.bic, loglik=result.llf, **info)
+
+
+def _arch_report(result, model, name):
+    info = convergence_info(result)
+    volatility = result.model.volatility
+    if model is None:
+        model = 'garch' if volatility.name == 'GARCH' else 'ngarch'
+    # Ordo diambil dari atribut p/o/q (NGARCH Engle-Ng selalu (1, 1) tanpa atribut ordo)
+    order = tuple(getattr(volatility, attr) for attr in ('p', 'o', 'q') if getattr(volatility, attr, 0))
+    spec = f"{volatility.name}{order if order else ''} {result.model.distribution.name}".strip()
+    return ModelReport(model=model, spec=spec, name=name, param_names=list(result.params.index),
+                       coef=np.asarray(result.params), std_err=np.asarray(result.std_err),
+                       tvalue=np.asarray(result.tvalues), pvalue=np.asarray(result.pvalues),
+                       nobs=result.nobs, aic=result.aic, bic=result.bic, loglik=result.loglikelihood, **info)
+
+
+def model_report(result, model=None, name=None):
+    """
+    `ModelReport` dari hasil `fit_arima` (statsmodels) atau `fit_garch`/`fit_ngarch` (arch).
+    `model` menimpa jenis model yang ditebak ('arima', 'garch' atau 'ngarch').
+    """
+    if hasattr(result, 'llf') and hasattr(result, 'bse'):
+        return _arima_report(result, model, name)
+    if hasattr(result, 'loglikelihood') and hasattr(result, 'std_err'):
+        return _arch_report(result, model, name)
+    raise TypeError(f"Hasil fit tidak dikenali untuk laporan model: {type(result).__name__}")
+
+
+def reports_frame(reports):
+    """
+    Tabel panjang semua laporan: satu baris per (laporan, parameter) dengan nomor urut
+    laporan (`report`), identitas (name, model, spec), koefisien dan statistik skalar
+    laporannya (diulang per parameter). Kolom identitas bertipe kategori agar ringkas
+    untuk ribuan laporan.
+    """
+    reports = list(reports)
+    counts = np.array([len(report.param_names) for report in reports], dtype=int)
+
+    columns = {'report': np.repeat(np.arange(len(reports)), counts)}
+    for key in ('name', 'model', 'spec'):
+        columns[key] = pd.Categorical(np.repeat(np.array([getattr(r, key) for r in reports], dtype=object), counts))
+    columns['param'] = [param for report in reports for param in report.param_names]
+    for column in COEFFICIENTS:
+        columns[column] = np.concatenate([getattr(report, column) for report in reports] or [np.empty(0)])
+    for key, dtype in (('nobs', 'Int64'), ('aic', 'Float64'), ('bic', 'Float64'), ('loglik', 'Float64'),
+                       ('iterations', 'Int64'), ('evaluations', 'Int64'), ('converged', 'boolean')):
+        columns[key] = pd.array([getattr(report, key) for report in reports], dtype=dtype).repeat(counts)
+    return pd.DataFrame(columns)
+
+
+def _optional(value):
+    return None if pd.isna(value) else value
+
+
+def frame_to_reports(frame):
+    """Kebalikan `reports_frame`: daftar `ModelReport` berurutan menurut kolom `report`."""
+    if frame.empty:
+        return []
+    frame = frame.sort_values('report', kind='stable')
+    numbers = frame['report'].to_numpy()
+    bounds = np.append(np.flatnonzero(np.diff(numbers)) + 1, len(numbers))
+    coefficients = {column: frame[column].to_numpy(dtype=float) for column in COEFFICIENTS}
+    identity = {key: frame[key].astype(object).to_numpy() for key in ('name', 'model', 'spec', 'param')}
+    scalars = {key: frame[key].astype(object).to_numpy() for key in SCALARS}
+    reports = []
+    start = 0
+    for stop in bounds:
+        reports.append(ModelReport(model=identity['model'][start], spec=identity['spec'][start],
+                                   name=_optional(identity['name'][start]),
+                                   param_names=identity['param'][start:stop].tolist(),
+                                   **{column: values[start:stop] for column, values in coefficients.items()},
+                                   **{key: _optional(values[start]) for key, values in scalars.items()}))
+        start = stop
+    return reports
+
+
+def _feather():
+    # pyarrow bersifat opsional dan hanya dimuat saat laporan disimpan/dibaca sebagai Arrow
+    try:
+        import pyarrow.feather as feather
+    except ImportError:  # pragma: no cover
+        raise ImportError("Laporan dalam format Arrow membutuhkan pyarrow.") from None
+    return feather
+
+
+def save_reports(reports, path):
+    """
+    Menyimpan laporan ke `path`: Arrow IPC (Feather v2, butuh pyarrow) untuk akhiran
+    .feather/.arrow, selain itu JSON Lines (satu laporan per baris).
+    """
+    path = Path(path)
+    if path.suffix in ('.feather', '.arrow'):
+        _feather().write_feather(reports_frame(reports), str(path))
+    else:
+        path.write_text(''.join(report.to_json() + '\n' for report in reports), encoding='utf-8')
+    return path
+
+
+def load_reports(path):
+    """Memuat laporan yang disimpan `save_reports` (format mengikuti akhiran file)."""
+    path = Path(path)
+    if path.suffix in ('.feather', '.arrow'):
+        return frame_to_reports(_feather().read_feather(str(path)))
+    with open(path, encoding='utf-8') as f:
+        return [ModelReport.from_json(line) for line in f if line.strip()]
@@ -0,0 +1,210 @@
+"""
+Pemilihan ordo otomatis untuk ARIMA (p, q) dan NGARCH (p, o, q) berdasarkan AIC/BIC.
+
+Grid dievaluasi per "gelombang" total ordo (p+q atau p+o+q). Kandidat dalam satu
+gelombang dilatih paralel di process pool, dan setiap kandidat memulai optimasi
+dari parameter tetangga yang lebih kecil satu lag, dipetakan menurut nama parameter
+model (lag baru diisi nol).
+Kandidat dipangkas bila kenaikan log-likelihood yang dibutuhkan di atas tetangga
+terbaiknya untuk mengalahkan kriteria terbaik saat ini melebihi `prune_margin`.
+"""
+import math
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+CRITERIA = ('aic', 'bic')
+
+
+def _penalty(n_params, nobs, criterion):
+    if criterion == 'aic':
+        return 2.0 * n_params
+    return n_params * math.log(nobs)
+
+
+def _arima_model(values, order):
+    from statsmodels.tsa.arima.model import ARIMA
+
+    return ARIMA(values, order=order)
+
+
+def _ngarch_model(values, order, dist='t'):
+    from arch import arch_model
+
+    p, o, q = order
+    return arch_model(values, mean='zero', vol='Garch', p=p, o=o, q=q, dist=dist)
+
+
+def _arima_param_names(values, order):
+    # Nama parameter diambil dari model itu sendiri: tanpa const bila d > 0, dst.
+    return list(_arima_model(values, order).param_names)
+
+
+def _ngarch_param_names(values, order, dist='t'):
+    # Tanpa 'nu' untuk dist='normal', dua parameter bentuk untuk 'skewt', dst.
+    return list(_ngarch_model(values, order, dist)._all_parameter_names())
+
+
+def _fit_arima_candidate(values, order, start_params):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        model = _arima_model(values, order)
+        fit = model.fit(start_params=start_params)
+    return {
+        'params': np.asarray(fit.params),
+        'param_names': list(model.param_names),
+        'loglik': float(fit.llf),
+        'nobs': int(fit.nobs),
+    }
+
+
+def _fit_ngarch_candidate(values, order, start_params, dist='t'):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        model = _ngarch_model(values, order, dist)
+        fit = model.fit(disp='off', starting_values=start_params)
+    return {
+        'params': np.asarray(fit.params),
+        'param_names': list(model._all_parameter_names()),
+        'loglik': float(fit.loglikelihood),
+        'nobs': int(fit.nobs),
+    }
+
+
+def _pad_params(params, parent_names, child_names):
+    """Memetakan parameter tetangga ke kandidat menurut nama parameter; lag baru diisi nol."""
+    values = dict(zip(parent_names, params))
+    return np.array([values.get(name, 0.0) for name in child_names], dtype=float)
+
+
+def _parents(order, grid):
+    """Tetangga yang satu lag lebih kecil dan berada di dalam grid."""
+    parents = []
+    for i, value in enumerate(order):
+        candidate = tuple(value - 1 if j == i else v for j, v in enumerate(order))
+        if candidate in grid:
+            parents.append(candidate)
+    return parents
+
+
+def _report(progress, results, grid, order):
+    if progress is not None:
+        progress(len(results), len(grid), f"ordo {order}")
+
+
+def _grid_search(values, grid, fit_fn, names_fn, wave_fn, criterion, prune_margin, max_workers, fit_kwargs,
+                 progress=None):
+    if criterion not in CRITERIA:
+        raise ValueError(f"Kriteria harus salah satu dari {CRITERIA}.")
+
+    grid = set(grid)
+    results = {}
+    best_value = math.inf
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+
+    try:
+        for wave in sorted({wave_fn(order) for order in grid}):
+            submitted = []
+            for order in sorted(o for o in grid if wave_fn(o) == wave):
+                parent_results = [results[o] for o in _parents(order, grid) if o in results]
+                parents = [r for r in parent_results if r['status'] == 'fitted']
+                if prune_margin is not None and not parents and any(r['status'] == 'pruned' for r in parent_results):
+                    # Seluruh jalur menuju kandidat ini sudah dipangkas
+                    results[order] = {'order': order, 'status': 'pruned'}
+                    _report(progress, results, grid, order)
+                    continue
+
+                start_params = None
+                if parents:
+                    parent = max(parents, key=lambda r: r['loglik'])
+                    names = names_fn(values, order, **fit_kwargs)
+                    start_params = _pad_params(parent['params'], parent['param_names'], names)
+
+                    n_params = len(names)
+                    required_loglik = (_penalty(n_params, parent['nobs'], criterion) - best_value) / 2.0
+                    if prune_margin is not None and required_loglik - parent['loglik'] > prune_margin:
+                        results[order] = {'order': order, 'status': 'pruned'}
+                        _report(progress, results, grid, order)
+                        continue
+
+                if executor is None:
+                    submitted.append((order, start_params, None))
+                else:
+                    future = executor.submit(fit_fn, values, order, start_params, **fit_kwargs)
+                    submitted.append((order, start_params, future))
+
+            for order, start_params, future in submitted:
+                try:
+                    if future is None:
+                        fitted = fit_fn(values, order, start_params, **fit_kwargs)
+                    else:
+                        fitted = future.result()
+                except Exception as e:
+                    results[order] = {'order': order, 'status': 'failed', 'error': str(e)}
+                    _report(progress, results, grid, order)
+                    continue
+
+                n_params = len(fitted['params'])
+                fitted.update({
+                    'order': order,
+                    'status': 'fitted',
+                    'n_params': n_params,
+                    'aic': 2.0 * n_params - 2.0 * fitted['loglik'],
+                    'bic': n_params * math.log(fitted['nobs']) - 2.0 * fitted['loglik'],
+                })
+                results[order] = fitted
+                best_value = min(best_value, fitted[criterion])
+                _report(progress, results, grid, order)
+    finally:
+        if executor is not None:
+            # Kandidat yang belum mulai dibatalkan bila pencarian berhenti di tengah (mis. job dibatalkan)
+            executor.shutdown(cancel_futures=True)
+
+    table = pd.DataFrame([
+        {
+            'order': r['order'],
+            'status': r['status'],
+            'loglik': r.get('loglik', np.nan),
+            'aic': r.get('aic', np.nan),
+            'bic': r.get('bic', np.nan),
+            'error': r.get('error'),
+        }
+        for r in results.values()
+    ]).sort_values(criterion, na_position='last').reset_index(drop=True)
+
+    fitted_rows = table[table['status'] == 'fitted']
+    best_order = fitted_rows['order'].iloc[0] if not fitted_rows.empty else None
+    return best_order, table
+
+
+def select_arima_order(train_returns, max_p=5, max_q=5, d=0, criterion='aic', prune_margin=10.0,
+                       max_workers=None, progress=None):
+    """
+    Mencari ordo ARIMA(p, d, q) terbaik untuk p <= max_p dan q <= max_q.
+    `prune_margin=None` mengevaluasi seluruh grid tanpa pemangkasan.
+    `progress(selesai, total, pesan)` dipanggil setiap kandidat selesai dievaluasi.
+    Mengembalikan (ordo_terbaik, tabel_seluruh_kandidat).
+    """
+    values = np.asarray(train_returns, dtype=float)
+    grid = [(p, d, q) for p in range(max_p + 1) for q in range(max_q + 1)]
+    return _grid_search(values, grid, _fit_arima_candidate, _arima_param_names,
+                        lambda order: order[0] + order[2], criterion, prune_margin, max_workers, {}, progress)
+
+
+def select_ngarch_order(residuals, max_p=5, max_o=1, max_q=5, dist='t', criterion='aic', prune_margin=10.0,
+                        max_workers=None, progress=None):
+    """
+    Mencari ordo NGARCH(p, o, q) terbaik untuk 1 <= p <= max_p, 0 <= o <= max_o, 1 <= q <= max_q.
+    `progress` seperti pada `select_arima_order`.
+    Mengembalikan (ordo_terbaik, tabel_seluruh_kandidat).
+    """
+    values = np.asarray(pd.Series(residuals).dropna(), dtype=float)
+    grid = [(p, o, q) for p in range(1, max_p + 1) for o in range(max_o + 1) for q in range(1, max_q + 1)]
+    return _grid_search(values, grid, _fit_ngarch_candidate, _ngarch_param_names,
+                        sum, criterion, prune_margin, max_workers, {'dist': dist}, progress)
@@ -0,0 +1,398 @@
+"""
+Layanan forecast HTTP/JSON lokal (ASGI) di atas mesin pipeline yang sama.
+
+`ModelPool` menyimpan model yang sudah dilatih per mata uang di memori sebagai
+`ServedModel`: artefak ARIMA (state Kalman) dan filter varians NGARCH yang dibungkus
+`OnlineArimaNgarch`, plus harga dan tanggal terakhir. Forecast hanya menjalankan
+rekursi mean dan varians sepanjang horizon (tanpa statsmodels/arch dan tanpa memuat
+model), sehingga latensi request ditentukan oleh rekursi tersebut.
+
+Harga baru (`update`) langsung memajukan state model secara online. Fit ulang penuh
+dijadwalkan di `JobManager` (default pool proses, agar optimasi tidak berebut GIL
+dengan server) setelah `refit_after` observasi baru atau bila filter NGARCH
+mendeteksi drift. Model baru menggantikan yang lama begitu job selesai, setelah
+harga yang masuk selama fit diputar ulang; sampai saat itu request tetap dilayani
+model lama.
+
+`create_app` membungkus pool sebagai aplikasi Starlette (dimuat saat dipanggil):
+
+    GET  /health
+    GET  /models                         status model per mata uang
+    GET  /forecast/{currency}?horizon=30
+    POST /data/{currency}                {"prices": {"2024-07-19": 16210.5, ...}}
+    POST /refit/{currency}
+    GET  /jobs
+
+    python -m arima_ngarch.service --csv data/default_currency_multi.csv --port 8000
+"""
+import threading
+import time
+from contextlib import asynccontextmanager
+
+import numpy as np
+import pandas as pd
+
+from .jobs import JobManager
+from .pipeline import compute_log_returns, fit_arima, fit_ngarch
+
+DEFAULT_HORIZON = 30
+MAX_HORIZON = 365
+
+
+class ServedModel:
+    """
+    Model ARIMA-NGARCH satu mata uang yang siap melayani forecast. `online` adalah
+    `OnlineArimaNgarch`; `arima_params`/`ngarch_params` disimpan untuk warm-start fit
+    berikutnya. Objek ini kecil dan dapat di-pickle (dikirim balik dari worker proses).
+    """
+
+    def __init__(self, currency, online, last_price, last_date, arima_params, ngarch_params, nobs,
+                 spec=None, fitted_at=None):
+        self.currency = str(currency)
+        self.online = online
+        self.last_price = float(last_price)
+        self.last_date = pd.Timestamp(last_date)
+        self.fitted_until = self.last_date
+        self.arima_params = np.asarray(arima_params, dtype=float)
+        self.ngarch_params = np.asarray(ngarch_params, dtype=float)
+        self.nobs = int(nobs)
+        self.spec = spec or {}
+        self.fitted_at = fitted_at or time.time()
+        self.updates = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def drift_detected(self):
+        return self.online.ngarch.drift_detected
+
+    def update(self, prices):
+        """
+        Memajukan state dengan harga baru (pd.Series ber-indeks tanggal). Tanggal yang
+        tidak lebih baru dari tanggal terakhir diabaikan. Mengembalikan jumlah harga terpakai.
+        """
+        prices = prices.dropna().sort_index()
+        with self._lock:
+            prices = prices[prices.index > self.last_date]
+            if prices.empty:
+                return 0
+            values = prices.to_numpy(dtype=float)
+            returns = np.diff(np.log(np.concatenate(([self.last_price], values))))
+            for date, value in zip(prices.index, returns):
+                self.online.update(value, index=date)
+            self.last_price, self.last_date = float(values[-1]), prices.index[-1]
+            self.updates += len(values)
+        return len(values)
+
+    def forecast(self, horizon=DEFAULT_HORIZON):
+        """
+        Forecast `horizon` hari kerja setelah tanggal terakhir: tanggal (datetime64[D]),
+        mean log-return ARIMA, volatilitas NGARCH dan harga (harga terakhir x exp(kumulatif mean)).
+        """
+        with self._lock:
+            path = self.online.forecast(horizon)
+            last_price, last_date = self.last_price, self.last_date
+        mean = path['mean']
+        # np.busday_offset: hari kerja yang sama dengan pd.bdate_range, tanpa overhead DatetimeIndex
+        start = np.datetime64(last_date.date()) + 1
+        return {
+            'dates': np.busday_offset(start, np.arange(horizon), roll='forward'),
+            'mean': mean,
+            'volatility': np.sqrt(path['variance']),
+            'price': last_price * np.exp(np.cumsum(mean)),
+        }
+
+    def info(self):
+        return {'currency': self.currency, 'last_date': self.last_date.isoformat(), 'last_price': self.last_price,
+                'fitted_until': self.fitted_until.isoformat(), 'fitted_at': self.fitted_at, 'nobs': self.nobs,
+                'updates': self.updates, 'drift': bool(self.drift_detected), **self.spec}
+
+    def __repr__(self):
+        return f"<ServedModel {self.currency} s.d. {self.last_date.date()}: {self.updates} pembaruan>"
+
+
+def fit_served_model(currency, prices, arima_order=(1, 0, 1), ngarch_order=(1, 1, 1), ngarch_kind='gjr',
+                     dist='t', previous=None, cache=None):
+    """
+    Melatih ARIMA + NGARCH pada seluruh deret harga (tanpa split uji) dan mengembalikan
+    `ServedModel`. `previous` (ServedModel lama) menjadi nilai awal optimasi. Fungsi
+    tingkat modul agar dapat dijalankan di worker proses.
+    """
+    from .online import OnlineArimaNgarch
+
+    prices = prices.dropna().sort_index()
+    returns, _, _ = compute_log_returns(prices)
+    arima = fit_arima(returns, arima_order, cache=cache,
+                      start_params=previous.arima_params if previous is not None else None)
+    p, o, q = ngarch_order
+    ngarch = fit_ngarch(arima.resid.dropna(), p=p, o=o, q=q, dist=dist, cache=cache, kind=ngarch_kind,
+                        starting_values=previous.ngarch_params if previous is not None else None)
+    spec = {'arima_order': list(arima_order), 'ngarch_order': list(ngarch_order), 'ngarch_kind': ngarch_kind,
+            'dist': dist}
+    return ServedModel(currency, OnlineArimaNgarch.from_fits(arima, ngarch), last_price=prices.iloc[-1],
+                       last_date=prices.index[-1], arima_params=arima.params, ngarch_params=ngarch.params,
+                       nobs=len(returns), spec=spec)
+
+
+class ModelPool:
+    """
+    Model hangat per mata uang beserta deret harganya. Fit (awal dan ulang) berjalan
+    sebagai job di `jobs` (JobManager); `forecast` selalu memakai model terakhir yang
+    selesai dilatih. `refit_after` observasi baru (atau drift) memicu fit ulang otomatis.
+    """
+
+    def __init__(self, arima_order=(1, 0, 1), ngarch_order=(1, 1, 1), ngarch_kind='gjr', dist='t',
+                 refit_after=20, jobs=None, store=None, cache=None):
+        self.spec = {'arima_order': tuple(arima_order), 'ngarch_order': tuple(ngarch_order),
+                     'ngarch_kind': ngarch_kind, 'dist': dist}
+        self.refit_after = refit_after
+        self.jobs = jobs if jobs is not None else JobManager(kind='process')
+        self.store = store
+        self.cache = cache
+        self._prices = {}
+        self._models = {}
+        self._fits = {}
+        self._errors = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_csv(cls, source, currencies=None, **kwargs):
+        """Pool untuk kolom `currencies` (default semua kolom) file CSV nilai tukar."""
+        from .data import load_currency_data
+
+        pool = cls(**kwargs)
+        df = load_currency_data(source)
+        for currency in currencies or list(df.columns):
+            pool.add(currency, df[currency])
+        return pool
+
+    @classmethod
+    def from_store(cls, store, currencies=None, **kwargs):
+        """Pool untuk mata uang di SeriesStore; harga baru dari `update` ikut disimpan ke store."""
+        pool = cls(store=store, **kwargs)
+        for currency in currencies or store.currencies():
+            pool.add(currency, store.load(currency))
+        return pool
+
+    def add(self, currency, prices, wait=False):
+        """Mendaftarkan deret harga `currency` dan menjadwalkan fit awalnya."""
+        with self._lock:
+            self._prices[currency] = prices.dropna().sort_index()
+        return self.refit(currency, wait=wait)
+
+    def currencies(self):
+        with self._lock:
+            return sorted(self._prices)
+
+    def refit(self, currency, wait=False):
+        """
+        Menjadwalkan fit ulang penuh `currency` (tidak ada job ganda per mata uang).
+        Dengan `wait=True` menunggu sampai model baru terpasang.
+        """
+        with self._lock:
+            self._collect(currency)
+            if currency not in self._prices:
+                raise KeyError(f"Mata uang '{currency}' tidak ada di pool.")
+            job = self._fits.get(currency)
+            if job is None:
+                job = self.jobs.submit(fit_served_model, currency, self._prices[currency],
+                                       previous=self._models.get(currency), cache=self.cache,
+                                       label=f"fit {currency}", **self.spec)
+                self._fits[currency] = job
+        if wait:
+            job.wait()
+            self._collect(currency)
+        return job
+
+    def _collect(self, currency):
+        # Memasang model dari job fit yang sudah selesai, lalu memutar ulang harga yang masuk selama fit
+        with self._lock:
+            job = self._fits.get(currency)
+            if job is None or not job.done():
+                return
+            del self._fits[currency]
+            self.jobs.forget(job.id)
+            if job.status != 'done':
+                self._errors[currency] = job.error or job.status
+                return
+            model = job.result()
+            model.update(self._prices[currency])
+            self._models[currency] = model
+            self._errors.pop(currency, None)
+
+    def model(self, currency):
+        """`ServedModel` terkini untuk `currency`; LookupError bila belum ada model yang selesai dilatih."""
+        with self._lock:
+            self._collect(currency)
+            model = self._models.get(currency)
+            if model is None:
+                if currency not in self._prices:
+                    raise KeyError(f"Mata uang '{currency}' tidak ada di pool.")
+                raise LookupError(self._errors.get(currency) or f"Model '{currency}' sedang dilatih.")
+        return model
+
+    def forecast(self, currency, horizon=DEFAULT_HORIZON):
+        """Forecast mean return, volatilitas dan harga `horizon` hari kerja ke depan (lihat ServedModel)."""
+        return self.model(currency).forecast(horizon)
+
+    def update(self, currency, prices):
+        """
+        Menambahkan harga baru (pd.Series ber-indeks tanggal): model hangat langsung
+        diperbarui secara online, deret disimpan (juga ke `store` bila ada), dan fit ulang
+        dijadwalkan bila pembaruan sejak fit terakhir mencapai `refit_after` atau ada drift.
+        """
+        prices = prices.dropna().sort_index()
+        with self._lock:
+            if currency not in self._prices:
+                raise KeyError(f"Mata uang '{currency}' tidak ada di pool.")
+            self._collect(currency)
+            stored = self._prices[currency]
+            self._prices[currency] = prices.combine_first(stored).sort_index()
+            model = self._models.get(currency)
+            used = model.update(prices) if model is not None else 0
+        if self.store is not None:
+            self.store.append(currency, prices)
+        if model is not None and (model.updates >= self.refit_after or model.drift_detected):
+            self.refit(currency)
+        return used
+
+    def status(self):
+        """Status per mata uang: info model terkini, job fit yang berjalan dan kesalahan terakhir."""
+        rows = {}
+        for currency in self.currencies():
+            with self._lock:
+                self._collect(currency)
+                model, job = self._models.get(currency), self._fits.get(currency)
+            row = model.info() if model is not None else {'currency': currency}
+            row['fitting'] = job.status if job is not None else None
+            row['error'] = self._errors.get(currency)
+            rows[currency] = row
+        return rows
+
+    def close(self, wait=False):
+        self.jobs.shutdown(wait=wait)
+
+
+def forecast_json(currency, forecast):
+    """Forecast `ModelPool.forecast` sebagai dict JSON berkolom (satu larik per besaran)."""
+    return {
+        'currency': currency,
+        'horizon': len(forecast['mean']),
+        'dates': np.datetime_as_string(forecast['dates']).tolist(),
+        'mean': forecast['mean'].tolist(),
+        'volatility': forecast['volatility'].tolist(),
+        'price': forecast['price'].tolist(),
+    }
+
+
+def create_app(pool):
+    """
+    Aplikasi ASGI (Starlette) yang melayani `pool`. Handler forecast tidak menunggu
+    fit apa pun: mata uang yang modelnya belum siap dijawab 503.
+    """
+    try:
+        from starlette.applications import Starlette
+        from starlette.responses import JSONResponse
+        from starlette.routing import Route
+    except ImportError:  # pragma: no cover
+        raise ImportError("Layanan HTTP membutuhkan starlette (dan uvicorn untuk menjalankannya).") from None
+
+    def error(status, message):
+        return JSONResponse({'error': message}, status_code=status)
+
+    async def health(request):
+        return JSONResponse({'status': 'ok', 'currencies': pool.currencies()})
+
+    async def models(request):
+        return JSONResponse(pool.status())
+
+    async def forecast(request):
+        currency = request.path_params['currency']
+        try:
+            horizon = int(request.query_params.get('horizon', DEFAULT_HORIZON))
+        except ValueError:
+            return error(400, "horizon harus bilangan bulat.")
+        if not 1 <= horizon <= MAX_HORIZON:
+            return error(400, f"horizon harus antara 1 dan {MAX_HORIZON}.")
+        try:
+            return JSONResponse(forecast_json(currency, pool.forecast(currency, horizon)))
+        except KeyError as e:
+            return error(404, e.args[0])
+        except LookupError as e:
+            return error(503, e.args[0])
+
+    async def data(request):
+        currency = request.path_params['currency']
+        try:
+            body = await request.json()
+            prices = pd.Series(body['prices'], dtype=float)
+            prices.index = pd.to_datetime(prices.index)
+        except (ValueError, KeyError, TypeError):
+            return error(400, 'Body harus berupa {"prices": {"YYYY-MM-DD": harga, ...}}.')
+        try:
+            used = pool.update(currency, prices)
+        except KeyError as e:
+            return error(404, e.args[0])
+        return JSONResponse({'currency': currency, 'received': len(prices), 'applied': used})
+
+    async def refit(request):
+        try:
+            job = pool.refit(request.path_params['currency'])
+        except KeyError as e:
+            return error(404, e.args[0])
+        return JSONResponse(job.to_dict(), status_code=202)
+
+    async def jobs(request):
+        return JSONResponse([job.to_dict() for job in pool.jobs.jobs()])
+
+    @asynccontextmanager
+    async def lifespan(app):
+        yield
+        pool.close()
+
+    return Starlette(routes=[
+        Route('/health', health),
+        Route('/models', models),
+        Route('/forecast/{currency}', forecast),
+        Route('/data/{currency}', data, methods=['POST']),
+        Route('/refit/{currency}', refit, methods=['POST']),
+        Route('/jobs', jobs),
+    ], lifespan=lifespan)
+
+
+def main(argv=None):
+    import argparse
+
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Layanan forecast ARIMA-NGARCH (HTTP/JSON).")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--csv', help='file CSV nilai tukar')
+    source.add_argument('--store', help='direktori SeriesStore')
+    parser.add_argument('--currencies', nargs='+')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--refit-after', type=int, default=20)
+    parser.add_argument('--ngarch-kind', default='gjr')
+    args = parser.parse_args(argv)
+
+    kwargs = {'refit_after': args.refit_after, 'ngarch_kind': args.ngarch_kind}
+    if args.csv:
+        pool = ModelPool.from_csv(args.csv, args.currencies, **kwargs)
+    else:
+        from .store import SeriesStore
+
+        pool = ModelPool.from_store(SeriesStore(args.store), args.currencies, **kwargs)
+    uvicorn.run(create_app(pool), host=args.host, port=args.port)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+"""
+Simulasi Monte-Carlo distribusi prediksi return dari model volatilitas terlatih.
+
+Semua jalur dimajukan bersamaan satu langkah per horizon sebagai array numpy
+(tidak ada loop per jalur): varians bersyarat dihitung dari buffer lag residual
+dan varians setiap jalur, lalu residual baru = sqrt(sigma2) * z dengan z inovasi
+Student-t (atau normal) terstandar. Jalur diproses per `chunk_size` sehingga
+array sementara (bilangan acak, buffer lag) tetap kecil berapa pun jumlah jalurnya.
+
+State awal (residual dan varians terakhir) dan parameter diambil lewat
+`NgarchFilter`, sehingga model yang sudah diperbarui online juga dapat disimulasikan.
+Hasil dapat direproduksi untuk `seed` dan `chunk_size` yang sama.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .backtest import DEFAULT_ALPHAS
+from .online import NgarchFilter
+
+N_PATHS = 100_000
+CHUNK_SIZE = 25_000
+DEFAULT_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+def innovation_spec(vol_fit):
+    """Distribusi inovasi fit arch sebagai ('t', nu) atau ('normal', None)."""
+    from arch.univariate.distribution import Normal, StudentsT
+
+    distribution = vol_fit.model.distribution
+    if isinstance(distribution, StudentsT):
+        return 't', float(vol_fit.params['nu'])
+    if isinstance(distribution, Normal):
+        return 'normal', None
+    raise ValueError(f"Distribusi inovasi '{distribution.name}' belum didukung simulasi.")
+
+
+def _standardized_innovations(rng, dist, nu, size):
+    if dist == 't':
+        # Student-t bervarians satu, seperti StudentsT di arch
+        return rng.standard_t(nu, size) * np.sqrt((nu - 2.0) / nu)
+    return rng.standard_normal(size)
+
+
+def propagate_variance(state, z, returns, sigma2):
+    """
+    Memajukan rekursi varians `state` (NgarchFilter) untuk inovasi terstandar `z`
+    (horizon, jalur); residual dan varians ditulis ke `returns` dan `sigma2` berukuran sama.
+
+    Tata letak (horizon, jalur): setiap langkah menulis satu baris kontigu. Buffer lag
+    berupa list array per lag (indeks 0 = terbaru), jadi menggeser lag tidak menyalin data.
+    Di awal semua jalur berbagi state akhir fit (skalar, di-broadcast).
+    """
+    horizon, n_paths = z.shape
+    resid_lags = [float(v) for v in reversed(state._resid)]
+    var_lags = [float(v) for v in reversed(state._variance)]
+
+    for h in range(horizon):
+        if state.kind == 'engle-ng':
+            u = resid_lags[0] - state.theta * np.sqrt(var_lags[0])
+            step_var = state.omega + state.alpha[0] * u * u + state.beta[0] * var_lags[0]
+        else:
+            step_var = np.full(n_paths, state.omega)
+            for i in range(state.p):
+                step_var += state.alpha[i] * np.square(resid_lags[i])
+            for j in range(state.o):
+                negative = np.minimum(resid_lags[j], 0.0)
+                step_var += state.gamma[j] * negative * negative
+            for k in range(state.q):
+                step_var += state.beta[k] * var_lags[k]
+        sigma2[h] = step_var
+        np.sqrt(sigma2[h], out=returns[h])
+        returns[h] *= z[h]
+        resid_lags = [returns[h]] + resid_lags[:-1]
+        var_lags = [sigma2[h]] + var_lags[:-1]
+
+
+def simulate_paths(vol_fit, horizon, n_paths=N_PATHS, seed=None, chunk_size=CHUNK_SIZE, mean=None, state=None):
+    """
+    Mensimulasikan `n_paths` jalur return `horizon` langkah ke depan dari hasil
+    `fit_garch`/`fit_ngarch` (GJR-GARCH(p, o, q) atau NGARCH Engle-Ng).
+
+    `mean` (skalar atau array sepanjang horizon, misalnya prediksi ARIMA) ditambahkan
+    ke residual simulasi. `state` (NgarchFilter) menggantikan state akhir fit, misalnya
+    setelah pembaruan online. Mengembalikan (returns, sigma2), masing-masing (n_paths, horizon).
+    """
+    if state is None:
+        state = NgarchFilter.from_fit(vol_fit)
+    dist, nu = innovation_spec(vol_fit)
+    rng = np.random.default_rng(seed)
+
+    returns = np.empty((horizon, n_paths))
+    sigma2 = np.empty((horizon, n_paths))
+    for start in range(0, n_paths, chunk_size):
+        stop = min(start + chunk_size, n_paths)
+        z = _standardized_innovations(rng, dist, nu, (horizon, stop - start))
+        propagate_variance(state, z, returns[:, start:stop], sigma2[:, start:stop])
+
+    # Parameter arch berlaku pada data yang (mungkin) diskalakan saat fit
+    scale = getattr(vol_fit, 'scale', 1.0) or 1.0
+    if scale != 1.0:
+        returns /= scale
+        sigma2 /= scale * scale
+    if mean is not None:
+        returns += np.broadcast_to(np.asarray(mean, dtype=float), (horizon,))[:, None]
+    # Dikembalikan sebagai (jalur, horizon): view transpos, tanpa salinan
+    return returns.T, sigma2.T
+
+
+def summarize_paths(returns, sigma2=None, alphas=DEFAULT_ALPHAS, quantiles=DEFAULT_QUANTILES, index=None):
+    """
+    Ringkasan distribusi per horizon dari matriks jalur (n_paths, horizon): mean, std,
+    kuantil `q_*`, VaR `var_*` (kuantil return pada alpha, negatif = rugi, seperti
+    backtest) dan Expected Shortfall `es_*` (rata-rata return di bawah VaR).
+    """
+    # Statistik dihitung per baris pada tata letak (horizon, jalur) yang kontigu
+    by_horizon = np.ascontiguousarray(returns.T)
+    horizon = by_horizon.shape[0]
+    if index is None:
+        index = pd.RangeIndex(1, horizon + 1, name='horizon')
+    table = pd.DataFrame({'mean': by_horizon.mean(axis=1), 'std': by_horizon.std(axis=1)}, index=index)
+    if sigma2 is not None:
+        table['volatility'] = np.sqrt(np.asarray(sigma2).T.mean(axis=1))
+    levels = sorted(set(quantiles) | set(alphas))
+    values = np.quantile(by_horizon, levels, axis=1)
+    by_level = dict(zip(levels, values))
+    for q in quantiles:
+        table[f'q_{q:g}'] = by_level[q]
+    for alpha in alphas:
+        var = by_level[alpha]
+        tail = by_horizon <= var[:, None]
+        table[f'var_{alpha:g}'] = var
+        table[f'es_{alpha:g}'] = np.where(tail, by_horizon, 0.0).sum(axis=1) / np.maximum(tail.sum(axis=1), 1)
+    return table
+
+
+def forecast_distribution(vol_fit, horizon, n_paths=N_PATHS, seed=None, chunk_size=CHUNK_SIZE, mean=None,
+                          alphas=DEFAULT_ALPHAS, quantiles=DEFAULT_QUANTILES, cumulative=False, index=None,
+                          state=None):
+    """
+    Distribusi prediksi return per horizon (lihat `summarize_paths`) dari simulasi
+    `n_paths` jalur. Dengan `cumulative=True` yang diringkas adalah log-return kumulatif
+    langkah 1..h (risiko memegang posisi selama h hari).
+    """
+    returns, sigma2 = simulate_paths(vol_fit, horizon, n_paths=n_paths, seed=seed, chunk_size=chunk_size,
+                                     mean=mean, state=state)
+    if cumulative:
+        returns = np.cumsum(returns, axis=1)
+    return summarize_paths(returns, sigma2, alphas=alphas, quantiles=quantiles, index=index)
+
+
+def forecast_distributions(vol_fits, horizon, n_paths=N_PATHS, seed=None, means=None, max_workers=None, **kwargs):
+    """
+    `forecast_distribution` untuk banyak mata uang (dict nama -> hasil fit), paralel di
+    process pool (`max_workers=1` untuk serial). Setiap mata uang mendapat aliran bilangan
+    acak independen yang diturunkan dari `seed` (SeedSequence.spawn), sehingga hasilnya
+    sama berapa pun jumlah proses. Mengembalikan DataFrame ber-indeks (currency, horizon).
+    """
+    names = list(vol_fits)
+    seeds = np.random.SeedSequence(seed).spawn(len(names))
+    means = means or {}
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(names)))
+
+    jobs = [(vol_fits[name], horizon) for name in names]
+    options = [dict(kwargs, n_paths=n_paths, seed=child, mean=means.get(name)) for name, child in zip(names, seeds)]
+    if max_workers == 1:
+        frames = [forecast_distribution(*job, **opts) for job, opts in zip(jobs, options)]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(forecast_distribution, *job, **opts) for job, opts in zip(jobs, options)]
+            frames = [future.result() for future in futures]
+    return pd.concat(frames, keys=names, names=['currency'])
@@ -0,0 +1,264 @@
+"""
+Penyimpanan kolumnar (Arrow IPC / Feather v2) untuk deret nilai tukar hasil ingest.
+
+Setiap mata uang disimpan di direktori sendiri sebagai satu atau beberapa file
+bagian (`part-00000.feather`, ...) berisi kolom 'Date' dan 'value', terurut dan
+tidak tumpang tindih antar bagian. Pembacaan memakai memory map sehingga kolom
+nilai dapat dipakai tanpa menyalin, dan hanya mata uang yang diminta yang dibuka.
+Tanggal baru ditambahkan sebagai bagian baru tanpa menulis ulang riwayat lama;
+bagian-bagian kecil digabung kembali (compact) bila jumlahnya melewati batas.
+
+File yang diunggah di aplikasi disimpan sebagai dataset terpisah per sidik jari isi
+file (`save_dataset`), sekali saja dan tanpa menggabungkannya dengan data lain:
+unggahan berbeda dengan nama kolom yang sama tidak saling menimpa.
+"""
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - pyarrow bersifat opsional
+    pa = None
+
+DEFAULT_STORE_DIR = os.environ.get('ARIMA_NGARCH_STORE_DIR', str(Path.home() / '.cache' / 'arima_ngarch' / 'store'))
+PART_PATTERN = 'part-*.feather'
+VALID_NAME = re.compile(r'^[A-Za-z0-9_.-]+$')
+DATASETS_DIR = 'datasets'
+DATASET_META = 'dataset.json'
+
+
+def _normalize(series):
+    series = pd.Series(series, dtype=float).dropna()
+    series.index = pd.DatetimeIndex(series.index).as_unit('ns')
+    series = series[~series.index.duplicated(keep='last')]
+    return series.sort_index()
+
+
+class SeriesStore:
+    """
+    Penyimpanan deret harga per mata uang di `directory`.
+    Penulisan bersifat atomik (file sementara lalu os.replace).
+    """
+
+    def __init__(self, directory=DEFAULT_STORE_DIR, max_parts=32):
+        if pa is None:
+            raise ImportError("SeriesStore membutuhkan pyarrow.")
+        self.directory = Path(directory)
+        self.max_parts = max_parts
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _currency_dir(self, currency):
+        if not VALID_NAME.match(str(currency)):
+            raise ValueError(f"Nama mata uang tidak valid untuk penyimpanan: {currency!r}")
+        return self.directory / str(currency)
+
+    def _parts(self, currency):
+        return sorted(self._currency_dir(currency).glob(PART_PATTERN))
+
+    def _write_part(self, currency, series, number):
+        directory = self._currency_dir(currency)
+        directory.mkdir(parents=True, exist_ok=True)
+        table = pa.table({
+            'Date': pa.array(series.index.values, type=pa.timestamp('ns')),
+            'value': pa.array(series.to_numpy(dtype=float), type=pa.float64()),
+        })
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                with pa.ipc.new_file(f, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, directory / f"part-{number:05d}.feather")
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _read_part(path):
+        return pa.ipc.open_file(pa.memory_map(str(path), 'r')).read_all()
+
+    def currencies(self):
+        """Daftar mata uang yang tersimpan."""
+        return sorted(p.name for p in self.directory.iterdir() if p.is_dir() and any(p.glob(PART_PATTERN)))
+
+    def __contains__(self, currency):
+        return bool(self._parts(currency))
+
+    def last_date(self, currency):
+        """Tanggal terakhir yang tersimpan (hanya membaca bagian terakhir), atau None."""
+        parts = self._parts(currency)
+        if not parts:
+            return None
+        dates = self._read_part(parts[-1]).column('Date')
+        return pd.Timestamp(dates[len(dates) - 1].as_py()) if len(dates) else None
+
+    def load(self, currency, start=None, end=None):
+        """
+        Membaca deret satu mata uang sebagai pd.Series ber-indeks tanggal.
+        Dengan satu bagian saja, nilai dibaca langsung dari memory map tanpa salinan.
+        """
+        parts = self._parts(currency)
+        if not parts:
+            raise KeyError(f"Mata uang '{currency}' belum tersimpan.")
+        table = pa.concat_tables([self._read_part(path) for path in parts])
+        dates = table.column('Date').to_numpy()
+        values = table.column('value').to_numpy()
+        series = pd.Series(values, index=pd.DatetimeIndex(dates, name='Date'), name=str(currency), copy=False)
+        if start is not None or end is not None:
+            series = series.loc[start:end]
+        return series
+
+    def load_frame(self, currencies=None, start=None, end=None):
+        """Membaca beberapa mata uang sebagai DataFrame sejajar tanggal (seperti `df_currency_raw_multi`)."""
+        if currencies is None:
+            currencies = self.currencies()
+        if not currencies:
+            return pd.DataFrame()
+        frame = pd.concat([self.load(c, start, end) for c in currencies], axis=1).sort_index()
+        frame.index.name = 'Date'
+        return frame
+
+    def append(self, currency, series):
+        """
+        Menambahkan data baru untuk `currency`. Tanggal setelah tanggal terakhir ditulis
+        sebagai bagian baru; bila ada tanggal lama yang berubah atau belum ada, riwayat
+        digabung (nilai baru menang) dan ditulis ulang. Mengembalikan jumlah baris baru/berubah.
+        """
+        series = _normalize(series)
+        if series.empty:
+            return 0
+        parts = self._parts(currency)
+        if not parts:
+            self._write_part(currency, series, 0)
+            return len(series)
+
+        last = self.last_date(currency)
+        older, newer = series[series.index <= last], series[series.index > last]
+        changed = 0
+        if len(older):
+            stored = self.load(currency)
+            # Tanggal yang belum ada (NaN setelah reindex) juga dihitung berubah
+            changed = int((stored.reindex(older.index).to_numpy() != older.to_numpy()).sum())
+            if changed:
+                merged = older.combine_first(stored)
+                merged = pd.concat([merged, newer]) if len(newer) else merged
+                self._rewrite(currency, merged)
+                return changed + len(newer)
+
+        if len(newer):
+            number = int(parts[-1].stem.split('-')[1]) + 1
+            self._write_part(currency, newer, number)
+            if len(parts) + 1 > self.max_parts:
+                self.compact(currency)
+        return changed + len(newer)
+
+    def _rewrite(self, currency, series):
+        old_parts = self._parts(currency)
+        number = int(old_parts[-1].stem.split('-')[1]) + 1 if old_parts else 0
+        self._write_part(currency, _normalize(series), number)
+        for path in old_parts:
+            path.unlink()
+
+    def compact(self, currency):
+        """Menggabungkan semua bagian `currency` menjadi satu file (pembacaan tanpa salinan)."""
+        if len(self._parts(currency)) > 1:
+            self._rewrite(currency, self.load(currency).copy())
+
+    def write_frame(self, df, columns=None):
+        """Menyimpan/menambahkan setiap kolom numerik `df`; mengembalikan jumlah baris baru per mata uang."""
+        if columns is None:
+            columns = [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col])]
+        return {col: self.append(col, df[col]) for col in columns}
+
+    def delete(self, currency):
+        shutil.rmtree(self._currency_dir(currency), ignore_errors=True)
+
+    def info(self):
+        """Ringkasan per mata uang: jumlah baris, rentang tanggal, jumlah bagian dan ukuran file."""
+        rows = []
+        for currency in self.currencies():
+            parts = self._parts(currency)
+            series = self.load(currency)
+            rows.append({
+                'currency': currency,
+                'rows': len(series),
+                'first': series.index.min(),
+                'last': series.index.max(),
+                'parts': len(parts),
+                'bytes': sum(p.stat().st_size for p in parts),
+            })
+        return pd.DataFrame(rows).set_index('currency') if rows else pd.DataFrame()
+
+
+def _datasets_root(directory):
+    root = Path(directory) / DATASETS_DIR
+    root.mkdir(parents=True, exist_ok=True)
+    return root
+
+
+def dataset_name(digest):
+    """Nama dataset untuk sidik jari isi file `digest` (lihat `file_digest`)."""
+    return str(digest)[:16]
+
+
+def open_dataset(name, directory=DEFAULT_STORE_DIR):
+    """SeriesStore (hanya untuk dibaca) berisi dataset `name` hasil `save_dataset`."""
+    if not VALID_NAME.match(str(name)):
+        raise ValueError(f"Nama dataset tidak valid: {name!r}")
+    path = Path(directory) / DATASETS_DIR / str(name)
+    if not (path / DATASET_META).exists():
+        raise KeyError(f"Dataset '{name}' belum tersimpan.")
+    return SeriesStore(path)
+
+
+def save_dataset(df, digest, label=None, directory=DEFAULT_STORE_DIR):
+    """
+    Menyimpan kolom numerik `df` sebagai dataset `dataset_name(digest)`, sekali per digest.
+    Dataset ditulis di direktori sementara lalu di-rename, sehingga pembaca (atau sesi lain
+    yang menyimpan file yang sama) tidak pernah melihat dataset setengah jadi.
+    Mengembalikan (nama, True bila baru ditulis / False bila sudah ada).
+    """
+    name = dataset_name(digest)
+    root = _datasets_root(directory)
+    target = root / name
+    if (target / DATASET_META).exists():
+        return name, False
+    tmp = Path(tempfile.mkdtemp(dir=root, prefix='.tmp-'))
+    try:
+        store = SeriesStore(tmp)
+        store.write_frame(df)
+        meta = {'label': label or name, 'digest': str(digest), 'saved': time.time(), 'currencies': store.currencies()}
+        (tmp / DATASET_META).write_text(json.dumps(meta))
+        os.rename(tmp, target)
+    except OSError:
+        # Sesi lain sudah menyimpan file yang sama lebih dulu
+        shutil.rmtree(tmp, ignore_errors=True)
+        if (target / DATASET_META).exists():
+            return name, False
+        raise
+    except Exception:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return name, True
+
+
+def list_datasets(directory=DEFAULT_STORE_DIR):
+    """Ringkasan dataset tersimpan (label, mata uang, waktu simpan), terbaru lebih dulu."""
+    rows = []
+    for path in _datasets_root(directory).iterdir():
+        try:
+            meta = json.loads((path / DATASET_META).read_text())
+        except (OSError, ValueError):
+            continue
+        rows.append({'dataset': path.name, 'label': meta.get('label', path.name),
+                     'currencies': meta.get('currencies', []), 'saved': pd.Timestamp(meta.get('saved', 0), unit='s')})
+    if not rows:
+        return pd.DataFrame(columns=['label', 'currencies', 'saved'])
+    return pd.DataFrame(rows).set_index('dataset').sort_values('saved', ascending=False)
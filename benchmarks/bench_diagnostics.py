@@ -0,0 +1,69 @@
+"""
+Benchmark diagnostik residual: uji per model dengan statsmodels/scipy (Ljung-Box residual
+dan kuadrat pada setiap lag, ARCH-LM, Jarque-Bera, KS) dibandingkan `residual_diagnostics`
+yang memproses semua residual sekaligus lewat autokovarians FFT.
+
+    python benchmarks/bench_diagnostics.py --models 36 --currencies 20 --obs 1500
+"""
+import argparse
+import sys
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from arima_ngarch.diagnostics import residual_diagnostics  # noqa: E402
+
+
+def legacy_diagnostics(residuals, lags):
+    from statsmodels.stats.diagnostic import acorr_ljungbox, het_arch
+
+    rows = {}
+    for name in residuals:
+        x = residuals[name].dropna().to_numpy()
+        lb = acorr_ljungbox(x, lags=lags, return_df=True)
+        lb_sq = acorr_ljungbox(x ** 2, lags=lags, return_df=True)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            arch = het_arch(x, nlags=lags)
+        rows[name] = (lb, lb_sq, arch, stats.jarque_bera(x), stats.kstest((x - x.mean()) / x.std(), 'norm'))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--models', type=int, default=36)
+    parser.add_argument('--currencies', type=int, default=20)
+    parser.add_argument('--obs', type=int, default=1500)
+    parser.add_argument('--lags', type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    n_series = args.models * args.currencies
+    residuals = pd.DataFrame(rng.standard_t(5, size=(args.obs, n_series)),
+                             columns=[f"m{i}" for i in range(n_series)])
+
+    start = time.perf_counter()
+    legacy = legacy_diagnostics(residuals, args.lags)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    summary, ljung_box = residual_diagnostics(residuals, args.lags)
+    batched_time = time.perf_counter() - start
+
+    lb_error = max(np.abs(ljung_box.loc[name, 'lb_stat'].to_numpy() - legacy[name][0]['lb_stat'].to_numpy()).max()
+                   for name in residuals)
+    arch_error = max(abs(summary.loc[name, 'arch_lm_stat'] - legacy[name][2][0]) for name in residuals)
+    print(f"{n_series} residual x {args.obs} observasi, Ljung-Box lag 1-{args.lags}")
+    print(f"  statsmodels/scipy per model : {legacy_time:8.3f} s")
+    print(f"  residual_diagnostics        : {batched_time:8.3f} s  ({legacy_time / batched_time:.1f}x)")
+    print(f"  selisih maks Ljung-Box {lb_error:.2e}, ARCH-LM {arch_error:.2e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark ukuran payload grafik Plotly untuk deret panjang: semua titik dibandingkan
+deret yang ditipiskan dengan `downsample` (LTTB dan min-max) ke MAX_POINTS titik.
+
+    python benchmarks/bench_downsample.py --rows 1000000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from arima_ngarch.downsample import MAX_POINTS, downsample  # noqa: E402
+
+
+def figure_payload(series):
+    start = time.perf_counter()
+    fig = go.Figure(go.Scatter(x=series.index, y=series.values, mode='lines'))
+    payload = fig.to_json()
+    return len(payload), time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--max-points', type=int, default=MAX_POINTS)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    index = pd.date_range('2015-01-01', periods=args.rows, freq='min')
+    returns = pd.Series(rng.standard_t(4, args.rows) * 1e-3, index=index)
+
+    size, elapsed = figure_payload(returns)
+    print(f"{args.rows} titik, batas {args.max_points} titik per trace")
+    print(f"  tanpa penipisan : {size / 1e6:8.2f} MB JSON, {elapsed:6.3f} s")
+    for method, series in [('lttb', returns.cumsum()), ('minmax', returns ** 2)]:
+        downsample(series.iloc[:10_000], args.max_points, method)  # pemanasan
+        start = time.perf_counter()
+        points = downsample(series, args.max_points, method)
+        decimate = time.perf_counter() - start
+        size, elapsed = figure_payload(points)
+        print(f"  {method:<15} : {size / 1e6:8.2f} MB JSON, {decimate + elapsed:6.3f} s "
+              f"(penipisan {decimate * 1e3:.1f} ms, {len(points)} titik)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark pembacaan CSV nilai tukar: cara lama (seluruh file dibaca sebagai teks lalu
+tiga kali `str.replace` + `pd.to_numeric`) dibandingkan `read_currency_csv` yang membaca
+per blok dengan decimal=',' / thousands='.' langsung di parser C.
+
+    python benchmarks/bench_ingest.py --rows 200000 1000000
+"""
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from arima_ngarch.data import DATE_FORMAT, read_currency_csv  # noqa: E402
+
+
+def legacy_read(path):
+    df = pd.read_csv(path, delimiter=';', dtype=str)
+    df.columns = df.columns.str.strip()
+    df['Date'] = pd.to_datetime(df['Date'], format=DATE_FORMAT, errors='coerce')
+    df = df.dropna(subset=['Date']).sort_values('Date').set_index('Date')
+    for col in df.columns:
+        cleaned = df[col].astype(str) \
+            .str.replace('.', '', regex=False) \
+            .str.replace(',', '.', regex=False) \
+            .str.replace('[^0-9.-]', '', regex=True)
+        df[col] = pd.to_numeric(cleaned, errors='coerce')
+    return df.sort_index()
+
+
+def write_tick_csv(path, rows, seed=0):
+    """CSV tick per menit berformat Eropa dengan kolom IDR, MYR, SGD."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2015-01-01', periods=rows, freq='min').strftime(DATE_FORMAT)
+    frame = pd.DataFrame({'Date': dates})
+    for name, level in (('IDR', 14000.0), ('MYR', 4.2), ('SGD', 1.38)):
+        values = level * np.exp(np.cumsum(rng.normal(0, 1e-4, rows)))
+        text = pd.Series(values).map('{:,.4f}'.format)
+        frame[name] = text.str.replace(',', '_').str.replace('.', ',').str.replace('_', '.')
+    frame.to_csv(path, sep=';', index=False)
+
+
+def measure(func, path):
+    # Waktu diukur tanpa tracemalloc (yang memperlambat alokasi); memori puncak pada lintasan terpisah
+    start = time.perf_counter()
+    result = func(path)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 2 ** 20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--rows', type=int, nargs='+', default=[200_000, 1_000_000])
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            path = Path(tmp) / f'ticks_{rows}.csv'
+            write_tick_csv(path, rows)
+            size = path.stat().st_size / 2 ** 20
+            old, old_time, old_peak = measure(legacy_read, path)
+            new, new_time, new_peak = measure(read_currency_csv, path)
+            old.index = old.index.as_unit('ns')
+            pd.testing.assert_frame_equal(old, new)
+            print(f"rows={rows:>9,} ({size:6.1f} MB)  lama: {old_time:6.2f} s, puncak {old_peak:7.1f} MB | "
+                  f"baru: {new_time:6.2f} s, puncak {new_peak:7.1f} MB  ({old_time / new_time:4.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,212 @@
+"""
+Benchmark tahap-tahap pipeline ARIMA-GARCH/NGARCH pada data sintetis mirip FX, dengan
+perbandingan terhadap baseline tersimpan untuk mendeteksi regresi.
+
+Untuk setiap ukuran (jumlah observasi) dibangkitkan harga dari ARMA(1,1) + GJR-GARCH-t,
+ditulis ke CSV berformat Eropa, lalu diukur waktu (terbaik dari `--repeat`) dan memori
+puncak (tracemalloc, lintasan terpisah) tahap: ingest CSV, log-return + split, fit
+ARIMA, fit GARCH, fit NGARCH (Engle-Ng), forecast, dan diagnostik residual.
+
+    python benchmarks/bench_pipeline.py                                  # 1k/10k/100k, bandingkan baseline
+    python benchmarks/bench_pipeline.py --sizes 1000 10000 100000 1000000
+    python benchmarks/bench_pipeline.py --save-baseline                  # tulis ulang baseline
+
+Keluar dengan kode 1 bila ada tahap yang lebih lambat atau lebih boros memori dari
+baseline melebihi `--tolerance` (dan selisih absolutnya di atas ambang derau).
+Baseline bergantung mesin: simpan ulang setelah berganti mesin atau versi pustaka.
+"""
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from arima_ngarch.data import DATE_FORMAT, load_currency_data  # noqa: E402
+from arima_ngarch.diagnostics import residual_diagnostics  # noqa: E402
+from arima_ngarch.pipeline import (compute_log_returns, fit_arima, fit_garch, fit_ngarch,  # noqa: E402
+                                   forecast_volatility, split_train_test)
+
+DEFAULT_SIZES = (1000, 10_000, 100_000)
+DEFAULT_BASELINE = Path(__file__).resolve().parent / 'baseline_pipeline.json'
+HORIZON = 30
+WARM_UP_SIZE = 500
+
+
+def synthetic_fx_prices(nobs, seed=0, level=15000.0, phi=0.05, theta=-0.1,
+                        params=(2e-7, 0.04, 0.05, 0.92), nu=6.0):
+    """
+    Harga sintetis mirip FX: log-return ARMA(1,1) dengan galat GJR-GARCH(1,1,1)-t,
+    ber-indeks per menit (indeks harian tidak muat untuk 1 juta observasi).
+    """
+    rng = np.random.default_rng(seed)
+    omega, alpha, gamma, beta = params
+    shocks = (rng.standard_t(nu, nobs) * np.sqrt((nu - 2) / nu)).tolist()
+    returns = np.empty(nobs)
+    sigma2 = omega / (1 - alpha - 0.5 * gamma - beta)
+    prev_return = prev_resid = 0.0
+    for t in range(nobs):
+        resid = shocks[t] * sigma2 ** 0.5
+        prev_return = phi * prev_return + resid + theta * prev_resid
+        returns[t] = prev_return
+        sigma2 = omega + (alpha + gamma * (resid < 0)) * resid * resid + beta * sigma2
+        prev_resid = resid
+    index = pd.date_range('2015-01-01', periods=nobs, freq='min')
+    return pd.Series(level * np.exp(np.cumsum(returns)), index=index, name='IDR')
+
+
+def write_currency_csv(path, prices):
+    """CSV berformat aplikasi: pemisah ';', tanggal DATE_FORMAT, angka 1.234,5678."""
+    text = prices.map('{:,.4f}'.format)
+    frame = pd.DataFrame({
+        'Date': prices.index.strftime(DATE_FORMAT),
+        prices.name: text.str.replace(',', '_').str.replace('.', ',').str.replace('_', '.'),
+    })
+    frame.to_csv(path, sep=';', index=False)
+
+
+def _ingest(ctx):
+    return load_currency_data(ctx['csv'], cache=None)['IDR']
+
+
+def _returns_split(ctx):
+    returns, _, _ = compute_log_returns(ctx['ingest'])
+    return split_train_test(returns, HORIZON)
+
+
+def _arima_fit(ctx):
+    return fit_arima(ctx['returns_split'][0], (1, 0, 1))
+
+
+def _garch_fit(ctx):
+    return fit_garch(ctx['arima_fit'].resid)
+
+
+def _ngarch_fit(ctx):
+    return fit_ngarch(ctx['arima_fit'].resid, kind='engle-ng')
+
+
+def _forecast(ctx):
+    mean = np.asarray(ctx['arima_fit'].forecast(steps=HORIZON))
+    return mean, forecast_volatility(ctx['ngarch_fit'], HORIZON)
+
+
+def _diagnostics(ctx):
+    return residual_diagnostics({
+        'arima': ctx['arima_fit'].resid,
+        'garch': ctx['garch_fit'].std_resid,
+        'ngarch': ctx['ngarch_fit'].std_resid,
+    })
+
+
+STAGES = (
+    ('ingest', _ingest),
+    ('returns_split', _returns_split),
+    ('arima_fit', _arima_fit),
+    ('garch_fit', _garch_fit),
+    ('ngarch_fit', _ngarch_fit),
+    ('forecast', _forecast),
+    ('diagnostics', _diagnostics),
+)
+
+
+def measure(func, ctx, repeat):
+    # Waktu diukur tanpa tracemalloc (yang memperlambat alokasi); memori puncak pada lintasan terpisah
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(ctx)
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func(ctx)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, min(timings), peak / 2 ** 20
+
+
+def run_size(nobs, repeat, directory, report=True):
+    """Mengukur semua tahap untuk `nobs` observasi; mengembalikan dict tahap -> {seconds, peak_mb}."""
+    csv = Path(directory) / f"fx_{nobs}.csv"
+    write_currency_csv(csv, synthetic_fx_prices(nobs))
+    ctx = {'csv': csv}
+    results = {}
+    with warnings.catch_warnings():
+        # Peringatan konvergensi/skala statsmodels dan arch tidak relevan untuk pengukuran waktu.
+        # arch mengaktifkan ulang ConvergenceWarning di dalam fit(), jadi tampilannya yang dimatikan.
+        warnings.simplefilter('ignore')
+        warnings.showwarning = lambda *args, **kwargs: None
+        for name, func in STAGES:
+            ctx[name], seconds, peak_mb = measure(func, ctx, repeat)
+            results[name] = {'seconds': round(seconds, 5), 'peak_mb': round(peak_mb, 2)}
+            if report:
+                print(f"  {nobs:>9} {name:<14} {seconds:9.4f} s  {peak_mb:9.1f} MB", flush=True)
+    return results
+
+
+def compare(results, baseline, tolerance, min_seconds, min_mb):
+    """Daftar regresi (ukuran, tahap, metrik, baseline, sekarang) terhadap `baseline`."""
+    regressions = []
+    for size, stages in results.items():
+        for stage, current in stages.items():
+            reference = baseline.get(size, {}).get(stage)
+            if reference is None:
+                continue
+            for metric, floor in (('seconds', min_seconds), ('peak_mb', min_mb)):
+                before, after = reference[metric], current[metric]
+                if after > before * (1 + tolerance) and after - before > floor:
+                    regressions.append((size, stage, metric, before, after))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='kenaikan relatif yang masih diterima')
+    parser.add_argument('--min-seconds', type=float, default=0.02, help='selisih waktu di bawah ini dianggap derau')
+    parser.add_argument('--min-mb', type=float, default=1.0, help='selisih memori di bawah ini dianggap derau')
+    args = parser.parse_args()
+
+    print(f"{'obs':>11} {'tahap':<14} {'waktu':>11}  {'memori puncak':>12}")
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        # Lintasan pemanasan tanpa laporan: impor lazy (statsmodels, arch) dan kompilasi numba
+        # tidak ikut terukur pada ukuran pertama
+        run_size(WARM_UP_SIZE, 1, directory, report=False)
+        for nobs in args.sizes:
+            results[str(nobs)] = run_size(nobs, args.repeat, directory)
+
+    if args.save_baseline:
+        # Ukuran yang tidak diukur ulang dipertahankan dari baseline lama
+        stored = json.loads(args.baseline.read_text())['results'] if args.baseline.exists() else {}
+        stored.update(results)
+        meta = {'python': platform.python_version(), 'machine': platform.machine(), 'numpy': np.__version__,
+                'pandas': pd.__version__}
+        args.baseline.write_text(json.dumps({'meta': meta, 'results': stored}, indent=2) + '\n')
+        print(f"Baseline disimpan ke {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"Baseline {args.baseline} belum ada; jalankan dengan --save-baseline.")
+        return 0
+    baseline = json.loads(args.baseline.read_text())['results']
+    regressions = compare(results, baseline, args.tolerance, args.min_seconds, args.min_mb)
+    for size, stage, metric, before, after in regressions:
+        print(f"REGRESI {size:>9} {stage:<14} {metric:<8} {before:10.4f} -> {after:10.4f} ({after / before:.2f}x)")
+    if not regressions:
+        print(f"Tidak ada regresi terhadap baseline (toleransi {args.tolerance:.0%}).")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+Benchmark tabel koefisien: cara lama halaman ARIMA (summary() dirender ke teks, lalu
+sekali lagi ke HTML dan di-parse kembali dengan pd.read_html) dibandingkan `model_report`
+yang membaca array hasil fit langsung, serta ukuran/waktu penyimpanan banyak laporan
+(JSON Lines dan Arrow IPC) dibandingkan pickle hasil fit.
+
+    python benchmarks/bench_report.py --fits 5 --reports 1000
+"""
+import argparse
+import io
+import pickle
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from arima_ngarch.pipeline import fit_arima  # noqa: E402
+from arima_ngarch.report import load_reports, model_report, save_reports  # noqa: E402
+
+from bench_batched import simulate_gjr_t  # noqa: E402
+
+
+def legacy_table(result):
+    result.summary().as_text()
+    html = result.summary().tables[1].as_html()
+    return pd.read_html(io.StringIO(html), header=0, index_col=0)[0]
+
+
+def report_table(result):
+    result.summary().as_text()
+    return model_report(result).coefficients()
+
+
+def timed_tables(method, returns, fits):
+    # Setiap percobaan memakai hasil fit baru: standard error statsmodels di-cache di objek hasil
+    total = 0.0
+    for i in range(fits):
+        result = fit_arima(returns.iloc[i:], (1, 0, 1))
+        start = time.perf_counter()
+        method(result)
+        total += time.perf_counter() - start
+    return total / fits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--fits', type=int, default=5)
+    parser.add_argument('--reports', type=int, default=1000)
+    parser.add_argument('--nobs', type=int, default=1300)
+    args = parser.parse_args()
+
+    returns = pd.Series(simulate_gjr_t(args.nobs, 1)[:, 0], index=pd.bdate_range('2019-01-01', periods=args.nobs))
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        # Pemanasan: impor lazy statsmodels dan parser HTML tidak ikut terukur
+        legacy_table(fit_arima(returns, (1, 0, 1)))
+        legacy = timed_tables(legacy_table, returns, args.fits)
+        direct = timed_tables(report_table, returns, args.fits)
+        result = fit_arima(returns, (1, 0, 1))
+
+    print(f"Tabel koefisien per fit (rata-rata {args.fits} fit, termasuk ringkasan teks):")
+    print(f"  summary -> HTML -> read_html : {legacy * 1000:8.2f} ms")
+    print(f"  model_report                 : {direct * 1000:8.2f} ms")
+
+    reports = [model_report(result, name=f"S{i:05d}") for i in range(args.reports)]
+    print(f"Penyimpanan {args.reports} laporan ARIMA(1,0,1):")
+    with tempfile.TemporaryDirectory() as directory:
+        for suffix in ('jsonl', 'feather'):
+            path = Path(directory) / f"reports.{suffix}"
+            start = time.perf_counter()
+            save_reports(reports, path)
+            saved = time.perf_counter() - start
+            start = time.perf_counter()
+            load_reports(path)
+            loaded = time.perf_counter() - start
+            print(f"  {suffix:<8}: {path.stat().st_size / 2 ** 10:9.1f} KB  simpan {saved:6.3f} s  muat {loaded:6.3f} s")
+    print(f"  pickle hasil fit: {len(pickle.dumps(result)) * args.reports / 2 ** 10:9.1f} KB (perkiraan)")
+
+
+if __name__ == '__main__':
+    main()
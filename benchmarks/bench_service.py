@@ -0,0 +1,125 @@
+"""
+Benchmark latensi forecast layanan HTTP: model hangat di `ModelPool` dibandingkan
+cara halaman aplikasi (hasil fit di-unpickle lalu forecast statsmodels + arch), serta
+latensi request HTTP/JSON ke server uvicorn lokal dengan beberapa klien bersamaan,
+termasuk selama fit ulang berjalan di latar belakang.
+
+    python benchmarks/bench_service.py --currencies 3 --requests 2000 --clients 8
+"""
+import argparse
+import json
+import pickle
+import sys
+import threading
+import time
+import urllib.request
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from arima_ngarch.jobs import JobManager  # noqa: E402
+from arima_ngarch.pipeline import compute_log_returns, fit_arima, fit_ngarch, forecast_volatility  # noqa: E402
+from arima_ngarch.service import ModelPool, create_app  # noqa: E402
+
+from bench_pipeline import synthetic_fx_prices  # noqa: E402
+
+HORIZON = 30
+
+
+def per_call(func, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        func()
+    return (time.perf_counter() - start) / n
+
+
+def reload_and_forecast(blobs):
+    # Seperti rerun Streamlit tanpa cache resource: hasil fit dimuat ulang lalu forecast
+    arima, ngarch = pickle.loads(blobs[0]), pickle.loads(blobs[1])
+    np.asarray(arima.forecast(steps=HORIZON))
+    forecast_volatility(ngarch, HORIZON)
+
+
+def start_server(app, port):
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(app, host='127.0.0.1', port=port, log_level='warning'))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, thread
+
+
+def http_latencies(url, requests, clients):
+    def get(_):
+        start = time.perf_counter()
+        with urllib.request.urlopen(url) as response:
+            json.loads(response.read())
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        return np.array(list(executor.map(get, range(requests))))
+
+
+def describe(latencies):
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+    return f"p50 {p50:7.2f} ms  p99 {p99:7.2f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--currencies', type=int, default=3)
+    parser.add_argument('--nobs', type=int, default=1300)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    names = [f"C{i:02d}" for i in range(args.currencies)]
+    prices = {name: synthetic_fx_prices(args.nobs, seed=i).rename(name) for i, name in enumerate(names)}
+    for series in prices.values():
+        series.index = pd.bdate_range('2019-01-01', periods=args.nobs)
+
+    warnings.simplefilter('ignore')
+    returns, _, _ = compute_log_returns(prices[names[0]])
+    arima = fit_arima(returns)
+    ngarch = fit_ngarch(arima.resid.dropna())
+    blobs = (pickle.dumps(arima), pickle.dumps(ngarch))
+
+    pool = ModelPool(jobs=JobManager(kind='process'))
+    start = time.perf_counter()
+    for name in names:
+        pool.add(name, prices[name])
+    for name in names:
+        pool.refit(name, wait=True)
+    print(f"Fit awal {args.currencies} mata uang (pool proses): {time.perf_counter() - start:6.2f} s")
+
+    print(f"Forecast {HORIZON} langkah, di dalam proses:")
+    print(f"  unpickle fit + statsmodels/arch : {per_call(lambda: reload_and_forecast(blobs), 50) * 1e3:8.3f} ms")
+    print(f"  statsmodels/arch (fit di memori) : "
+          f"{per_call(lambda: (arima.forecast(steps=HORIZON), forecast_volatility(ngarch, HORIZON)), 50) * 1e3:8.3f} ms")
+    print(f"  ModelPool.forecast               : {per_call(lambda: pool.forecast(names[0], HORIZON), 2000) * 1e3:8.3f} ms")
+
+    server, thread = start_server(create_app(pool), args.port)
+    url = f"http://127.0.0.1:{args.port}/forecast/{names[0]}?horizon={HORIZON}"
+    http_latencies(url, 50, 1)
+    print(f"HTTP GET /forecast ({args.requests} request, {args.clients} klien):")
+    print(f"  model hangat      : {describe(http_latencies(url, args.requests, args.clients))}")
+    for name in names:
+        pool.refit(name)
+    print(f"  selama fit ulang  : {describe(http_latencies(url, args.requests, args.clients))}")
+    for name in names:
+        pool.refit(name, wait=True)
+    server.should_exit = True
+    thread.join()
+    pool.close(wait=True)
+
+
+if __name__ == '__main__':
+    main()
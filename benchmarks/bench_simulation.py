@@ -0,0 +1,65 @@
+"""
+Benchmark simulasi Monte-Carlo distribusi prediksi: `forecast_distributions` (semua jalur
+dimajukan per langkah sebagai array, per chunk) untuk banyak mata uang, dibandingkan
+forecast simulasi bawaan arch (`method='simulation'`) untuk satu mata uang.
+
+    python benchmarks/bench_simulation.py --paths 100000 --horizon 30 --currencies 20
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+import warnings
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from arch import arch_model  # noqa: E402
+
+from arima_ngarch.simulation import forecast_distribution, forecast_distributions  # noqa: E402
+
+from bench_batched import simulate_gjr_t  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--paths', type=int, default=100_000)
+    parser.add_argument('--horizon', type=int, default=30)
+    parser.add_argument('--currencies', type=int, default=20)
+    parser.add_argument('--nobs', type=int, default=1500)
+    args = parser.parse_args()
+
+    data = simulate_gjr_t(args.nobs, args.currencies) * 100
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        fits = {f"C{i:02d}": arch_model(data[:, i], mean='zero', vol='Garch', p=1, o=1, q=1, dist='t').fit(disp='off')
+                for i in range(args.currencies)}
+    first = fits['C00']
+
+    start = time.perf_counter()
+    first.forecast(horizon=args.horizon, method='simulation', simulations=args.paths, reindex=False)
+    arch_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    forecast_distribution(first, args.horizon, n_paths=args.paths, seed=0)
+    single_time = time.perf_counter() - start
+
+    tracemalloc.start()
+    forecast_distribution(first, args.horizon, n_paths=args.paths, seed=0)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f"{args.paths} jalur x {args.horizon} hari")
+    print(f"  arch forecast(method='simulation'), 1 mata uang : {arch_time:7.3f} s")
+    print(f"  forecast_distribution, 1 mata uang              : {single_time:7.3f} s  (puncak memori {peak / 1e6:.0f} MB)")
+    for workers in (1, None):
+        start = time.perf_counter()
+        table = forecast_distributions(fits, args.horizon, n_paths=args.paths, seed=0, max_workers=workers)
+        label = f"{workers or os.cpu_count()} proses"
+        print(f"  forecast_distributions, {args.currencies} mata uang ({label:<9}): "
+              f"{time.perf_counter() - start:7.3f} s  ({len(table)} baris)")
+
+
+if __name__ == '__main__':
+    main()
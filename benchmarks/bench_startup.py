@@ -0,0 +1,79 @@
+"""
+Benchmark waktu mulai dingin (cold start): setiap skenario dijalankan di proses Python baru.
+
+* `import arima_ngarch` saja;
+* eksekusi pertama streamlit_app.py di halaman HOME (AppTest, tanpa server);
+* worker process pool baru (start method 'spawn', seperti macOS/Windows dan forkserver)
+  yang menjalankan satu tugas dari `arima_ngarch.diagnostics`.
+
+Untuk setiap skenario dicatat median waktu dan pustaka berat yang ikut termuat.
+
+    python benchmarks/bench_startup.py --repeat 5
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+HEAVY = ['statsmodels', 'arch', 'scipy.stats', 'sklearn', 'matplotlib', 'numba', 'pyarrow']
+
+PRELUDE = f"""
+import json, sys, time
+sys.path.insert(0, {str(ROOT)!r})
+HEAVY = {HEAVY!r}
+def report(elapsed):
+    print(json.dumps({{'time': elapsed, 'loaded': [m for m in HEAVY if m in sys.modules]}}))
+"""
+
+SCENARIOS = {
+    'import arima_ngarch': """
+start = time.perf_counter()
+import arima_ngarch
+report(time.perf_counter() - start)
+""",
+    'aplikasi, halaman HOME': """
+import warnings
+warnings.simplefilter('ignore')
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=300)
+start = time.perf_counter()
+at.run()
+report(time.perf_counter() - start)
+""".format(app=str(ROOT / 'streamlit_app.py')),
+    'worker process pool': """
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+if __name__ == '__main__':
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+        from arima_ngarch.diagnostics import autocorrelations
+        executor.submit(autocorrelations, np.ones((10, 1)), 2).result()
+    elapsed = time.perf_counter() - start
+    print(json.dumps({'time': elapsed, 'loaded': []}))
+""",
+}
+
+
+def run(code):
+    result = subprocess.run([sys.executable, '-c', PRELUDE + code], capture_output=True, text=True, cwd=ROOT)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr[-2000:])
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    for name, code in SCENARIOS.items():
+        runs = [run(code) for _ in range(args.repeat)]
+        loaded = ', '.join(runs[-1]['loaded']) or '-'
+        print(f"{name:<26}: {statistics.median(r['time'] for r in runs):6.3f} s   termuat: {loaded}")
+
+
+if __name__ == '__main__':
+    main()
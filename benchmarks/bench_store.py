@@ -0,0 +1,59 @@
+"""
+Benchmark pemuatan riwayat nilai tukar: parse ulang CSV (`read_currency_csv`) dibandingkan
+membaca dari `SeriesStore` (Arrow IPC ber-memory map) untuk semua mata uang atau satu kolom,
+serta biaya menambahkan tanggal baru.
+
+    python benchmarks/bench_store.py --rows 1000000
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from arima_ngarch.data import read_currency_csv  # noqa: E402
+from arima_ngarch.store import SeriesStore  # noqa: E402
+
+from bench_ingest import write_tick_csv  # noqa: E402
+
+
+def best_time(func, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'ticks.csv'
+        write_tick_csv(path, args.rows)
+        frame = read_currency_csv(path)
+        history, latest = frame.iloc[:-1440], frame.iloc[-1440:]
+
+        store = SeriesStore(Path(tmp) / 'store')
+        store.write_frame(history)
+
+        csv_time = best_time(lambda: read_currency_csv(path), repeat=2)
+        frame_time = best_time(lambda: store.load_frame())
+        column_time = best_time(lambda: store.load('IDR'))
+        start = time.perf_counter()
+        store.write_frame(latest)
+        append_time = time.perf_counter() - start
+        pd.testing.assert_frame_equal(store.load_frame(), frame, check_freq=False)
+
+        print(f"rows={args.rows:,}  parse CSV: {csv_time * 1e3:8.1f} ms | store semua kolom: {frame_time * 1e3:6.1f} ms | "
+              f"store satu kolom: {column_time * 1e3:6.1f} ms | append 1 hari: {append_time * 1e3:6.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+"""
+Konversi satu kali model ARIMA lama (models/model_arima_*.pkl, pickle ARIMAResults)
+menjadi artefak JSON ringkas (models/model_arima_*.json).
+
+Skrip ini memakai pickle.load, jadi jalankan hanya pada file yang tepercaya:
+
+    python scripts/convert_arima_pickles.py models/model_arima_*.pkl
+"""
+import pickle
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from arima_ngarch.artifacts import ArimaArtifact  # noqa: E402
+
+
+def main(paths):
+    for path in map(Path, paths):
+        with open(path, 'rb') as f:
+            results = pickle.load(f)
+        out_path = path.with_suffix('.json')
+        ArimaArtifact.from_results(results).save(out_path)
+        print(f"{path} ({path.stat().st_size:,} B) -> {out_path} ({out_path.stat().st_size:,} B)")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
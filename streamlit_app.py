@@ -1,50 +1,13 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-from pathlib import Path
-import math
-from statsmodels.tsa.stattools import adfuller, kpss
-from statsmodels.graphics.tsaplots import plot_acf, plot_pacf
-from sklearn.preprocessing import MinMaxScaler
-from sklearn.model_selection import train_test_split
-import matplotlib.pyplot as plt
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import statsmodels.api as sm # Untuk Ljung-Box, Jarque-Bera
-from scipy import stats # Untuk Jarque-Bera test
-from statsmodels.tsa.arima.model import ARIMA
-from arch import arch_model
-from scipy.stats import kstest
-from statsmodels.stats.diagnostic import acorr_ljungbox
 import pickle
 import os
-from datetime import datetime
+# Hanya modul ringan yang diimpor di sini; statsmodels, arch, scipy.stats, numba,
+# pyarrow dan matplotlib dimuat oleh halaman (atau tombol) yang memakainya.
+from arima_ngarch import FitCache, Profiler, downsample
 
-def load_data(file_source=None, default_filename=None):
-    import pandas as pd
-
-    try:
-        if file_source == 'default':
-            df = pd.read_csv(default_filename, sep=';', decimal='.')
-        else:
-            df = pd.read_csv(file_source, sep=';', decimal='.')
-
-        # Konversi kolom angka ke numerik
-        for col in df.columns:
-            if col != 'Date':
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-
-        # Set kolom 'Date' sebagai index kalau ada
-        if 'Date' in df.columns:
-            df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-            df = df.set_index('Date')
-
-        return df
-
-    except Exception as e:
-        print(f"Gagal membaca data: {e}")
-        return pd.DataFrame()
-        
 # --- Konfigurasi Halaman (Hanya dipanggil sekali di awal) ---
 st.set_page_config(
     page_title='Prediksi ARIMA-NGARCH Volatilitas Mata Uang 📈💰',
@@ -52,43 +15,209 @@ st.set_page_config(
     layout="wide"
 )
 
-# --- Fungsi Pembaca Data (dengan caching) ---
-@st.cache_data(ttl=86400)
-def load_data(file_source, default_filename='data/default_currency_multi.csv'):
-    """
-    Membaca data dari objek file yang diunggah atau dari file default lokal.
-    'file_source' bisa berupa uploaded_file object atau string 'default'.
-    """
-    df = pd.DataFrame()
+# --- Cache hasil fit bersama (di disk, lintas sesi dan pengguna) ---
+@st.cache_resource
+def get_fit_cache():
+    return FitCache()
 
-    if file_source == 'default':
-        path = Path(__file__).parent / default_filename
-        if path.exists():
-            try:
-                df = pd.read_csv(path)
-                st.success("Data default berhasil dimuat. 🎉")
-            except Exception as e:
-                st.warning(f"Tidak dapat membaca file default '{default_filename}': {e} ⚠️ Pastikan formatnya benar dan tidak kosong.")
-        else:
-            st.warning(f"File default '{default_filename}' tidak ditemukan di {path}. Harap unggah file Anda. 📂")
-    elif file_source is not None:
-        try:
-            df = pd.read_csv(file_source)
-            st.success("File berhasil diunggah dan dibaca! ✅")
-        except Exception as e:
-            st.error(f"Terjadi kesalahan saat membaca file yang diunggah: {e} ❌ Pastikan formatnya benar (CSV) dan tidak corrupt.")
+# --- Uji stasioneritas semua mata uang, di memori per sidik jari data (FitCache di belakangnya) ---
+@st.cache_data(show_spinner=False)
+def get_stationarity_table(fingerprints, _returns):
+    from arima_ngarch import stationarity_table
 
-    if not df.empty:
-        if 'Date' in df.columns:
-            df['Date'] = pd.to_datetime(df['Date'])
-            df = df.set_index('Date')
-        elif df.iloc[:, 0].dtype == 'object':
-            try:
-                df[df.columns[0]] = pd.to_datetime(df.iloc[:, 0])
-                df = df.set_index(df.columns[0])
-            except Exception:
-                pass
-    return df
+    return stationarity_table(_returns, cache=get_fit_cache())
+
+# --- Job latar belakang (fit, pencarian ordo, backtest, bootstrap), bersama lintas sesi ---
+@st.cache_resource
+def get_job_manager():
+    from arima_ngarch import JobManager
+
+    return JobManager()
+
+def submit_job(key, fn, *args, label=None, progress=False, meta=None, **kwargs):
+    """Mengirim `fn` sebagai job latar belakang untuk aksi `key`; ID job disimpan di sesi."""
+    job = get_job_manager().submit(fn, *args, label=label, progress=progress, meta=meta, **kwargs)
+    st.session_state[f"{key}_job"] = job.id
+    return job
+
+def finished_job(key):
+    """
+    Selama job aksi `key` berjalan, menampilkan progresnya (diperbarui tiap detik) dan tombol batal.
+    Mengembalikan Job yang berhasil satu kali, pada eksekusi pertama setelah selesai; selain itu None.
+    """
+    job_id = st.session_state.get(f"{key}_job")
+    job = get_job_manager().get(job_id) if job_id else None
+    if job is None:
+        return None
+    if not job.done():
+        show_job_progress(key, job.id)
+        return None
+    del st.session_state[f"{key}_job"]
+    if job.status == 'cancelled':
+        st.warning(f"⏹️ {job.label} dibatalkan.")
+        return None
+    if job.status == 'failed':
+        st.error(f"❌ {job.label} gagal: {job.error}")
+        return None
+    return job
+
+@st.fragment(run_every=1.0)
+def show_job_progress(key, job_id):
+    job = get_job_manager().get(job_id)
+    if job is None or job.done():
+        # Seluruh halaman dieksekusi ulang agar hasil job diambil oleh `finished_job`
+        st.rerun()
+    status = "menunggu worker" if job.status == 'pending' else f"berjalan {job.elapsed:.0f} s"
+    message = f" — {job.message}" if job.message else ""
+    st.progress(job.progress or 0.0, text=f"⏳ {job.label}: {status}{message}")
+    if st.button("Batalkan ⏹️", key=f"{key}_cancel"):
+        get_job_manager().cancel(job_id)
+        st.rerun()
+
+# --- Grafik deret panjang: dipotong ke rentang zoom lalu ditipiskan di server ---
+CHART_MAX_POINTS = 2000
+
+def chart_window(index, key):
+    """Slider rentang tanggal (hanya untuk deret > CHART_MAX_POINTS); rentang sempit ditampilkan resolusi penuh."""
+    if len(index) <= CHART_MAX_POINTS:
+        return None, None
+    first, last = index.min().to_pydatetime(), index.max().to_pydatetime()
+    return st.slider("🔍 Rentang tanggal grafik:", min_value=first, max_value=last, value=(first, last),
+                     format="YYYY-MM-DD", key=key)
+
+def show_chart(fig, label=None, **kwargs):
+    """st.plotly_chart yang diukur sebagai tahap render (label bawaan: judul grafik)."""
+    with PROFILER.stage('render', label or fig.layout.title.text or 'grafik'):
+        st.plotly_chart(fig, **kwargs)
+
+def add_series_trace(fig, series, window=(None, None), method='lttb', **scatter_kwargs):
+    """Menambahkan `series` ke `fig` sebagai trace Scatter berisi paling banyak CHART_MAX_POINTS titik."""
+    points = downsample(series, CHART_MAX_POINTS, method, start=window[0], end=window[1])
+    fig.add_trace(go.Scatter(x=points.index, y=points.values, **scatter_kwargs))
+    return fig
+
+def show_convergence(result):
+    """Keterangan jumlah iterasi optimasi fit dan asal nilai awalnya (dicatat oleh fit_arima/fit_garch/fit_ngarch)."""
+    from arima_ngarch import START_SOURCES, convergence_info
+
+    info = convergence_info(result)
+    start = START_SOURCES.get(getattr(result, 'start_source', None), "asal nilai awal tidak diketahui")
+    status = "konvergen" if info['converged'] else "belum konvergen"
+    st.caption(f"Optimasi {status}: {info['iterations']} iterasi, {info['evaluations']} evaluasi fungsi ({start}).")
+
+def show_coefficients(report):
+    """Tabel uji signifikansi koefisien dari `ModelReport` (hijau: P < 0.05) beserta AIC/BIC/log-likelihood."""
+    table = report.coefficients().rename(columns={'coef': 'Koefisien', 'std_err': 'Std. Error',
+                                                  'tvalue': 't-Stat', 'pvalue': 'P-Value'})
+    with PROFILER.stage('render', f'{report.model}_coefficients'):
+        st.dataframe(table.style.map(
+            lambda x: 'background-color: #d4edda' if x < 0.05 else 'background-color: #f8d7da', subset=['P-Value']))
+    st.caption(f"{report.spec} — AIC: {report.aic:.4f}, BIC: {report.bic:.4f}, log-likelihood: {report.loglik:.4f}")
+
+# --- Distribusi prediksi Monte-Carlo (kuantil, VaR, ES) untuk model volatilitas terlatih ---
+def show_forecast_distribution(vol_fit, key, horizon=None, index=None):
+    """Input simulasi, fan chart kuantil dan tabel VaR/ES per horizon untuk `vol_fit`."""
+    from arima_ngarch import forecast_distribution
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        n_paths = st.number_input("Jumlah jalur simulasi:", min_value=1000, max_value=1_000_000, value=100_000,
+                                  step=10_000, key=f"{key}_paths")
+    with col2:
+        seed = st.number_input("Seed:", min_value=0, max_value=2**31 - 1, value=42, key=f"{key}_seed")
+    with col3:
+        if horizon is None:
+            horizon = st.number_input("Horizon (hari):", min_value=1, max_value=250, value=30, key=f"{key}_horizon")
+        cumulative = st.checkbox("Return kumulatif 1..h", key=f"{key}_cumulative")
+
+    # Mean ARIMA ditambahkan bila model ARIMA sudah dilatih; tanpa itu distribusi residual saja
+    arima_fit = st.session_state.get('model_arima_fit')
+    if st.button("Simulasikan ▶️", key=f"{key}_button"):
+        with st.spinner("Mensimulasikan jalur return..."), PROFILER.stage('forecast', 'monte_carlo', n_paths=int(n_paths)):
+            mean = np.asarray(arima_fit.forecast(steps=int(horizon))) if arima_fit is not None else None
+            table = forecast_distribution(vol_fit, int(horizon), n_paths=int(n_paths), seed=int(seed), mean=mean,
+                                          cumulative=cumulative, index=index)
+        # Objek fit itu sendiri (bukan id-nya, yang dapat dipakai ulang objek lain) menandai asal tabel
+        st.session_state[f"{key}_table"] = (vol_fit, arima_fit, table)
+
+    stored = st.session_state.get(f"{key}_table")
+    if stored is None or stored[0] is not vol_fit or stored[1] is not arima_fit:
+        return
+    table = stored[2]
+    x = table.index
+    fig = go.Figure()
+    for low, high, color in [('q_0.05', 'q_0.95', 'rgba(63, 114, 175, 0.15)'), ('q_0.25', 'q_0.75', 'rgba(63, 114, 175, 0.35)')]:
+        fig.add_trace(go.Scatter(x=x, y=table[high], mode='lines', line=dict(width=0), showlegend=False))
+        fig.add_trace(go.Scatter(x=x, y=table[low], mode='lines', line=dict(width=0), fill='tonexty',
+                                 fillcolor=color, name=f"{low[2:]}-{high[2:]}"))
+    fig.add_trace(go.Scatter(x=x, y=table['q_0.5'], mode='lines', name='Median', line=dict(color='#3f72af')))
+    fig.add_trace(go.Scatter(x=x, y=table['var_0.01'], mode='lines', name='VaR 1%', line=dict(color='#d62728', dash='dash')))
+    fig.add_trace(go.Scatter(x=x, y=table['es_0.01'], mode='lines', name='ES 1%', line=dict(color='#8c564b', dash='dot')))
+    fig.update_layout(title='Distribusi Prediksi Return (Monte-Carlo)', xaxis_title='Horizon',
+                      yaxis_title='Return kumulatif' if cumulative else 'Return', template='plotly_white')
+    show_chart(fig)
+    st.dataframe(table)
+
+# --- Interval prediksi harga bootstrap (ARIMA + residual terstandar NGARCH) ---
+def show_price_intervals(arima_fit, key):
+    """Input bootstrap, grafik pita persentil harga dan tabelnya sepanjang periode data uji."""
+    from arima_ngarch import bootstrap_price_intervals
+
+    prices = st.session_state['df_currency_raw']['Value'].dropna().sort_index()
+    test_returns = st.session_state['log_return_test']
+    train_end = st.session_state['log_return_train'].index[-1]
+    last_price = float(prices.loc[:train_end].iloc[-1])
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        n_resamples = st.number_input("Jumlah resample:", min_value=500, max_value=200_000, value=5000, step=500,
+                                      key=f"{key}_resamples")
+    with col2:
+        n_refits = st.number_input("Replikasi latih ulang (0 = parameter tetap):", min_value=0, max_value=500,
+                                   value=0, step=10, key=f"{key}_refits")
+    with col3:
+        seed = st.number_input("Seed:", min_value=0, max_value=2**31 - 1, value=42, key=f"{key}_seed")
+    # Tanpa model NGARCH terlatih, residual ARIMA yang diambil ulang (tanpa volatilitas bersyarat)
+    vol_fit = st.session_state.get('model_ngarch_fit')
+    use_ngarch = vol_fit is not None and st.checkbox("Gunakan residual terstandar NGARCH (filtered historical simulation)",
+                                                     value=True, key=f"{key}_ngarch")
+
+    if st.button("Hitung Interval Bootstrap ▶️", key=f"{key}_button"):
+        bootstrap_vol_fit = vol_fit if use_ngarch else None
+        submit_job(key, bootstrap_price_intervals, arima_fit, last_price, bootstrap_vol_fit,
+                   len(test_returns), n_resamples=int(n_resamples), n_refits=int(n_refits), seed=int(seed),
+                   index=test_returns.index, progress=True, label="Bootstrap interval harga",
+                   meta={'fits': (arima_fit, bootstrap_vol_fit)})
+    job = finished_job(key)
+    if job is not None:
+        with PROFILER.stage('forecast', 'bootstrap', job_s=job.elapsed):
+            table = job.result()
+        table.insert(0, 'Actual', prices.reindex(table.index))
+        # Objek fit itu sendiri (bukan id-nya, yang dapat dipakai ulang objek lain) menandai asal pita
+        st.session_state[f"{key}_table"] = (job.meta['fits'], table)
+
+    stored = st.session_state.get(f"{key}_table")
+    if stored is None:
+        return
+    (stored_arima, stored_vol), table = stored
+    if stored_arima is not arima_fit or (stored_vol is not None and stored_vol is not vol_fit):
+        return
+    x = table.index
+    fig = go.Figure()
+    add_series_trace(fig, prices.loc[:train_end].iloc[-250:], mode='lines', name='Harga Historis',
+                     line=dict(color='gray'))
+    for level, color in [('95', 'rgba(63, 114, 175, 0.15)'), ('80', 'rgba(63, 114, 175, 0.35)')]:
+        fig.add_trace(go.Scatter(x=x, y=table[f'upper_{level}'], mode='lines', line=dict(width=0), showlegend=False))
+        fig.add_trace(go.Scatter(x=x, y=table[f'lower_{level}'], mode='lines', line=dict(width=0), fill='tonexty',
+                                 fillcolor=color, name=f"Interval {level}%"))
+    fig.add_trace(go.Scatter(x=x, y=table['forecast'], mode='lines', name='Prediksi ARIMA', line=dict(color='#3f72af')))
+    fig.add_trace(go.Scatter(x=x, y=table['Actual'], mode='lines', name='Aktual', line=dict(color='#d62728')))
+    fig.update_layout(title=f'Prediksi Harga dengan Interval Bootstrap {st.session_state.get("selected_currency", "")}',
+                      xaxis_title='Tanggal', yaxis_title='Harga', template='plotly_white')
+    show_chart(fig)
+    coverage = ((table['Actual'] >= table['lower_95']) & (table['Actual'] <= table['upper_95'])).mean()
+    st.write(f"Proporsi harga aktual di dalam interval 95%: **{coverage:.1%}**")
+    st.dataframe(table)
 
 # --- Custom CSS untuk Tampilan ---
 st.markdown("""
@@ -229,6 +358,9 @@ for item, key in menu_items.items():
     if st.sidebar.button(item, key=key):
         st.session_state['current_page'] = key
 
+# Profil tahap (ingest, transform, fit, forecast, diagnostics, render) untuk eksekusi halaman ini
+PROFILER = Profiler(name=st.session_state['current_page'])
+
 
 # --- Area Konten Utama Berdasarkan Halaman yang Dipilih ---
 
@@ -278,6 +410,8 @@ if st.session_state['current_page'] == 'home':
 
 
 elif st.session_state['current_page'] == 'input_data':
+    from arima_ngarch import load_currency_data, file_digest, DATA_CACHE, save_dataset, list_datasets, open_dataset
+
     st.markdown('<div class="main-header">Input Data 📥</div>', unsafe_allow_html=True)
     st.write("Unggah data time series nilai tukar mata uang. File CSV harus memiliki kolom 'Date' dan satu atau lebih kolom mata uang. 🗂️")
 
@@ -291,28 +425,29 @@ elif st.session_state['current_page'] == 'input_data':
 
     if uploaded_file:
         try:
-            df = pd.read_csv(uploaded_file, delimiter=';')
-            df.columns = df.columns.str.strip()
-            
-            if 'Date' not in df.columns:
-                st.error("Kolom 'Date' tidak ditemukan.")
+            if st.button("🔄 Parse ulang file", key="reparse_button"):
+                DATA_CACHE.invalidate(file_digest(uploaded_file))
+
+            # Format tanggal '01/08/2019 00:00' dan harga Eropa dikonversi oleh mesin pipeline
+            # (hasil parse di-cache berdasarkan hash isi file)
+            try:
+                with PROFILER.stage('ingest', 'csv'):
+                    df = load_currency_data(uploaded_file)
+            except ValueError as e:
+                st.error(str(e))
                 st.stop()
-           
-            # Format sesuai formatmu: '01/08/2019 00:00'
-            df['Date'] = pd.to_datetime(df['Date'], format='%d/%m/%Y %H:%M', errors='coerce')
-            df = df.dropna(subset=['Date']).sort_values('Date')  # sort agar urut
-            df.set_index('Date', inplace=True)
-            
-            # Pilih kolom harga
-            harga_col = st.selectbox("Pilih kolom harga:", [col for col in df.columns if col != 'Date'])
 
-            # Konversi harga Eropa ke float
-            df[harga_col] = df[harga_col].astype(str) \
-                .str.replace('.', '', regex=False) \
-                .str.replace(',', '.', regex=False) \
-                .str.replace('[^0-9.-]', '', regex=True)
+            # Simpan ke penyimpanan kolumnar (satu dataset per isi file) agar sesi berikutnya
+            # tidak perlu mengunggah ulang; hanya bila diminta, bukan pada setiap eksekusi
+            if st.button("💾 Simpan ke penyimpanan lokal", key="save_store_button"):
+                try:
+                    _, created = save_dataset(df, file_digest(uploaded_file), label=uploaded_file.name)
+                    st.caption("Tersimpan ke penyimpanan lokal." if created else "File ini sudah tersimpan sebelumnya.")
+                except Exception as e:
+                    st.warning(f"Gagal menyimpan ke penyimpanan lokal: {e}")
 
-            df[harga_col] = pd.to_numeric(df[harga_col], errors='coerce')
+            # Pilih kolom harga
+            harga_col = st.selectbox("Pilih kolom harga:", list(df.columns))
             df = df.dropna(subset=[harga_col])
 
             # Simpan ke session
@@ -332,16 +467,20 @@ elif st.session_state['current_page'] == 'input_data':
 
     elif 'df_currency_raw_multi' not in st.session_state or st.session_state['df_currency_raw_multi'].empty:
         st.info("Tidak ada file diunggah. Anda dapat mengunggah file sendiri, atau coba muat data contoh.")
-        if st.checkbox("Muat data contoh dari repositori 📂", key="load_default_checkbox"):
+        datasets = list_datasets()
+        if not datasets.empty and st.checkbox("Muat data tersimpan 💾", key="load_store_checkbox"):
+            dataset = st.selectbox(
+                "Dataset:", list(datasets.index), key="load_store_dataset",
+                format_func=lambda name: (f"{datasets.at[name, 'label']} ({', '.join(datasets.at[name, 'currencies'])}; "
+                                          f"{datasets.at[name, 'saved']:%Y-%m-%d %H:%M})"))
+            with PROFILER.stage('ingest', 'store'):
+                df_general = open_dataset(dataset).load_frame()
+            st.success("Data tersimpan berhasil dimuat.")
+            st.dataframe(df_general.head())
+        elif st.checkbox("Muat data contoh dari repositori 📂", key="load_default_checkbox"):
             try:
-                df_general = pd.read_csv('data/default_currency_multi.csv', sep=';', thousands='.')
-                if 'Date' in df_general.columns:
-                    df_general['Date'] = pd.to_datetime(df_general['Date'], errors='coerce')
-                    df_general = df_general.set_index('Date')
-
-                for col in df_general.columns:
-                    df_general[col] = pd.to_numeric(df_general[col], errors='coerce')
-
+                with PROFILER.stage('ingest', 'csv'):
+                    df_general = load_currency_data()
                 st.success("Data contoh berhasil dimuat.")
                 st.dataframe(df_general.head())
             except Exception as e:
@@ -403,14 +542,15 @@ elif st.session_state['current_page'] == 'input_data':
         st.dataframe(st.session_state['df_currency_raw'])
 
         st.subheader(f"📈 Grafik Nilai Tukar: {st.session_state['selected_currency']}")
+        raw_values = st.session_state['df_currency_raw']['Value']
+        raw_window = chart_window(raw_values.index, key="raw_chart_window")
         fig_raw = go.Figure()
-        fig_raw.add_trace(go.Scatter(
-            x=st.session_state['df_currency_raw'].index,
-            y=st.session_state['df_currency_raw']['Value'],
-            mode='lines+markers',
+        add_series_trace(
+            fig_raw, raw_values, raw_window,
+            mode='lines+markers' if len(raw_values) <= CHART_MAX_POINTS else 'lines',
             name='Nilai Tukar',
             line=dict(color='#1f77b4', width=2)
-        ))
+        )
         fig_raw.update_layout(
             title=f'Grafik Nilai Tukar {st.session_state["selected_currency"]}',
             xaxis_title='Tanggal',
@@ -418,9 +558,45 @@ elif st.session_state['current_page'] == 'input_data':
             template='plotly_white',
             xaxis_rangeslider_visible=True
         )
-        st.plotly_chart(fig_raw, use_container_width=True)
+        show_chart(fig_raw, use_container_width=True)
+
+    # === BATCH SEMUA MATA UANG ===
+    df_multi = st.session_state.get('df_currency_raw_multi', pd.DataFrame())
+    if not df_multi.empty:
+        with st.expander("⚡ Latih Semua Mata Uang (Batch ARIMA + GARCH + NGARCH)"):
+            numeric_multi = [col for col in df_multi.columns if pd.api.types.is_numeric_dtype(df_multi[col])]
+            st.write(f"Mata uang: {', '.join(numeric_multi)}")
+            batch_workers = st.number_input("Jumlah proses paralel:", min_value=1, max_value=max(1, os.cpu_count() or 1),
+                                            value=min(len(numeric_multi), os.cpu_count() or 1) or 1, key="batch_workers")
+            if st.button("Latih Semua Mata Uang ▶️", key="batch_fit_button"):
+                from arima_ngarch import fit_currencies
+
+                submit_job('batch_fit', fit_currencies, df_multi, columns=numeric_multi, max_workers=int(batch_workers),
+                           progress=True, label="Latih semua mata uang")
+            batch_job = finished_job('batch_fit')
+            if batch_job is not None:
+                with PROFILER.stage('fit', 'batch', job_s=batch_job.elapsed):
+                    st.session_state['batch_results'] = batch_job.result()
+            if 'batch_results' in st.session_state:
+                st.dataframe(st.session_state['batch_results'])
+
+            st.write("Model volatilitas semua mata uang dalam satu optimasi gabungan (log-return terpusat, tanggal sejajar):")
+            joint_spec = st.radio("Spesifikasi:", ["gjr", "garch", "engle-ng"], horizontal=True, key="joint_vol_kind")
+            if st.button("Latih Volatilitas Gabungan ▶️", key="joint_vol_button"):
+                from arima_ngarch import fit_currencies_volatility
+
+                submit_job('joint_vol', fit_currencies_volatility, df_multi, columns=numeric_multi, kind=joint_spec,
+                           label="Latih volatilitas gabungan")
+            joint_job = finished_job('joint_vol')
+            if joint_job is not None:
+                with PROFILER.stage('fit', 'joint_volatility', job_s=joint_job.elapsed):
+                    st.session_state['joint_vol_results'] = joint_job.result()
+            if 'joint_vol_results' in st.session_state:
+                st.dataframe(st.session_state['joint_vol_results'])
 
 elif st.session_state['current_page'] == 'data_preprocessing':
+    from arima_ngarch import compute_log_returns, split_train_test, fingerprint
+
     st.markdown('<div class="main-header">Data Preprocessing, Splitting & Stasioneritas ⚙️✂️🧪</div>', unsafe_allow_html=True)
     st.write("Lakukan pembersihan, transformasi, pembagian data, dan analisis stasioneritas nilai tukar.")
 
@@ -450,12 +626,11 @@ elif st.session_state['current_page'] == 'data_preprocessing':
             log_return_series = None
             if apply_log_return:
                 try:
-                    if series_data.max() > 100000:
-                        series_data = series_data / 1000
-                        st.info("Skala data dibagi 1000 agar log-return lebih presisi.")
-
                     # Hitung log-return
-                    log_return_series = np.log(series_data).diff().dropna()
+                    with PROFILER.stage('transform', 'log_return'):
+                        log_return_series, series_data, rescaled = compute_log_returns(series_data)
+                    if rescaled:
+                        st.info("Skala data dibagi 1000 agar log-return lebih presisi.")
                     st.session_state['log_return_series'] = log_return_series
 
                     if 'log_return_original' not in st.session_state:
@@ -463,7 +638,7 @@ elif st.session_state['current_page'] == 'data_preprocessing':
 
                     st.success("Log-return berhasil dihitung dan disimpan di sesi. ✅")
                     st.write("📉 Grafik Log-Return:")
-                    st.line_chart(log_return_series)
+                    st.line_chart(downsample(log_return_series, CHART_MAX_POINTS))
 
                     # Gabungkan dengan data aslinya (jika ingin preview berdampingan)
                     log_return_df = pd.concat([series_data, log_return_series], axis=1)
@@ -484,11 +659,8 @@ elif st.session_state['current_page'] == 'data_preprocessing':
             st.markdown('<div class="main-header">Data Splitting ✂️📊</div>', unsafe_allow_html=True)
             st.info("📌 30 observasi terakhir digunakan sebagai data uji.")
             if st.button("Lakukan Pembagian Data ▶️", key="split_data_button"):
-                log_return_series = st.session_state['log_return_original']
-                log_return_series = log_return_series.sort_index()
-
-                train = log_return_series.iloc[:-30]
-                test = log_return_series.iloc[-30:]
+                with PROFILER.stage('transform', 'split'):
+                    train, test = split_train_test(st.session_state['log_return_original'])
 
                 st.session_state['log_return_train'] = train
                 st.session_state['log_return_test'] = test
@@ -501,30 +673,38 @@ elif st.session_state['current_page'] == 'data_preprocessing':
                 
                 # Visualisasi
                 fig_split = go.Figure()
-                fig_split.add_trace(go.Scatter(x=train.index, y=train.values, mode='lines', name='Train', line=dict(color='#3f72af')))
-                fig_split.add_trace(go.Scatter(x=test.index, y=test.values, mode='lines', name='Test', line=dict(color='#ff7f0e')))
+                add_series_trace(fig_split, train, mode='lines', name='Train', line=dict(color='#3f72af'))
+                add_series_trace(fig_split, test, mode='lines', name='Test', line=dict(color='#ff7f0e'))
                 fig_split.update_layout(title='Train/Test Split Log-Return', xaxis_rangeslider_visible=True)
-                st.plotly_chart(fig_split)
+                show_chart(fig_split)
 
             # === ADF TEST ===
             st.markdown('<div class="main-header">Stasioneritas Data 📊🧪</div>', unsafe_allow_html=True)
-            adf_results_path = "models/adf_test_results_clean.pkl"
+            # Uji untuk log-return setiap mata uang yang dimuat (data pengguna, bukan hasil statis)
+            df_multi = st.session_state.get('df_currency_raw_multi', pd.DataFrame())
+            with PROFILER.stage('transform', 'log_return_all'):
+                returns_all = {
+                    col: compute_log_returns(df_multi[col].dropna())[0]
+                    for col in df_multi.columns if pd.api.types.is_numeric_dtype(df_multi[col])
+                }
+            selected_currency = st.session_state.get("selected_currency", "")
+            if selected_currency not in returns_all and 'log_return_original' in st.session_state:
+                returns_all[selected_currency] = st.session_state['log_return_original']
 
-            # Load hasil ADF
             try:
-                with open(adf_results_path, "rb") as f:
-                    adf_results = pickle.load(f)
-                st.success("✅ Hasil ADF Test berhasil dimuat.")
+                with st.spinner("Menghitung uji ADF/KPSS/Ljung-Box/ARCH-LM..."), PROFILER.stage('diagnostics', 'stationarity'):
+                    fingerprints = tuple((name, fingerprint(series)) for name, series in returns_all.items())
+                    diagnostics_table = get_stationarity_table(fingerprints, returns_all)
             except Exception as e:
-                st.error(f"Gagal menampilkan hasil ADF Test: {e}")
+                st.error(f"Gagal menghitung uji stasioneritas: {e}")
                 st.stop()
 
             # Tampilkan hasil ADF
-            selected_currency = st.session_state.get("selected_currency", "")
-            if selected_currency in adf_results:
-                adf_stat = adf_results[selected_currency]["adf_stat"]
-                p_value = adf_results[selected_currency]["p_value"]
-                
+            if selected_currency in diagnostics_table.index:
+                result = diagnostics_table.loc[selected_currency]
+                adf_stat = result["adf_stat"]
+                p_value = result["adf_pvalue"]
+
                 st.write(f"**Hasil ADF untuk {selected_currency}:**")
                 st.write(f"• Statistik ADF: `{adf_stat:.6f}`")
                 st.write(f"• P-value: `{p_value:.6f}`")
@@ -532,9 +712,13 @@ elif st.session_state['current_page'] == 'data_preprocessing':
                     st.success("➡️ Data stasioner (tolak H₀)")
                 else:
                     st.warning("➡️ Data tidak stasioner (gagal tolak H₀)")
+                st.write(f"• KPSS: statistik `{result['kpss_stat']:.4f}`, p-value `{result['kpss_pvalue']:.4f}` (H₀: stasioner)")
             else:
                 st.warning(f"Tidak ada hasil ADF untuk {selected_currency}.")
-            
+
+            with st.expander("Uji stasioneritas & efek ARCH semua mata uang"):
+                st.dataframe(diagnostics_table)
+
             # === ACF & PACF ===
             st.markdown("### 📈 Plot ACF & PACF (Data Train)")
             log_return_train = st.session_state.get("log_return_train", None)
@@ -543,6 +727,9 @@ elif st.session_state['current_page'] == 'data_preprocessing':
                 lags = st.slider("Jumlah lags:", 5, 50, 20, key="acf_pacf_lags_slider")
                 if st.button("📊 Tampilkan ACF & PACF", key="show_acf_pacf_button"):
                     try:
+                        import matplotlib.pyplot as plt
+                        from statsmodels.graphics.tsaplots import plot_acf, plot_pacf
+
                         fig, axes = plt.subplots(1, 2, figsize=(12, 4))
 
                         plot_acf(log_return_train, lags=lags, alpha=0.05, ax=axes[0])
@@ -568,6 +755,8 @@ elif st.session_state['current_page'] == 'data_preprocessing':
    
 
 elif st.session_state['current_page'] == 'ARIMA Model':
+    from arima_ngarch import fit_arima, select_arima_order, residual_diagnostics, save_arima_artifact, convergence_info, model_report
+
     st.markdown('<div class="main-header">MODEL ARIMA 📈</div>', unsafe_allow_html=True)
     st.write(f"Bangun dan evaluasi model ARIMA pada data log-return mata uang **{st.session_state.get('selected_currency', '')}**.")
 
@@ -580,98 +769,153 @@ elif st.session_state['current_page'] == 'ARIMA Model':
         st.warning("📛 Data log-return pelatihan belum tersedia. Silakan lakukan preprocessing dan splitting terlebih dahulu.")
         st.stop()
 
-    # 1. Input Ordo
+    # 1. Input Ordo (nilai awal diisi sekali lewat session_state, sehingga hasil pencarian ordo
+    # dapat mengisinya tanpa bentrok dengan nilai default widget)
+    for name, default in (('arima_p', 1), ('arima_d', 0), ('arima_q', 1)):
+        if name not in st.session_state:
+            st.session_state[name] = default
     st.subheader("1. Tentukan Ordo ARIMA (p, d, q) 🔢")
-    p = st.number_input("Ordo AR (p):", min_value=0, max_value=5, value=1, key="arima_p")
-    d = st.number_input("Ordo Differencing (d):", min_value=0, max_value=0, value=0, key="arima_d")  # d=0 karena log-return
-    q = st.number_input("Ordo MA (q):", min_value=0, max_value=5, value=1, key="arima_q")
+    with st.expander("🔎 Cari Ordo ARIMA Otomatis (AIC/BIC)"):
+        arima_criterion = st.radio("Kriteria:", ["aic", "bic"], horizontal=True, key="arima_search_criterion")
+        if st.button("Cari Ordo Terbaik (p, q ≤ 5)", key="arima_search_button"):
+            submit_job('arima_search', select_arima_order, train_data_returns, criterion=arima_criterion,
+                       progress=True, label="Cari ordo ARIMA")
+        search_job = finished_job('arima_search')
+        if search_job is not None:
+            with PROFILER.stage('fit', 'arima_order_search', job_s=search_job.elapsed):
+                best_order, search_table = search_job.result()
+            st.session_state['arima_search_table'] = search_table
+            if best_order is not None:
+                # Isi input ordo di bawah dengan hasil pencarian (int Python, bukan integer numpy)
+                best_order = tuple(int(v) for v in best_order)
+                st.session_state['arima_p'] = best_order[0]
+                st.session_state['arima_q'] = best_order[2]
+                st.success(f"Ordo terbaik: ARIMA{best_order}")
+        if 'arima_search_table' in st.session_state:
+            st.dataframe(st.session_state['arima_search_table'].astype({'order': str}))
+
+    p = st.number_input("Ordo AR (p):", min_value=0, max_value=5, key="arima_p")
+    d = st.number_input("Ordo Differencing (d):", min_value=0, max_value=0, key="arima_d")  # d=0 karena log-return
+    q = st.number_input("Ordo MA (q):", min_value=0, max_value=5, key="arima_q")
 
     if st.button("▶️ Latih Model ARIMA"):
+        # Fit sebelumnya di sesi (data hampir sama) menjadi nilai awal optimasi
+        previous_fit = st.session_state.get('model_arima_fit')
+        submit_job('arima_fit', fit_arima, train_data_returns, order=(p, d, q), cache=get_fit_cache(),
+                   start_params=previous_fit, label=f"Latih ARIMA{(p, d, q)}")
+
+    # Fit berjalan di latar belakang; hasilnya ditampilkan pada eksekusi pertama setelah selesai
+    arima_job = finished_job('arima_fit')
+    if arima_job is not None:
         try:
-            with st.spinner("Melatih model ARIMA..."):
-                model_arima = ARIMA(train_data_returns, order=(p, d, q))
-                model_arima_fit = model_arima.fit()
+            with PROFILER.stage('fit', 'arima', job_s=arima_job.elapsed) as record:
+                model_arima_fit = arima_job.result()
+                record.update(convergence_info(model_arima_fit))
 
-                st.session_state['model_arima_fit'] = model_arima_fit
-                st.session_state['arima_residuals'] = model_arima_fit.resid.dropna()
+            st.session_state['model_arima_fit'] = model_arima_fit
+            st.session_state['arima_residuals'] = model_arima_fit.resid.dropna()
 
-                st.success("✅ Model ARIMA berhasil dilatih!")
+            st.success("✅ Model ARIMA berhasil dilatih!")
+            show_convergence(model_arima_fit)
 
-                # 2. Ringkasan Model
-                st.subheader("2. Ringkasan Model ARIMA")
+            # 2. Ringkasan Model
+            st.subheader("2. Ringkasan Model ARIMA")
+            with PROFILER.stage('render', 'arima_summary'):
                 st.text(model_arima_fit.summary().as_text())
 
-                # 3. Uji Signifikansi Koefisien
-                st.subheader("3. Uji Signifikansi Koefisien")
-                df_results = pd.read_html(model_arima_fit.summary().tables[1].as_html(), header=0, index_col=0)[0]
-                st.dataframe(df_results[['P>|z|']].style.applymap(
-                    lambda x: 'background-color: #d4edda' if x < 0.05 else 'background-color: #f8d7da'))
-
-                # 4. Uji Asumsi Residual
-                st.subheader("4. Uji Asumsi Residual ARIMA")
-                resid = model_arima_fit.resid.dropna()
-
-                # Plot Residual
-                fig_res = go.Figure()
-                fig_res.add_trace(go.Scatter(x=resid.index, y=resid, mode='lines', name='Residual ARIMA'))
-                fig_res.update_layout(title_text='Residual ARIMA', xaxis_rangeslider_visible=True)
-                st.plotly_chart(fig_res)
-
-                # Kolmogorov-Smirnov Test
-                standardized_resid = (resid - np.mean(resid)) / np.std(resid)
-                ks_stat, ks_pvalue = kstest(standardized_resid, 'norm')
-                st.write(f"**Kolmogorov-Smirnov Test:**")
-                st.write(f"• Statistik: `{ks_stat:.4f}`")
-                st.write(f"• P-value: `{ks_pvalue:.4f}`")
-                if ks_pvalue > 0.05:
-                    st.success("Residual terdistribusi normal (Gagal tolak H₀)")
-                else:
-                    st.warning("Residual tidak normal (Tolak H₀)")
-
-                # Ljung-Box Test
-                lb_test = acorr_ljungbox(resid, lags=[10], return_df=True)
-                st.write("**Ljung-Box Test:**")
-                st.dataframe(lb_test)
-                if lb_test['lb_pvalue'].iloc[0] > 0.05:
-                    st.success("Tidak ada autokorelasi signifikan (Gagal tolak H₀)")
-                else:
-                    st.warning("Terdapat autokorelasi signifikan (Tolak H₀)")
-
-                # ARCH Test
-                lb_arch = acorr_ljungbox(resid**2, lags=[10], return_df=True)
-                st.write("**ARCH Test (Ljung-Box pada residual kuadrat):**")
-                st.dataframe(lb_arch)
-                has_arch = lb_arch['lb_pvalue'].iloc[0] < 0.05
-                if not has_arch:
-                    st.success("Tidak ada efek ARCH signifikan (Gagal tolak H₀)")
-                else:
-                    st.warning("Ada efek ARCH signifikan (Tolak H₀)")
-
-                # Simpan hasil uji ke file
-                st.session_state['arima_residual_has_arch_effect'] = has_arch
-                uji_asumsi = {
-                    'ks_stat': ks_stat,
-                    'ks_pvalue': ks_pvalue,
-                    'ljung_box_stat': lb_test['lb_stat'].iloc[0],
-                    'ljung_box_pvalue': lb_test['lb_pvalue'].iloc[0],
-                    'arch_stat': lb_arch['lb_stat'].iloc[0],
-                    'arch_pvalue': lb_arch['lb_pvalue'].iloc[0],
-                    'has_arch_effect': has_arch
-                }
+            # 3. Uji Signifikansi Koefisien
+            st.subheader("3. Uji Signifikansi Koefisien")
+            show_coefficients(model_report(model_arima_fit, name=st.session_state.get('selected_currency')))
+
+            # 4. Uji Asumsi Residual
+            st.subheader("4. Uji Asumsi Residual ARIMA")
+            resid = model_arima_fit.resid.dropna()
+
+            # Plot Residual
+            fig_res = go.Figure()
+            add_series_trace(fig_res, resid, mode='lines', name='Residual ARIMA')
+            fig_res.update_layout(title_text='Residual ARIMA', xaxis_rangeslider_visible=True)
+            show_chart(fig_res)
+
+            # Semua uji residual (KS, Ljung-Box lag 1-10 residual & kuadrat) dalam satu panggilan
+            with PROFILER.stage('diagnostics', 'arima_residuals'):
+                resid_diag, resid_lb = residual_diagnostics(resid.rename('resid'))
+            resid_lb = resid_lb.loc['resid']
+
+            # Kolmogorov-Smirnov Test
+            ks_stat, ks_pvalue = resid_diag.loc['resid', ['ks_stat', 'ks_pvalue']]
+            st.write(f"**Kolmogorov-Smirnov Test:**")
+            st.write(f"• Statistik: `{ks_stat:.4f}`")
+            st.write(f"• P-value: `{ks_pvalue:.4f}`")
+            if ks_pvalue > 0.05:
+                st.success("Residual terdistribusi normal (Gagal tolak H₀)")
+            else:
+                st.warning("Residual tidak normal (Tolak H₀)")
+
+            # Ljung-Box Test
+            lb_test = resid_lb.loc[[10], ['lb_stat', 'lb_pvalue']]
+            st.write("**Ljung-Box Test:**")
+            st.dataframe(lb_test)
+            if lb_test['lb_pvalue'].iloc[0] > 0.05:
+                st.success("Tidak ada autokorelasi signifikan (Gagal tolak H₀)")
+            else:
+                st.warning("Terdapat autokorelasi signifikan (Tolak H₀)")
+
+            # ARCH Test
+            lb_arch = resid_lb.loc[[10], ['lb_sq_stat', 'lb_sq_pvalue']].set_axis(['lb_stat', 'lb_pvalue'], axis=1)
+            st.write("**ARCH Test (Ljung-Box pada residual kuadrat):**")
+            st.dataframe(lb_arch)
+            with st.expander("Ljung-Box residual & residual kuadrat untuk lag 1-10"):
+                st.dataframe(resid_lb)
+            has_arch = lb_arch['lb_pvalue'].iloc[0] < 0.05
+            if not has_arch:
+                st.success("Tidak ada efek ARCH signifikan (Gagal tolak H₀)")
+            else:
+                st.warning("Ada efek ARCH signifikan (Tolak H₀)")
+
+            # Simpan hasil uji ke file
+            st.session_state['arima_residual_has_arch_effect'] = has_arch
+            uji_asumsi = {
+                'ks_stat': ks_stat,
+                'ks_pvalue': ks_pvalue,
+                'ljung_box_stat': lb_test['lb_stat'].iloc[0],
+                'ljung_box_pvalue': lb_test['lb_pvalue'].iloc[0],
+                'arch_stat': lb_arch['lb_stat'].iloc[0],
+                'arch_pvalue': lb_arch['lb_pvalue'].iloc[0],
+                'has_arch_effect': has_arch
+            }
+
+            mata_uang = st.session_state.get("selected_currency", "")
+
+            # Simpan model sebagai artefak ringkas (parameter + state Kalman, tanpa pickle)
+            artifact_name = f"models/model_arima_{mata_uang.lower()}.json"
+            try:
+                save_arima_artifact(model_arima_fit, artifact_name)
+                st.info(f"Model ARIMA disimpan ke: `{artifact_name}`")
+            except Exception as e:
+                st.warning(f"Gagal menyimpan model ARIMA: {e}")
 
-                mata_uang = st.session_state.get("selected_currency", "")
-                file_name = f"models/uji_asumsi_arima_{mata_uang.lower()}.pkl"
-                try:
-                    with open(file_name, "wb") as f:
-                        pickle.dump(uji_asumsi, f)
-                    st.info(f"Hasil uji asumsi disimpan ke: `{file_name}`")
-                except Exception as e:
-                    st.warning(f"Gagal menyimpan hasil uji asumsi: {e}")
+            file_name = f"models/uji_asumsi_arima_{mata_uang.lower()}.pkl"
+            try:
+                with open(file_name, "wb") as f:
+                    pickle.dump(uji_asumsi, f)
+                st.info(f"Hasil uji asumsi disimpan ke: `{file_name}`")
+            except Exception as e:
+                st.warning(f"Gagal menyimpan hasil uji asumsi: {e}")
 
         except Exception as e:
             st.error(f"❌ Gagal melatih model ARIMA: {e}")
 
+    # Butuh harga mentah (data input) dan periode uji untuk horizon serta pembanding aktual
+    if 'model_arima_fit' in st.session_state and 'log_return_test' in st.session_state \
+            and not st.session_state.get('df_currency_raw', pd.DataFrame()).empty:
+        st.subheader("5. Prediksi Harga dengan Interval Bootstrap 🎯")
+        st.info("Guncangan masa depan diambil ulang dari residual model (bootstrap) dan dirambatkan lewat ARIMA; dengan replikasi latih ulang, ketidakpastian parameter ikut dihitung (dijalankan paralel).")
+        show_price_intervals(st.session_state['model_arima_fit'], key="arima_bootstrap")
+
 elif st.session_state['current_page'] == 'GARCH (Model & Prediksi)':
+    from arima_ngarch import fit_garch, forecast_volatility, residual_diagnostics, convergence_info, model_report
+
     st.markdown('<div class="main-header">GARCH (Model & Prediksi) 🌪️📈</div>', unsafe_allow_html=True)
     st.write(f"Bangun dan evaluasi model GARCH untuk memodelkan volatilitas dari residual ARIMA pada mata uang {st.session_state.get('selected_currency', '')}. Juga prediksi volatilitas ke depan.")
 
@@ -685,86 +929,81 @@ elif st.session_state['current_page'] == 'GARCH (Model & Prediksi)':
         garch_q = st.number_input("GARCH Order (q):", min_value=1, max_value=5, value=1, key="garch_q")
 
         if st.button("Latih Model GARCH ▶️", key="train_garch_button"):
+            previous_fit = st.session_state.get("model_garch_fit")
+            submit_job('garch_fit', fit_garch, arima_residuals, p=garch_p, q=garch_q, dist="t", cache=get_fit_cache(),
+                       starting_values=previous_fit, label=f"Latih GARCH({garch_p}, {garch_q})")
+
+        garch_job = finished_job('garch_fit')
+        if garch_job is not None:
             try:
-                from arch import arch_model
-                returns_for_garch = arima_residuals.dropna()
-                
-                with st.spinner("Melatih model GARCH..."):
-                    garch_model = arch_model(
-                        returns_for_garch,
-                        mean="zero",
-                        vol="Garch",
-                        p=garch_p,
-                        q=garch_q,
-                        dist="t"
-                    )
-                    model_garch_fit = garch_model.fit(disp="off")
-                    st.session_state["model_garch_fit"] = model_garch_fit
-                    st.success("Model GARCH berhasil dilatih! 🎉")
-
-                    # Ringkasan
-                    st.subheader("2. Ringkasan Model GARCH (Koefisien dan Statistik) 📝")
+                with PROFILER.stage('fit', 'garch', job_s=garch_job.elapsed) as record:
+                    model_garch_fit = garch_job.result()
+                    record.update(convergence_info(model_garch_fit))
+                st.session_state["model_garch_fit"] = model_garch_fit
+                st.success("Model GARCH berhasil dilatih! 🎉")
+                show_convergence(model_garch_fit)
+
+                # Ringkasan
+                st.subheader("2. Ringkasan Model GARCH (Koefisien dan Statistik) 📝")
+                with PROFILER.stage('render', 'garch_summary'):
                     st.text(model_garch_fit.summary().as_text())
 
-                    # Uji Signifikansi
-                    st.subheader("3. Uji Signifikansi Koefisien GARCH ✅❌")
-                    df_coef = pd.DataFrame({
-                        "Koefisien": model_garch_fit.params,
-                        "t-Stat": model_garch_fit.tvalues,
-                        "P-Value": model_garch_fit.pvalues
-                    })
-                    st.dataframe(df_coef.style.applymap(
-                       lambda x: 'background-color: #d4edda' if isinstance(x, float) and x < 0.05 else 'background-color: #f8d7da',
-                       subset=["P-Value"]
-                    ))
-                    st.caption("Hijau: signifikan (P < 0.05), Merah: tidak signifikan (P ≥ 0.05)")
-
-                    # Uji Residual
-                    st.subheader("4. Uji Residual Standar GARCH 📊")
-                    std_resid = model_garch_fit.resid / model_garch_fit.conditional_volatility
-                    st.session_state["garch_std_residuals"] = std_resid
-
-                    st.write("##### Plot Residual Standar")
-                    fig = go.Figure()
-                    fig.add_trace(go.Scatter(x=std_resid.index, y=std_resid, mode="lines", name="Std Residual", line=dict(color="green")))
-                    fig.update_layout(title="Residual Standar GARCH", xaxis_title="Tanggal", yaxis_title="Nilai")
-                    st.plotly_chart(fig)
-
-                    # Uji Normalitas
-                    st.write("##### Uji Normalitas (Jarque-Bera)")
-                    jb_stat, jb_p = stats.jarque_bera(std_resid.dropna())
-                    st.write(f"Statistik JB: {jb_stat:.4f}, P-value: {jb_p:.4f}")
-                    if jb_p > 0.05:
-                        st.success("Residual standar **terdistribusi normal**. ✅")
-                    else:
-                        st.warning("Residual standar **tidak normal** (tolak H0). ⚠️")
-
-                    # Ljung-Box (Autokorelasi)
-                    st.write("##### Uji Autokorelasi (Ljung-Box)")
-                    lb = sm.stats.acorr_ljungbox(std_resid.dropna(), lags=[10], return_df=True)
-                    st.write(lb)
-                    if lb["lb_pvalue"].iloc[0] > 0.05:
-                        st.success("Tidak ada autokorelasi signifikan. ✅")
-                    else:
-                        st.warning("Terdapat autokorelasi signifikan. ⚠️")
-
-                    # ARCH Effect 
-                    st.write("##### Uji ARCH Effect (Residual Kuadrat)")
-                    lb_sq = sm.stats.acorr_ljungbox(std_resid.dropna()**2, lags=[10], return_df=True)
-                    st.write(lb_sq)
-                    if lb_sq["lb_pvalue"].iloc[0] > 0.05:
-                        st.success("ARCH effect berhasil ditangkap oleh model GARCH. ✅")
-                    else:
-                        st.warning("Model GARCH mungkin belum cukup menangkap ARCH effect. ⚠️")
+                # Uji Signifikansi
+                st.subheader("3. Uji Signifikansi Koefisien GARCH ✅❌")
+                show_coefficients(model_report(model_garch_fit, model='garch',
+                                               name=st.session_state.get('selected_currency')))
+                st.caption("Hijau: signifikan (P < 0.05), Merah: tidak signifikan (P ≥ 0.05)")
+
+                # Uji Residual
+                st.subheader("4. Uji Residual Standar GARCH 📊")
+                std_resid = model_garch_fit.resid / model_garch_fit.conditional_volatility
+                st.session_state["garch_std_residuals"] = std_resid
+
+                st.write("##### Plot Residual Standar")
+                fig = go.Figure()
+                add_series_trace(fig, std_resid, mode="lines", name="Std Residual", line=dict(color="green"))
+                fig.update_layout(title="Residual Standar GARCH", xaxis_title="Tanggal", yaxis_title="Nilai")
+                show_chart(fig)
+
+                with PROFILER.stage('diagnostics', 'garch_std_resid'):
+                    garch_diag, garch_lb = residual_diagnostics(std_resid.rename('std_resid'))
+                garch_lb = garch_lb.loc['std_resid']
+
+                # Uji Normalitas
+                st.write("##### Uji Normalitas (Jarque-Bera)")
+                jb_stat, jb_p = garch_diag.loc['std_resid', ['jb_stat', 'jb_pvalue']]
+                st.write(f"Statistik JB: {jb_stat:.4f}, P-value: {jb_p:.4f}")
+                if jb_p > 0.05:
+                    st.success("Residual standar **terdistribusi normal**. ✅")
+                else:
+                    st.warning("Residual standar **tidak normal** (tolak H0). ⚠️")
+
+                # Ljung-Box (Autokorelasi)
+                st.write("##### Uji Autokorelasi (Ljung-Box)")
+                lb = garch_lb.loc[[10], ['lb_stat', 'lb_pvalue']]
+                st.write(lb)
+                if lb["lb_pvalue"].iloc[0] > 0.05:
+                    st.success("Tidak ada autokorelasi signifikan. ✅")
+                else:
+                    st.warning("Terdapat autokorelasi signifikan. ⚠️")
+
+                # ARCH Effect 
+                st.write("##### Uji ARCH Effect (Residual Kuadrat)")
+                lb_sq = garch_lb.loc[[10], ['lb_sq_stat', 'lb_sq_pvalue']].set_axis(['lb_stat', 'lb_pvalue'], axis=1)
+                st.write(lb_sq)
+                with st.expander("Ljung-Box residual standar & kuadrat untuk lag 1-10"):
+                    st.dataframe(garch_lb)
+                if lb_sq["lb_pvalue"].iloc[0] > 0.05:
+                    st.success("ARCH effect berhasil ditangkap oleh model GARCH. ✅")
+                else:
+                    st.warning("Model GARCH mungkin belum cukup menangkap ARCH effect. ⚠️")
 
                 # Prediksi Volatilitas ke depan
                 st.subheader("5. Prediksi Volatilitas ke Depan 🔮")
                 forecast_horizon = st.slider("Jumlah hari ke depan:", 1, 30, 5, key="forecast_garch_horizon")
-                garch_forecast = model_garch_fit.forecast(horizon=forecast_horizon)
-                forecast_volatility = np.sqrt(garch_forecast.variance.values[-1, :])
-                dates = pd.date_range(start=std_resid.index[-1] + pd.Timedelta(days=1), periods=forecast_horizon, freq='B')
-                forecast_vol_series = pd.Series(data=forecast_volatility, index=dates)
-                st.line_chart(forecast_vol_series)
+                with PROFILER.stage('forecast', 'garch_volatility'):
+                    forecast_vol_series = forecast_volatility(model_garch_fit, forecast_horizon)
+                st.line_chart(downsample(forecast_vol_series, CHART_MAX_POINTS))
                 st.session_state['garch_forecast_volatility'] = forecast_vol_series
                 st.write("5 prediksi volatilitas pertama:")
                 st.dataframe(forecast_vol_series.head())
@@ -772,7 +1011,14 @@ elif st.session_state['current_page'] == 'GARCH (Model & Prediksi)':
             except Exception as e:
                 st.error(f"Terjadi kesalahan saat pelatihan GARCH: {e}")
 
+        if 'model_garch_fit' in st.session_state:
+            st.subheader("6. Distribusi Prediksi Monte-Carlo (VaR & Expected Shortfall) 🎲")
+            show_forecast_distribution(st.session_state['model_garch_fit'], key="garch_mc")
+
 elif st.session_state['current_page'] == 'NGARCH (Model & Prediksi)':
+    from arima_ngarch import (fit_ngarch, select_ngarch_order, forecast_volatility, residual_diagnostics,
+                              walk_forward_backtest, convergence_info, model_report)
+
     st.markdown('<div class="main-header">MODEL & PREDIKSI NGARCH 🌪️</div>', unsafe_allow_html=True)
     st.write("Modelkan dan prediksi volatilitas bersyarat dengan NGARCH untuk menangkap efek asimetri pada volatilitas. 📊")
 
@@ -782,108 +1028,173 @@ elif st.session_state['current_page'] == 'NGARCH (Model & Prediksi)':
         st.write("Data residual ARIMA yang digunakan:")
         st.dataframe(residuals.head())
 
+        for name, default in (('ngarch_p', 1), ('ngarch_o', 1), ('ngarch_q', 1)):
+            if name not in st.session_state:
+                st.session_state[name] = default
         st.subheader("1. Tentukan Ordo NGARCH (p, q) 🔢")
         st.info("Untuk NGARCH(p, q), 'p' adalah ordo ARCH (jumlah lag dari residual kuadrat) dan 'q' adalah ordo GARCH (jumlah lag dari varians bersyarat). Umumnya GARCH(1,1) adalah titik awal yang baik.")
-        ngarch_p = st.number_input("Ordo ARCH (p):", min_value=1, max_value=5, value=1, key="ngarch_p")
-        ngarch_o = st.number_input("Ordo Asymmetric (o):", min_value=0, max_value=1, value=1, help="Ordo asimetris untuk efek leverage. Set ke 0 untuk GARCH biasa. Set ke 1 untuk NGARCH/GJR-GARCH.", key="ngarch_o")
-        ngarch_q = st.number_input("Ordo GARCH (q):", min_value=1, max_value=5, value=1, key="ngarch_q")
+        with st.expander("🔎 Cari Ordo NGARCH Otomatis (AIC/BIC)"):
+            ngarch_criterion = st.radio("Kriteria:", ["aic", "bic"], horizontal=True, key="ngarch_search_criterion")
+            if st.button("Cari Ordo Terbaik (p, q ≤ 5, o ≤ 1)", key="ngarch_search_button"):
+                submit_job('ngarch_search', select_ngarch_order, residuals, criterion=ngarch_criterion,
+                           progress=True, label="Cari ordo NGARCH")
+            search_job = finished_job('ngarch_search')
+            if search_job is not None:
+                with PROFILER.stage('fit', 'ngarch_order_search', job_s=search_job.elapsed):
+                    best_order, search_table = search_job.result()
+                st.session_state['ngarch_search_table'] = search_table
+                if best_order is not None:
+                    best_order = tuple(int(v) for v in best_order)
+                    st.session_state['ngarch_p'], st.session_state['ngarch_o'], st.session_state['ngarch_q'] = best_order
+                    st.success(f"Ordo terbaik: NGARCH{best_order}")
+            if 'ngarch_search_table' in st.session_state:
+                st.dataframe(st.session_state['ngarch_search_table'].astype({'order': str}))
+
+        ngarch_p = st.number_input("Ordo ARCH (p):", min_value=1, max_value=5, key="ngarch_p")
+        ngarch_o = st.number_input("Ordo Asymmetric (o):", min_value=0, max_value=1, help="Ordo asimetris untuk efek leverage. Set ke 0 untuk GARCH biasa. Set ke 1 untuk NGARCH/GJR-GARCH.", key="ngarch_o")
+        ngarch_q = st.number_input("Ordo GARCH (q):", min_value=1, max_value=5, key="ngarch_q")
+        ngarch_spec = st.radio(
+            "Spesifikasi model volatilitas:",
+            ["GJR-GARCH (p, o, q)", "NGARCH Engle-Ng (1, 1)"],
+            horizontal=True,
+            help="NGARCH Engle-Ng: sigma²_t = ω + α(e_{t-1} − θσ_{t-1})² + βσ²_{t-1}. Ordo p, o, q di atas diabaikan.",
+            key="ngarch_spec",
+        )
+        ngarch_kind = 'engle-ng' if ngarch_spec.startswith("NGARCH Engle-Ng") else 'gjr'
 
         if st.button("Latih Model NGARCH ▶️", key="train_ngarch_button"):
+            # Ambil residual dari ARIMA
+            returns_for_ngarch = st.session_state.get("arima_residuals", None)
+            if returns_for_ngarch is None or returns_for_ngarch.isna().all():
+                st.error("Residual ARIMA tidak tersedia. Latih model ARIMA terlebih dahulu.")
+                st.stop()
+
+            # Buat dan latih model dengan ordo dari input di atas
+            previous_fit = st.session_state.get('model_ngarch_fit')
+            submit_job('ngarch_fit', fit_ngarch, returns_for_ngarch, p=ngarch_p, o=ngarch_o, q=ngarch_q, dist='t',
+                       cache=get_fit_cache(), kind=ngarch_kind, starting_values=previous_fit,
+                       label=f"Latih NGARCH ({ngarch_spec})")
 
+        ngarch_job = finished_job('ngarch_fit')
+        if ngarch_job is not None:
             try:
-                from arch.univariate import GARCH, ConstantMean
-                from arch.__future__ import reindexing
-
-                with st.spinner("Melatih model NGARCH..."):
-                    # Ambil residual dari ARIMA
-                    returns_for_ngarch = st.session_state.get("arima_residuals", None)
-                    if returns_for_ngarch is None or returns_for_ngarch.isna().all():
-                        st.error("Residual ARIMA tidak tersedia. Latih model ARIMA terlebih dahulu.")
-                        st.stop()
-                        
-                    # Dapatkan nilai parameter dari session_state (atau gunakan default jika belum ada)
-                    p_ngarch = st.session_state.get('p_ngarch', 1)
-                    q_ngarch = st.session_state.get('q_ngarch', 1)
-                    o_ngarch = st.session_state.get('o_ngarch', 1)
-
-                    # Buat dan latih model
-                    ngarch_model = arch_model(
-                        returns_for_ngarch,
-                        mean='zero',
-                        vol='Garch',
-                        p=p_ngarch,
-                        o=o_ngarch,
-                        q=q_ngarch,
-                        dist='t'
-                    )
-                    ngarch_fit = ngarch_model.fit(disp='off')
-                    st.session_state['model_ngarch_fit'] = ngarch_fit
-                    st.success("Model NGARCH berhasil dilatih! 🎉")
-            
-                    st.subheader("2. Ringkasan Model NGARCH")
+                with PROFILER.stage('fit', 'ngarch', job_s=ngarch_job.elapsed) as record:
+                    ngarch_fit = ngarch_job.result()
+                    record.update(convergence_info(ngarch_fit))
+                st.session_state['model_ngarch_fit'] = ngarch_fit
+                st.success("Model NGARCH berhasil dilatih! 🎉")
+                show_convergence(ngarch_fit)
+        
+                st.subheader("2. Ringkasan Model NGARCH")
+                with PROFILER.stage('render', 'ngarch_summary'):
                     st.text(ngarch_fit.summary().as_text())
 
-                    st.subheader("3. Uji Signifikansi Koefisien NGARCH ✅❌")
-                    params = ngarch_fit.params
-                    pvals = ngarch_fit.pvalues
-                    df_coef = pd.DataFrame({'Koefisien': params, 'P-Value': pvals})
-                    st.dataframe(df_coef.style.applymap(
-                        lambda x: 'background-color: #d4edda' if isinstance(x, float) and x < 0.05 else 'background-color: #f8d7da',
-                        subset=['P-Value']
-                    ))
-
-                    # Residual standar
-                    std_resid = ngarch_fit.std_resid.dropna()
-                    st.session_state['ngarch_std_residuals'] = std_resid
-                
-                    st.subheader("4. Evaluasi Residual Standar NGARCH 📊")
-                    std_residuals = ngarch_fit.resid / ngarch_fit.conditional_volatility
-                    st.session_state['ngarch_std_residuals'] = std_residuals # Simpan residual standar
-
-                    if not std_residuals.empty:
-                        # Plot Residual Standar
-                        st.write("##### Plot Residual Standar NGARCH")
-                        fig_std_res = go.Figure()
-                        fig_std_res.add_trace(go.Scatter(x=std_residuals.index, y=std_residuals, mode='lines', name='Residual Standar NGARCH', line=dict(color='#2ca02c')))
-                        fig_std_res.update_layout(title_text=f'Residual Standar Model NGARCH ({st.session_state.get("selected_currency", "")})', xaxis_rangeslider_visible=True)
-                        st.plotly_chart(fig_std_res)
-
-                        # Uji Normalitas (Jarque-Bera) pada Residual Standar
-                        st.write("##### Uji Normalitas (Jarque-Bera Test) pada Residual Standar")
-                        jb_test_ngarch = stats.jarque_bera(std_residuals.dropna()) # Pastikan tidak ada NaN
-                        st.write(f"Statistik Jarque-Bera: {jb_test_ngarch[0]:.4f}")
-                        st.write(f"P-value: {jb_test_ngarch[1]:.4f}")
-                        if jb_test_ngarch[1] > 0.05:
-                            st.success("Residual standar **terdistribusi normal** (gagal tolak H0). ✅")
-                        else:
-                            st.warning("Residual standar **tidak terdistribusi normal** (tolak H0). ⚠️ Ini masih umum untuk model GARCH dengan distribusi Student's t, asalkan model sudah menangkap volatilitas berkelompok.")
-                            st.info("Jika Anda menggunakan distribusi Student's t atau skew-t, hasil uji normalitas mungkin masih menolak H0, tetapi ini diharapkan karena model dirancang untuk menangani *fat tails*.")
-
-                        # Uji Autokorelasi (Ljung-Box Test) pada Residual Standar
-                        st.write("##### Uji Autokorelasi (Ljung-Box Test) pada Residual Standar")
-                        lb_test_ngarch = sm.stats.acorr_ljungbox(std_residuals.dropna(), lags=[10], return_df=True) # Pastikan tidak ada NaN
-                        st.write(lb_test_ngarch)
-                        if lb_test_ngarch['lb_pvalue'].iloc[0] > 0.05:
-                            st.success("Residual standar **tidak memiliki autokorelasi** signifikan (gagal tolak H0). ✅")
-                        else:
-                            st.warning("Residual standar **memiliki autokorelasi** signifikan (tolak H0). ⚠️ Ini menunjukkan model NGARCH mungkin belum sepenuhnya menangkap dependensi.")
-                            st.info("Jika ada autokorelasi, pertimbangkan ordo NGARCH yang berbeda atau model GARCH yang lebih kompleks.")
-
-                        # Uji Autokorelasi (Ljung-Box Test) pada Residual Standar Kuadrat
-                        st.write("##### Uji Autokorelasi (Ljung-Box Test) pada Residual Standar Kuadrat")
-                        lb_arch_test_ngarch = sm.stats.acorr_ljungbox(std_residuals.dropna()**2, lags=[10], return_df=True) # Pastikan tidak ada NaN
-                        st.write(lb_arch_test_ngarch)
-                        if lb_arch_test_ngarch['lb_pvalue'].iloc[0] > 0.05:
-                            st.success("Residual standar kuadrat **tidak memiliki autokorelasi** signifikan (gagal tolak H0). ✅ Ini menunjukkan model NGARCH telah berhasil menangkap efek ARCH/GARCH.")
-                        else:
-                            st.warning("Residual standar kuadrat **memiliki autokorelasi** signifikan (tolak H0). ⚠️ Ini menunjukkan model NGARCH mungkin belum sepenuhnya menangkap volatilitas berkelompok.")
-                            st.info("Jika ada autokorelasi pada residual kuadrat, pertimbangkan ordo NGARCH yang lebih tinggi atau model GARCH yang berbeda (misalnya, EGARCH).")
+                st.subheader("3. Uji Signifikansi Koefisien NGARCH ✅❌")
+                show_coefficients(model_report(ngarch_fit, model='ngarch', name=st.session_state.get('selected_currency')))
+
+                # Residual standar
+                std_resid = ngarch_fit.std_resid.dropna()
+                st.session_state['ngarch_std_residuals'] = std_resid
+            
+                st.subheader("4. Evaluasi Residual Standar NGARCH 📊")
+                std_residuals = ngarch_fit.resid / ngarch_fit.conditional_volatility
+                st.session_state['ngarch_std_residuals'] = std_residuals # Simpan residual standar
+
+                if not std_residuals.empty:
+                    # Plot Residual Standar
+                    st.write("##### Plot Residual Standar NGARCH")
+                    fig_std_res = go.Figure()
+                    add_series_trace(fig_std_res, std_residuals, mode='lines', name='Residual Standar NGARCH', line=dict(color='#2ca02c'))
+                    fig_std_res.update_layout(title_text=f'Residual Standar Model NGARCH ({st.session_state.get("selected_currency", "")})', xaxis_rangeslider_visible=True)
+                    show_chart(fig_std_res)
+
+                    # Uji Normalitas (Jarque-Bera) pada Residual Standar
+                    st.write("##### Uji Normalitas (Jarque-Bera Test) pada Residual Standar")
+                    with PROFILER.stage('diagnostics', 'ngarch_std_resid'):
+                        ngarch_diag, ngarch_lb = residual_diagnostics(std_residuals.rename('std_resid'))
+                    ngarch_lb = ngarch_lb.loc['std_resid']
+                    jb_test_ngarch = ngarch_diag.loc['std_resid', ['jb_stat', 'jb_pvalue']].to_numpy()
+                    st.write(f"Statistik Jarque-Bera: {jb_test_ngarch[0]:.4f}")
+                    st.write(f"P-value: {jb_test_ngarch[1]:.4f}")
+                    if jb_test_ngarch[1] > 0.05:
+                        st.success("Residual standar **terdistribusi normal** (gagal tolak H0). ✅")
+                    else:
+                        st.warning("Residual standar **tidak terdistribusi normal** (tolak H0). ⚠️ Ini masih umum untuk model GARCH dengan distribusi Student's t, asalkan model sudah menangkap volatilitas berkelompok.")
+                        st.info("Jika Anda menggunakan distribusi Student's t atau skew-t, hasil uji normalitas mungkin masih menolak H0, tetapi ini diharapkan karena model dirancang untuk menangani *fat tails*.")
+
+                    # Uji Autokorelasi (Ljung-Box Test) pada Residual Standar
+                    st.write("##### Uji Autokorelasi (Ljung-Box Test) pada Residual Standar")
+                    lb_test_ngarch = ngarch_lb.loc[[10], ['lb_stat', 'lb_pvalue']]
+                    st.write(lb_test_ngarch)
+                    if lb_test_ngarch['lb_pvalue'].iloc[0] > 0.05:
+                        st.success("Residual standar **tidak memiliki autokorelasi** signifikan (gagal tolak H0). ✅")
                     else:
-                        st.warning("Residual standar NGARCH kosong atau tidak valid untuk pengujian. ❌")
+                        st.warning("Residual standar **memiliki autokorelasi** signifikan (tolak H0). ⚠️ Ini menunjukkan model NGARCH mungkin belum sepenuhnya menangkap dependensi.")
+                        st.info("Jika ada autokorelasi, pertimbangkan ordo NGARCH yang berbeda atau model GARCH yang lebih kompleks.")
+
+                    # Uji Autokorelasi (Ljung-Box Test) pada Residual Standar Kuadrat
+                    st.write("##### Uji Autokorelasi (Ljung-Box Test) pada Residual Standar Kuadrat")
+                    lb_arch_test_ngarch = ngarch_lb.loc[[10], ['lb_sq_stat', 'lb_sq_pvalue']].set_axis(['lb_stat', 'lb_pvalue'], axis=1)
+                    st.write(lb_arch_test_ngarch)
+                    with st.expander("Ljung-Box residual standar & kuadrat untuk lag 1-10"):
+                        st.dataframe(ngarch_lb)
+                    if lb_arch_test_ngarch['lb_pvalue'].iloc[0] > 0.05:
+                        st.success("Residual standar kuadrat **tidak memiliki autokorelasi** signifikan (gagal tolak H0). ✅ Ini menunjukkan model NGARCH telah berhasil menangkap efek ARCH/GARCH.")
+                    else:
+                        st.warning("Residual standar kuadrat **memiliki autokorelasi** signifikan (tolak H0). ⚠️ Ini menunjukkan model NGARCH mungkin belum sepenuhnya menangkap volatilitas berkelompok.")
+                        st.info("Jika ada autokorelasi pada residual kuadrat, pertimbangkan ordo NGARCH yang lebih tinggi atau model GARCH yang berbeda (misalnya, EGARCH).")
+                else:
+                    st.warning("Residual standar NGARCH kosong atau tidak valid untuk pengujian. ❌")
             except Exception as e:
                 st.error(f"Terjadi kesalahan saat melatih model NGARCH: {e} ❌ Pastikan residual ARIMA tidak kosong dan ordo NGARCH sesuai.")
                 st.info("Kesalahan umum: data terlalu pendek, atau ada nilai tak terhingga/NaN setelah normalisasi.")
   
+    # Backtest walk-forward
+    if 'log_return_original' in st.session_state and not st.session_state['log_return_original'].empty:
+        with st.expander("🧪 Backtest Walk-Forward ARIMA-NGARCH"):
+            bt_returns = st.session_state['log_return_original']
+            bt_col1, bt_col2, bt_col3 = st.columns(3)
+            with bt_col1:
+                bt_min_train = st.number_input("Data latih awal:", min_value=100, max_value=max(100, len(bt_returns) - 1),
+                                               value=max(100, len(bt_returns) - 250), key="bt_min_train")
+            with bt_col2:
+                bt_horizon = st.number_input("Horizon (hari):", min_value=1, max_value=30, value=1, key="bt_horizon")
+            with bt_col3:
+                bt_refit_every = st.number_input("Latih ulang tiap (origin):", min_value=1, max_value=250, value=20, key="bt_refit_every")
+            # Ordo NGARCH diambil dari input di atas, yang hanya tampil bila residual ARIMA tersedia
+            has_residuals = 'arima_residuals' in st.session_state and not st.session_state['arima_residuals'].empty
+            bt_arima_fit = st.session_state.get('model_arima_fit') if has_residuals else None
+            if bt_arima_fit is None:
+                st.info("Latih model ARIMA terlebih dahulu: backtest memakai ordo ARIMA yang sudah dilatih.")
+            else:
+                bt_ngarch = ("NGARCH Engle-Ng (1, 1)" if ngarch_kind == 'engle-ng'
+                             else f"GJR-GARCH{(ngarch_p, ngarch_o, ngarch_q)}")
+                st.caption(f"Model backtest: ARIMA{tuple(bt_arima_fit.model.order)} + {bt_ngarch}")
+            if st.button("Jalankan Backtest ▶️", key="run_backtest_button", disabled=bt_arima_fit is None):
+                submit_job(
+                    'backtest', walk_forward_backtest,
+                    bt_returns,
+                    arima_order=tuple(bt_arima_fit.model.order),
+                    ngarch_order=(ngarch_p, ngarch_o, ngarch_q),
+                    ngarch_kind=ngarch_kind,
+                    min_train=int(bt_min_train),
+                    horizon=int(bt_horizon),
+                    refit_every=int(bt_refit_every),
+                    progress=True,
+                    label="Backtest walk-forward",
+                )
+            backtest_job = finished_job('backtest')
+            if backtest_job is not None:
+                with PROFILER.stage('forecast', 'backtest', job_s=backtest_job.elapsed):
+                    bt_table, bt_metrics = backtest_job.result()
+                st.session_state['backtest_table'] = bt_table
+                st.session_state['backtest_metrics'] = bt_metrics
+            if 'backtest_metrics' in st.session_state:
+                st.write("Metrik per horizon (QLIKE, MSE varians, MSE mean, hit rate VaR):")
+                st.dataframe(st.session_state['backtest_metrics'])
+                st.write("Forecast vs aktual:")
+                st.dataframe(st.session_state['backtest_table'])
+
     # Prediksi NGARCH
     if 'model_ngarch_fit' in st.session_state and 'test_data_returns' in st.session_state:
         st.subheader("5. Prediksi Volatilitas Bersyarat (NGARCH) 🔮")
@@ -892,9 +1203,8 @@ elif st.session_state['current_page'] == 'NGARCH (Model & Prediksi)':
         horizon = len(test_returns)
 
         try:
-            forecast = ngarch_fit.forecast(horizon=horizon, reindex=False)
-            predicted_vol = np.sqrt(forecast.variance.values[-1, :horizon])
-            predicted_vol_series = pd.Series(predicted_vol, index=test_returns.index)
+            with PROFILER.stage('forecast', 'ngarch_volatility'):
+                predicted_vol_series = forecast_volatility(ngarch_fit, horizon, index=test_returns.index)
             st.session_state['ngarch_forecast_volatility'] = predicted_vol_series
 
             st.success("Prediksi volatilitas dengan NGARCH berhasil! 🎉")
@@ -907,22 +1217,21 @@ elif st.session_state['current_page'] == 'NGARCH (Model & Prediksi)':
             # Plot volatilitas bersyarat yang dihasilkan oleh model pada data pelatihan
             # Ini adalah estimasi volatilitas historis berdasarkan model
             conditional_vol_train = ngarch_fit.conditional_volatility
-            fig_ngarch_forecast.add_trace(go.Scatter(
-                x=conditional_vol_train.index,
-                y=conditional_vol_train.values,
+            vol_window = chart_window(conditional_vol_train.index, key="ngarch_vol_chart_window")
+            add_series_trace(
+                fig_ngarch_forecast, conditional_vol_train, vol_window,
                 mode='lines',
                 name='Volatilitas Bersyarat (In-Sample)',
                 line=dict(color='#2ca02c')
-            ))
+            )
             
             # Plot prediksi volatilitas
-            fig_ngarch_forecast.add_trace(go.Scatter(
-            x=predicted_vol_series.index,
-            y=predicted_vol_series.values,
+            add_series_trace(
+                fig_ngarch_forecast, predicted_vol_series,
                 mode='lines',
                 name='Prediksi Volatilitas (Out-of-Sample)',
                 line=dict(color='#d62728', dash='dash')
-            ))
+            )
 
             fig_ngarch_forecast.update_layout(
                 title=f'Prediksi Volatilitas Bersyarat {st.session_state.get("selected_currency", "")} dengan NGARCH',
@@ -930,7 +1239,7 @@ elif st.session_state['current_page'] == 'NGARCH (Model & Prediksi)':
                 yaxis_title='Volatilitas',
                 xaxis_rangeslider_visible=True
             )
-            st.plotly_chart(fig_ngarch_forecast)
+            show_chart(fig_ngarch_forecast)
             
             # Optionally, show actual squared returns as a proxy for actual volatility
             st.subheader("7. Perbandingan dengan Volatilitas Aktual (Squared Returns) 📉")
@@ -939,32 +1248,30 @@ elif st.session_state['current_page'] == 'NGARCH (Model & Prediksi)':
             fig_actual_vs_pred_vol = go.Figure()
             
             # Squared returns for the whole series (train + test)
-            actual_squared_returns = (st.session_state['processed_returns']**2)
-            fig_actual_vs_pred_vol.add_trace(go.Scatter(
-                x=actual_squared_returns.index,
-                y=actual_squared_returns.values,
+            actual_squared_returns = (st.session_state['log_return_original']**2)
+            # Kuadrat return sangat runcing: min-max menjaga setiap lonjakan tetap terlihat
+            add_series_trace(
+                fig_actual_vs_pred_vol, actual_squared_returns, vol_window, method='minmax',
                 mode='lines', 
                 name='Kuadrat Return Aktual',
                 line=dict(color='#8c564b'),
                 opacity=0.7  # ✅ letakkan di luar line
-            ))
+            )
 
             # Conditional volatility (in-sample)
-            fig_actual_vs_pred_vol.add_trace(go.Scatter(
-                x=conditional_vol_train.index,
-                y=conditional_vol_train.values**2, # Square it for comparison with squared returns
+            add_series_trace(
+                fig_actual_vs_pred_vol, conditional_vol_train**2, vol_window,  # Square it for comparison with squared returns
                 mode='lines',
                 name='Varians Bersyarat (In-Sample)',
                 line=dict(color='#2ca02c', width=2)
-            ))
+            )
 
-            fig_actual_vs_pred_vol.add_trace(go.Scatter(
-                x=predicted_vol_series.index,
-                y=predicted_vol_series.values**2,
+            add_series_trace(
+                fig_actual_vs_pred_vol, predicted_vol_series**2,
                 mode='lines',
                 name='Prediksi Varians (Out-of-Sample)',
                 line=dict(color='#d62728', dash='dash', width=2)
-            ))
+            )
             
             fig_actual_vs_pred_vol.update_layout(
                 title=f'Prediksi Varians NGARCH vs. Kuadrat Return Aktual {st.session_state.get("selected_currency", "")}',
@@ -972,7 +1279,11 @@ elif st.session_state['current_page'] == 'NGARCH (Model & Prediksi)':
                 yaxis_title='Varians / Kuadrat Return',
                 xaxis_rangeslider_visible=True
             )
-            st.plotly_chart(fig_actual_vs_pred_vol)
+            show_chart(fig_actual_vs_pred_vol)
+
+            st.subheader("8. Distribusi Prediksi Monte-Carlo (VaR & Expected Shortfall) 🎲")
+            st.info("Jalur return disimulasikan dari model NGARCH terlatih dengan inovasi Student-t; VaR adalah kuantil return (negatif = rugi), ES adalah rata-rata return di bawah VaR.")
+            show_forecast_distribution(ngarch_fit, key="ngarch_mc", horizon=horizon, index=test_returns.index)
 
         except Exception as e:
             st.error(f"Terjadi kesalahan saat memprediksi volatilitas dengan NGARCH: {e} ❌")
@@ -980,3 +1291,13 @@ elif st.session_state['current_page'] == 'NGARCH (Model & Prediksi)':
     else:
         st.info("Silakan latih model NGARCH di halaman 'Model NGARCH' terlebih dahulu. 🌪️")
     
+
+# --- Profil tahap eksekusi halaman ini (juga dikirim ke logger arima_ngarch.profiling) ---
+if PROFILER.records:
+    with st.expander("⏱️ Profil Tahap (eksekusi terakhir)"):
+        st.caption("Waktu dinding dan CPU per tahap serta perubahan memori resident (RSS). "
+                   "Tahap bersarang (mis. grafik di dalam simulasi) tercatat dengan kolom `parent`.")
+        st.dataframe(PROFILER.totals())
+        st.dataframe(PROFILER.to_frame())
+        st.download_button("Unduh log JSON ⬇️", PROFILER.to_json_lines(), file_name="profil_tahap.jsonl",
+                           mime="application/json", key="profile_download")
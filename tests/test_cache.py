@@ -0,0 +1,37 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from arima_ngarch.cache import FitCache
+
+
+class _Gone:
+    pass
+
+
+def _unloadable(cache, key):
+    # Pickle yang merujuk kelas yang sudah tidak ada (mis. setelah upgrade pustaka)
+    data = pickle.dumps(_Gone(), protocol=pickle.HIGHEST_PROTOCOL).replace(b'_Gone', b'_Lost')
+    cache._path(key).write_bytes(data)
+
+
+@pytest.mark.parametrize('corrupt', [
+    lambda cache, key: cache._path(key).write_bytes(pickle.dumps(np.arange(100))[:40]),
+    lambda cache, key: cache._path(key).write_bytes(b'bukan pickle'),
+    _unloadable,
+])
+def test_unloadable_entry_is_a_miss_and_removed(tmp_path, corrupt):
+    cache = FitCache(tmp_path)
+    corrupt(cache, 'k')
+    assert cache.get('k') is None
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert not cache._path('k').exists()
+    assert cache.get_or_fit('k', lambda: 42) == 42
+    assert cache.get('k') == 42
+
+
+def test_missing_entry_is_a_miss(tmp_path):
+    cache = FitCache(tmp_path)
+    assert cache.get('k') is None
+    assert cache.misses == 1
@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+from statsmodels.stats.diagnostic import het_arch
+
+from arima_ngarch.diagnostics import arch_lm, residual_diagnostics, stationarity_tests
+
+
+def _nonzero_mean(nobs=800, seed=3):
+    rng = np.random.default_rng(seed)
+    return 0.5 + rng.standard_t(5, (nobs, 2))
+
+
+def test_arch_lm_matches_het_arch_on_nonzero_mean_input():
+    x = _nonzero_mean()
+    stat, pvalue = arch_lm(x, 10)
+    for j in range(x.shape[1]):
+        expected_stat, expected_pvalue = het_arch(x[:, j], nlags=10)[:2]
+        np.testing.assert_allclose(stat[j], expected_stat, rtol=1e-8)
+        np.testing.assert_allclose(pvalue[j], expected_pvalue, rtol=1e-8)
+
+
+def test_residual_diagnostics_arch_lm_matches_het_arch():
+    x = _nonzero_mean()
+    summary, _ = residual_diagnostics(pd.DataFrame(x, columns=['a', 'b']), 5)
+    np.testing.assert_allclose(summary.loc['a', 'arch_lm_stat'], het_arch(x[:, 0], nlags=5)[0], rtol=1e-8)
+
+
+def test_stationarity_tests_arch_lm_uses_demeaned_returns():
+    x = _nonzero_mean()[:, 0]
+    row = stationarity_tests(pd.Series(x), lags=10)
+    np.testing.assert_allclose(row['arch_lm_stat'], het_arch(x - x.mean(), nlags=10)[0], rtol=1e-8)
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from arima_ngarch.batched import batched_t_loglik
+from arima_ngarch.ngarch import NGARCH, ngarch_t_loglik
+
+PARAMS = np.array([2e-6, 0.08, 0.8, 0.85, 6.0])
+
+
+def _residuals(nobs=400, seed=0):
+    rng = np.random.default_rng(seed)
+    shocks = lambda n: rng.standard_t(6, n) * np.sqrt(4 / 6)
+    resids, _ = NGARCH().simulate(PARAMS[:4], nobs, shocks)
+    return resids
+
+
+def _clipped_bounds(resids, upper_quantile=0.5):
+    # Batas atas di bawah median varians: sebagian besar langkah rekursi terpotong
+    sigma2 = np.empty_like(resids)
+    loose = np.column_stack([np.full(resids.shape, 1e-12), np.full(resids.shape, 1e3)])
+    ngarch_t_loglik(PARAMS, resids, np.mean(resids ** 2), loose, sigma2)
+    upper = np.quantile(sigma2, upper_quantile)
+    return np.column_stack([np.full(resids.shape, 1e-12), np.full(resids.shape, upper)]), sigma2 > upper
+
+
+def _numeric_gradient(func, params, rel_step=1e-6):
+    grad = np.empty_like(params)
+    for k in range(params.size):
+        step = rel_step * max(abs(params[k]), 1e-3)
+        up, down = params.copy(), params.copy()
+        up[k] += step
+        down[k] -= step
+        grad[k] = (func(up) - func(down)) / (2 * step)
+    return grad
+
+
+def test_ngarch_gradient_matches_finite_difference_when_variance_is_clipped():
+    resids = _residuals()
+    var_bounds, clipped = _clipped_bounds(resids)
+    assert clipped.sum() > 50
+    backcast = float(np.mean(resids ** 2))
+
+    _, grad = ngarch_t_loglik(PARAMS, resids, backcast, var_bounds)
+    numeric = _numeric_gradient(lambda p: ngarch_t_loglik(p, resids, backcast, var_bounds)[0], PARAMS)
+    np.testing.assert_allclose(grad, numeric, rtol=1e-4)
+
+
+@pytest.mark.parametrize('kind', ['gjr', 'engle-ng'])
+def test_batched_gradient_matches_finite_difference_when_variance_is_clipped(kind):
+    resids = _residuals()
+    var_bounds, clipped = _clipped_bounds(resids)
+    assert clipped.sum() > 50
+    resids2 = resids[:, None]
+    backcast = np.array([np.mean(resids ** 2)])
+    bounds2 = np.ascontiguousarray(var_bounds[:, None, :])
+    params = PARAMS if kind == 'engle-ng' else np.array([2e-6, 0.04, 0.08, 0.85, 6.0])
+
+    def loglik(p):
+        return batched_t_loglik(p[None, :], resids2, kind, backcast, bounds2)[0][0]
+
+    _, grad = batched_t_loglik(params[None, :], resids2, kind, backcast, bounds2)
+    np.testing.assert_allclose(grad[0], _numeric_gradient(loglik, params), rtol=1e-4)
+
+
+def test_engle_ng_result_supports_the_arch_result_api():
+    # _mle_result memakai internal arch; perubahan di versi arch harus gagal di sini
+    import pandas as pd
+    from arima_ngarch.ngarch import fit_engle_ng, ngarch_model
+
+    resids = pd.Series(_residuals(nobs=800, seed=4), index=pd.bdate_range('2020-01-01', periods=800))
+    result = fit_engle_ng(resids)
+
+    assert list(result.params.index) == ngarch_model(resids)._all_parameter_names()
+    assert 'NGARCH' in result.summary().as_text()
+    assert result.std_err.shape == (5,) and np.all(np.isfinite(result.std_err)) and np.all(result.std_err > 0)
+    variance = result.forecast(horizon=5, reindex=False).variance.to_numpy()
+    assert variance.shape == (1, 5) and np.all(np.isfinite(variance)) and np.all(variance > 0)
+    std_resid = result.std_resid
+    assert isinstance(std_resid, pd.Series) and std_resid.index.equals(resids.index)
+    np.testing.assert_allclose(std_resid.to_numpy(), resids.to_numpy() / result.conditional_volatility.to_numpy())
+    assert np.isfinite(result.loglikelihood)
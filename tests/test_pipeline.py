@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from arima_ngarch.cache import FitCache
+from arima_ngarch.pipeline import fit_arima, fit_garch, fit_ngarch
+
+
+def _returns(nobs=600, seed=5):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range('2020-01-01', periods=nobs)
+    return pd.Series(0.01 * rng.standard_t(6, nobs), index=index)
+
+
+@pytest.mark.parametrize('fit, start_kwarg, kwargs', [
+    (fit_arima, 'start_params', {'order': (1, 0, 1)}),
+    (fit_garch, 'starting_values', {}),
+    (fit_ngarch, 'starting_values', {'kind': 'gjr'}),
+    (fit_ngarch, 'starting_values', {'kind': 'engle-ng'}),
+])
+def test_start_source_is_recorded(tmp_path, fit, start_kwarg, kwargs):
+    returns = _returns()
+    assert fit(returns, **kwargs).start_source == 'default'
+
+    cache = FitCache(tmp_path)
+    first = fit(returns, cache=cache, **kwargs)
+    assert first.start_source == 'default'
+    assert fit(returns, cache=cache, **kwargs).start_source == 'cache'
+    # Data berubah: parameter terakhir untuk spesifikasi yang sama dari cache
+    assert fit(returns.iloc[5:], cache=cache, **kwargs).start_source == 'cache-start'
+    assert fit(returns.iloc[10:], cache=cache, **kwargs, **{start_kwarg: first}).start_source == 'previous'
+    # Fit sebelumnya dengan parameter lain tidak dipakai sebagai nilai awal
+    other = fit_arima(returns, order=(2, 0, 0)) if fit is not fit_arima else fit_garch(returns)
+    assert fit(returns.iloc[15:], **kwargs, **{start_kwarg: other}).start_source == 'default'
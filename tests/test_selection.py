@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from arima_ngarch.selection import (_arima_param_names, _ngarch_param_names, _pad_params, select_arima_order,
+                                    select_ngarch_order)
+
+
+def _returns(nobs=600, seed=1):
+    rng = np.random.default_rng(seed)
+    return pd.Series(rng.standard_t(6, nobs) * 0.004, index=pd.bdate_range('2020-01-01', periods=nobs))
+
+
+def test_arima_warm_start_is_mapped_by_name_when_differenced():
+    values = np.cumsum(_returns().to_numpy())
+    parent = _arima_param_names(values, (0, 1, 1))
+    child = _arima_param_names(values, (1, 1, 1))
+    assert 'const' not in child
+
+    padded = _pad_params(np.array([0.3, 1e-5]), parent, child)
+    np.testing.assert_array_equal(padded, [0.0, 0.3, 1e-5])
+
+
+def test_select_arima_order_with_differencing_fits_every_candidate():
+    values = np.cumsum(_returns().to_numpy())
+    best, table = select_arima_order(values, max_p=1, max_q=1, d=1, prune_margin=None, max_workers=1)
+    assert (table['status'] == 'fitted').all()
+    assert best[1] == 1
+
+
+def test_ngarch_warm_start_without_shape_parameter():
+    values = _returns().to_numpy()
+    parent = _ngarch_param_names(values, (1, 0, 1), dist='normal')
+    child = _ngarch_param_names(values, (1, 1, 1), dist='normal')
+    assert 'nu' not in child
+
+    padded = _pad_params(np.array([1e-6, 0.05, 0.9]), parent, child)
+    np.testing.assert_array_equal(padded, [1e-6, 0.05, 0.0, 0.9])
+
+
+def test_select_ngarch_order_normal_fits_every_candidate():
+    best, table = select_ngarch_order(_returns(), max_p=2, max_o=1, max_q=2, dist='normal', prune_margin=None,
+                                      max_workers=1)
+    assert len(table) == 8
+    assert (table['status'] == 'fitted').all(), table[['order', 'status', 'error']]
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from arima_ngarch.store import SeriesStore, list_datasets, open_dataset, save_dataset
+
+
+def _prices(start, periods, offset=0.0):
+    index = pd.bdate_range(start, periods=periods)
+    return pd.Series(100.0 + offset + np.arange(periods, dtype=float), index=index)
+
+
+def test_append_new_dates_adds_a_part(tmp_path):
+    store = SeriesStore(tmp_path)
+    first = _prices('2024-01-01', 10)
+    assert store.append('IDR', first) == 10
+    later = _prices('2024-01-15', 5, offset=50)
+    assert store.append('IDR', later) == 5
+    assert len(store._parts('IDR')) == 2
+    pd.testing.assert_series_equal(store.load('IDR'), pd.concat([first, later]), check_names=False,
+                                   check_freq=False, check_index_type=False)
+
+
+def test_append_overlap_rewrites_with_new_values_winning(tmp_path):
+    store = SeriesStore(tmp_path)
+    store.append('IDR', _prices('2024-01-01', 10))
+    store.append('IDR', _prices('2024-01-15', 5))
+    # Sama persis: tidak ada yang berubah, tidak ada penulisan ulang
+    assert store.append('IDR', _prices('2024-01-01', 10)) == 0
+    assert len(store._parts('IDR')) == 2
+
+    overlap = _prices('2024-01-10', 8, offset=1000)
+    stored_before = store.load('IDR').copy()
+    changed = store.append('IDR', overlap)
+    parts = store._parts('IDR')
+    assert len(parts) == 1
+    loaded = store.load('IDR')
+    assert changed == int((stored_before.reindex(overlap.index) != overlap).sum())
+    np.testing.assert_array_equal(loaded.loc[overlap.index].to_numpy(), overlap.to_numpy())
+    untouched = stored_before.index.difference(overlap.index)
+    np.testing.assert_array_equal(loaded.loc[untouched].to_numpy(), stored_before.loc[untouched].to_numpy())
+    assert loaded.index.is_monotonic_increasing and not loaded.index.has_duplicates
+
+
+def test_compact_merges_parts_past_the_limit(tmp_path):
+    store = SeriesStore(tmp_path, max_parts=3)
+    expected = []
+    for i in range(5):
+        chunk = _prices(pd.Timestamp('2024-01-01') + pd.offsets.BDay(3 * i), 3, offset=10 * i)
+        store.append('SGD', chunk)
+        expected.append(chunk)
+        assert len(store._parts('SGD')) <= 3
+    np.testing.assert_array_equal(store.load('SGD').to_numpy(), pd.concat(expected).to_numpy())
+    store.compact('SGD')
+    assert len(store._parts('SGD')) == 1
+    np.testing.assert_array_equal(store.load('SGD').to_numpy(), pd.concat(expected).to_numpy())
+
+
+def test_datasets_are_separate_per_digest_and_written_once(tmp_path):
+    a = pd.DataFrame({'IDR': _prices('2024-01-01', 10)})
+    b = pd.DataFrame({'IDR': _prices('2024-01-01', 10, offset=1e4)})
+    name_a, created = save_dataset(a, 'a' * 64, label='a.csv', directory=tmp_path)
+    assert created
+    name_b, created = save_dataset(b, 'b' * 64, label='b.csv', directory=tmp_path)
+    assert created and name_a != name_b
+    # Menyimpan file yang sama lagi tidak menulis apa pun
+    assert save_dataset(b, 'a' * 64, directory=tmp_path) == (name_a, False)
+
+    np.testing.assert_array_equal(open_dataset(name_a, tmp_path).load('IDR').to_numpy(), a['IDR'].to_numpy())
+    np.testing.assert_array_equal(open_dataset(name_b, tmp_path).load('IDR').to_numpy(), b['IDR'].to_numpy())
+    datasets = list_datasets(tmp_path)
+    assert set(datasets.index) == {name_a, name_b}
+    assert datasets.at[name_a, 'label'] == 'a.csv' and datasets.at[name_a, 'currencies'] == ['IDR']
+    assert SeriesStore(tmp_path).currencies() == []